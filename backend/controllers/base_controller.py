@@ -8,6 +8,11 @@ class BaseController:
         instance = self.Model(**data)
         return self.db.insert(instance)
 
+    def create_many(self, records: list):
+        """Inserts model instances (or dicts) in one transaction via executemany."""
+        instances = [r if isinstance(r, self.Model) else self.Model(**r) for r in records]
+        return self.db.insert_many(instances)
+
     def update(self, record_id: int, data: dict):
         data['id'] = record_id
         instance = self.Model(**data)
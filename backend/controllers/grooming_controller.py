@@ -1,7 +1,9 @@
 ## File: backend/controllers/grooming_controller.py
-import sqlite3
 import os
 from backend.models.grooming_log import GroomingLog  # Adjust path as needed
+from backend.services.connection_pool import connection_pool
+from backend.services.model_cache import model_cache
+from backend.database_handlers.batch_utils import chunked, placeholders
 from typing import Optional
 
 class GroomingLogsController:
@@ -9,36 +11,69 @@ class GroomingLogsController:
     Controller for managing grooming log database interactions.
     """
 
-    def __init__(self):
-        self.db_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'grooming_logs.db')
+    PRICE_MAP = {
+        'basic': 500.0,
+        'full': 800.0,
+        'premium': 1200.0
+    }
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'grooming_logs.db')
+        # Writes drop cached pet lists that were filtered on this table
+        self.cache_tag = (model_cache.scope(self.db_path), "grooming_logs")
+
+    def _get_connection(self):
+        """Returns the shared pooled connection for grooming_logs.db."""
+        return connection_pool.get(self.db_path)
 
     def add_grooming_log(self, pet_id: int, groom_type: str, groomer_name: str, notes: str = "", price: float = 0.0) -> Optional[int]:
         """
         Inserts a new grooming log into the database. Date is auto-generated. Price is based on grooming type.
         """
-        PRICE_MAP = {
-            'basic': 500.0,
-            'full': 800.0,
-            'premium': 1200.0
-        }
-
-        price = PRICE_MAP.get(groom_type, 0.0)
+        price = self.PRICE_MAP.get(groom_type, 0.0)
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 INSERT INTO grooming_logs (pet_id, groom_type, price, groomer_name, notes)
                 VALUES (?, ?, ?, ?, ?)
             ''', (pet_id, groom_type, price, groomer_name, notes))
             conn.commit()
+            model_cache.invalidate(self.cache_tag)
             return cursor.lastrowid
 
+    def insert_many(self, logs: list[GroomingLog], conn=None, schema: str = "main") -> int:
+        """
+        Inserts many grooming logs with one executemany in a single transaction.
+        Prices follow PRICE_MAP like add_grooming_log; an empty groom_date falls back to now.
+        Pass conn/schema to join a caller's transaction on an attached connection;
+        the caller runs it inside model_cache.deferred_invalidation() so the cache
+        is only invalidated once that transaction commits.
+        """
+        rows = [
+            (log.pet_id, log.groom_date, log.groom_type, self.PRICE_MAP.get(log.groom_type, 0.0),
+             log.groomer_name, log.notes)
+            for log in logs
+        ]
+        if not rows:
+            return 0
+        sql = f'''
+            INSERT INTO {schema}.grooming_logs (pet_id, groom_date, groom_type, price, groomer_name, notes)
+            VALUES (?, COALESCE(NULLIF(?, ''), datetime('now')), ?, ?, ?, ?)
+        '''
+        if conn is not None:
+            conn.executemany(sql, rows)
+        else:
+            with self._get_connection() as conn:
+                conn.executemany(sql, rows)
+        model_cache.invalidate(self.cache_tag)
+        return len(rows)
 
     def get_grooming_logs_for_pet(self, pet_id: int):
         """
         Retrieves all grooming logs for a given pet.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 SELECT id, pet_id, groom_date, groom_type, price, groomer_name, notes
@@ -48,4 +83,22 @@ class GroomingLogsController:
             ''', (pet_id,))
             rows = cursor.fetchall()
 
-        return [GroomingLog(*row) for row in rows]
\ No newline at end of file
+        return [GroomingLog.from_row(*row) for row in rows]
+
+    def get_by_pet_ids(self, pet_ids: list[int]) -> dict[int, list[GroomingLog]]:
+        """
+        Retrieves grooming logs for many pets at once, keyed by pet ID.
+        """
+        logs = {pet_id: [] for pet_id in pet_ids}
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for chunk in chunked(pet_ids):
+                cursor.execute(f'''
+                    SELECT id, pet_id, groom_date, groom_type, price, groomer_name, notes
+                    FROM grooming_logs
+                    WHERE pet_id IN ({placeholders(len(chunk))})
+                    ORDER BY pet_id, groom_date DESC
+                ''', chunk)
+                for row in cursor.fetchall():
+                    logs[row[1]].append(GroomingLog.from_row(*row))
+        return logs
@@ -1,40 +1,51 @@
 import os
 import sqlite3
-import shutil
-import re
-from typing import List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
 from datetime import datetime
 from backend.models.pet import Pet, Owner
+from backend.models.pet_summary import PetSummary
+from backend.services.connection_pool import connection_pool
+from backend.services.model_cache import model_cache
+from backend.services.image_service import THUMBNAIL_SIZES, ensure_thumbnails, thumbnail_relpath
+from backend.services.image_store import ImageStore
+from backend.services.pet_query_service import PetQueryService, pet_and_owner_from_row
+from backend.services.pet_summary_service import PetSummaryService
+from backend.database_handlers.vaccinations_db_handler import VaccinationDB
+from backend.database_handlers.vet_visits_db_handler import VetVisitDB
+from backend.database_handlers.feeding_logs_db_handler import FeedingLogDB
+from backend.controllers.grooming_controller import GroomingLogsController
 
 
 class PetController:
     """Handles all database operations for Pets and Owners following SOLID principles."""
+
+    # Sort keys allowed for keyset pagination. Every key is NOT NULL and is
+    # paired with p.id as a tiebreaker, so (sort value, id) is a unique cursor.
+    PAGE_SORT_KEYS = {
+        "id": "p.id",
+        "name": "p.name",
+    }
     
     def __init__(self, db_path: str = None):
         
         self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        self.data_dir = os.path.join(self.base_dir, 'data')
+        self.db_path = db_path or os.path.join(self.base_dir, 'data', 'pets.db')
+        # Images and the record databases live next to pets.db
+        self.data_dir = os.path.dirname(os.path.abspath(self.db_path))
         self.images_dir = os.path.join(self.data_dir, 'images')
-        self.db_path = db_path or os.path.join(self.data_dir, 'pets.db')
+        self.cache_scope = model_cache.scope(self.db_path)
+        self.image_store = ImageStore(self.data_dir, self.db_path)
         
         self._initialize_directories()
-        self._enable_foreign_keys()
 
     def _initialize_directories(self) -> None:
         """Ensures required directories exist."""
         os.makedirs(self.images_dir, exist_ok=True)
         os.makedirs(self.data_dir, exist_ok=True)
 
-    def _enable_foreign_keys(self) -> None:
-        """Activates SQLite foreign key constraints."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("PRAGMA foreign_keys = ON")
-
     def _get_connection(self) -> sqlite3.Connection:
-        """Returns a database connection with foreign keys enabled."""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA foreign_keys = ON")
-        return conn
+        """Returns the shared pooled connection with foreign keys enabled."""
+        return connection_pool.get(self.db_path, foreign_keys=True)
 
     def add_pet_with_owner(self, pet: Pet, owner: Owner, image_path: Optional[str] = None) -> int:
         """
@@ -52,25 +63,150 @@ class PetController:
             sqlite3.Error: If database operation fails
             IOError: If image file cannot be processed
         """
+        conn = self._get_connection()
         try:
-            with self._get_connection() as conn:
+            # Encoding happens before the transaction so it does not hold the write lock
+            staged_path = self.image_store.stage(image_path) if image_path else None
+            # Cached pets are dropped once the commit is done, not mid-transaction
+            with model_cache.deferred_invalidation(), conn:
                 cursor = conn.cursor()
                 
                 # Transaction starts
                 owner_id = self._upsert_owner(cursor, owner)
                 pet_id = self._insert_pet(cursor, pet, owner_id)
                 
-                if image_path:
-                    stored_image_path = self._process_image(pet, pet_id, image_path)
-                    self._update_pet_image(cursor, pet_id, stored_image_path)
+                stored_image_path = None
+                if staged_path:
+                    stored_image_path, thumbnails = self._plan_image(staged_path)
+                    self._update_pet_image(cursor, pet_id, stored_image_path, thumbnails)
                 
                 conn.commit()
-                return pet_id
                 
         except (sqlite3.Error, IOError) as e:
             conn.rollback()
             raise RuntimeError(f"Failed to add pet: {str(e)}") from e
 
+        if stored_image_path:
+            self._store_image(staged_path, stored_image_path)
+        return pet_id
+
+    def add_pet_with_records(self, pet: Pet, owner: Owner, image_path: Optional[str] = None,
+                             vet_visits: list = (), vaccinations: list = (), feeding_logs: list = (),
+                             grooming_logs: list = (), atomic: bool = True) -> int:
+        """
+        Adds a pet, its owner and all queued records with one executemany per table.
+
+        Args:
+            pet, owner, image_path: As in add_pet_with_owner
+            vet_visits, vaccinations, feeding_logs, grooming_logs: Record models; their
+                pet_id is filled in once the pet row exists
+            atomic: When True, every write goes through one connection with the record
+                databases ATTACHed, so a failure anywhere rolls back all five files.
+                When False, the pet and each record table commit in their own
+                transaction (one commit per database).
+
+        Returns:
+            ID of the newly created pet
+
+        Note:
+            The attached connection cannot enforce foreign keys (the record tables
+            reference a pets table in another file); the owner and pet ids are taken
+            from the rows inserted here. In WAL mode SQLite guarantees the rollback
+            across files, but after a power loss each file recovers on its own.
+        """
+        if not atomic:
+            pet_id = self.add_pet_with_owner(pet, owner, image_path)
+            self._assign_pet_id(pet_id, vet_visits, vaccinations, feeding_logs, grooming_logs)
+            vet_db, vacc_db, feeding_db, grooming_db = self._record_handlers()
+            vet_db.insert_many(vet_visits)
+            vacc_db.insert_many(vaccinations)
+            feeding_db.insert_many(feeding_logs)
+            grooming_db.insert_many(grooming_logs)
+            return pet_id
+
+        conn = self._query_service().get_connection()
+        stored_image_path = None
+        try:
+            staged_path = self.image_store.stage(image_path) if image_path else None
+            with model_cache.deferred_invalidation(), conn:
+                cursor = conn.cursor()
+                owner_id = self._upsert_owner(cursor, owner)
+                pet_id = self._insert_pet(cursor, pet, owner_id)
+
+                if staged_path:
+                    stored_image_path, thumbnails = self._plan_image(staged_path)
+                    self._update_pet_image(cursor, pet_id, stored_image_path, thumbnails)
+
+                self._assign_pet_id(pet_id, vet_visits, vaccinations, feeding_logs, grooming_logs)
+                vet_db, vacc_db, feeding_db, grooming_db = self._record_handlers()
+                vet_db.insert_many(vet_visits, conn=conn, schema="vet_visits")
+                vacc_db.insert_many(vaccinations, conn=conn, schema="vaccinations")
+                feeding_db.insert_many(feeding_logs, conn=conn, schema="feeding_logs")
+                grooming_db.insert_many(grooming_logs, conn=conn, schema="grooming_logs")
+
+        except (sqlite3.Error, IOError) as e:
+            raise RuntimeError(f"Failed to add pet: {str(e)}") from e
+
+        if stored_image_path:
+            self._store_image(staged_path, stored_image_path)
+        return pet_id
+
+    def attach_images(self, staged_images: Dict[int, str]) -> int:
+        """
+        Sets the photo of several existing pets in one transaction, e.g. for a bulk
+        ingest. Files go through the same staged path as add_pet_with_owner, and
+        photos they replace are released once no pet uses them.
+
+        Args:
+            staged_images: {pet_id: staged image path} (see ImageStore.stage)
+
+        Returns:
+            Number of pets updated
+        """
+        if not staged_images:
+            return 0
+        planned = {pet_id: self._plan_image(path) for pet_id, path in staged_images.items()}
+        conn = self._get_connection()
+        try:
+            with model_cache.deferred_invalidation(), conn:
+                cursor = conn.cursor()
+                placeholders = ",".join("?" * len(planned))
+                replaced = {row[0] for row in cursor.execute(
+                    f"SELECT image_path FROM pets WHERE id IN ({placeholders}) AND image_path IS NOT NULL",
+                    list(planned)
+                )}
+                updated = []
+                for pet_id, (image_path, thumbnails) in planned.items():
+                    self._update_pet_image(cursor, pet_id, image_path, thumbnails)
+                    if cursor.rowcount:
+                        updated.append(pet_id)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to attach images: {str(e)}") from e
+
+        # Files staged for unknown pet ids are left to cleanup_staging
+        for pet_id in updated:
+            self._store_image(staged_images[pet_id], planned[pet_id][0])
+        for image_path in replaced - {image_path for image_path, _ in planned.values()}:
+            self.image_store.release(image_path, conn)
+        return len(updated)
+
+    def _record_handlers(self) -> tuple:
+        """Record handlers for the databases that sit next to this pets.db."""
+        data_dir = os.path.dirname(self.db_path)
+        return (
+            VetVisitDB(os.path.join(data_dir, 'vet_visits.db')),
+            VaccinationDB(os.path.join(data_dir, 'vaccinations.db')),
+            FeedingLogDB(os.path.join(data_dir, 'feeding_logs.db')),
+            GroomingLogsController(os.path.join(data_dir, 'grooming_logs.db')),
+        )
+
+    @staticmethod
+    def _assign_pet_id(pet_id: int, *record_lists) -> None:
+        """Points every queued record at the newly inserted pet."""
+        for records in record_lists:
+            for record in records:
+                record.pet_id = pet_id
+
     def _upsert_owner(self, cursor: sqlite3.Cursor, owner: Owner) -> int:
         """Inserts or updates owner, returns owner ID."""
         cursor.execute('''
@@ -82,7 +218,10 @@ class PetController:
         ''', (owner.name, owner.contact_number, owner.address))
         
         result = cursor.fetchone()
-        return result[0] if result else None
+        owner_id = result[0] if result else None
+        # The address may have changed on an existing owner
+        model_cache.invalidate((self.cache_scope, "owner", owner_id), (self.cache_scope, "owners"))
+        return owner_id
 
     def _insert_pet(self, cursor: sqlite3.Cursor, pet: Pet, owner_id: int) -> int:
         """Inserts pet record and returns new pet ID."""
@@ -92,23 +231,42 @@ class PetController:
             RETURNING id
         ''', (pet.name, pet.breed, pet.birthdate, owner_id))
         
-        return cursor.fetchone()[0]
-
-    def _process_image(self, pet: Pet, pet_id: int, src_path: str) -> str:
-        """Stores pet image and returns relative path."""
-        ext = os.path.splitext(src_path)[1].lower()
-        safe_name = re.sub(r'[^a-z0-9]', '_', pet.name.lower())
-        filename = f"{safe_name}_{pet_id}{ext}"
-        dest_path = os.path.join(self.images_dir, filename)
-        
-        shutil.copy2(src_path, dest_path)
-        return os.path.relpath(dest_path, start=self.data_dir)
+        pet_id = cursor.fetchone()[0]
+        model_cache.invalidate((self.cache_scope, "pets"))
+        return pet_id
 
-    def _update_pet_image(self, cursor: sqlite3.Cursor, pet_id: int, image_path: str) -> None:
-        """Updates pet record with image path."""
+    def _plan_image(self, staged_path: str) -> Tuple[str, dict]:
+        """
+        Works out where a staged pet image will live in the content-addressed store
+        without writing any file, so the paths can be saved inside the pet's transaction.
+
+        Returns:
+            Tuple of (relative blob path, {size name: relative thumbnail path})
+        """
+        image_path = self.image_store.plan(staged_path)
+        return image_path, {name: thumbnail_relpath(image_path, name) for name in THUMBNAIL_SIZES}
+
+    def _store_image(self, staged_path: str, image_path: str) -> None:
+        """
+        Moves a staged image into the store once the row pointing at it is committed,
+        and writes its thumbnails. The file is renamed into place (no copy); a photo
+        already stored for another pet is reused. Should this fail, the pet keeps its
+        row and views show the placeholder; the staged file is swept by cleanup_staging.
+        """
+        try:
+            self.image_store.put(staged_path, image_path)
+            ensure_thumbnails(image_path, self.data_dir)
+        except OSError as e:
+            print(f"⚠️ Could not store image {staged_path}: {e}")
+
+    def _update_pet_image(self, cursor: sqlite3.Cursor, pet_id: int, image_path: str,
+                          thumbnails: Optional[dict] = None) -> None:
+        """Updates pet record with image path and thumbnail paths."""
+        thumbnails = thumbnails or {}
         cursor.execute('''
-            UPDATE pets SET image_path = ? WHERE id = ?
-        ''', (image_path, pet_id))
+            UPDATE pets SET image_path = ?, thumb_card_path = ?, thumb_profile_path = ? WHERE id = ?
+        ''', (image_path, thumbnails.get("card"), thumbnails.get("profile"), pet_id))
+        model_cache.invalidate((self.cache_scope, "pet", pet_id), (self.cache_scope, "pets"))
 
     def get_pet_by_id(self, pet_id: int) -> Tuple[Optional[Pet], Optional[Owner]]:
         """
@@ -120,12 +278,22 @@ class PetController:
         Returns:
             Tuple of (Pet, Owner) if found, (None, None) otherwise
         """
+        result = model_cache.get_or_load(
+            ("pet", self.cache_scope, pet_id), lambda: self._load_pet_by_id(pet_id),
+            tags=lambda loaded: self._pet_tags(loaded[0]))
+        if result is None:
+            return None, None
+        pet, owner = result
+        return pet.copy(), owner.copy() if owner else None
+
+    def _load_pet_by_id(self, pet_id: int) -> Optional[Tuple[Pet, Optional[Owner]]]:
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             cursor.execute('''
                 SELECT p.id AS pet_id, p.name AS pet_name, p.breed, p.birthdate, p.image_path,
+                    p.thumb_card_path, p.thumb_profile_path,
                     o.id AS owner_id, o.name AS owner_name, o.contact_number, o.address
                 FROM pets p
                 LEFT JOIN owner o ON p.owner_id = o.id
@@ -133,27 +301,7 @@ class PetController:
             ''', (pet_id,))
             
             row = cursor.fetchone()
-            
-            if not row:
-                return None, None
-                
-            pet = Pet(
-                id=row['pet_id'],
-                name=row['pet_name'],
-                breed=row['breed'],
-                birthdate=row['birthdate'],
-                image_path=row['image_path'],
-                owner_id=row['owner_id']
-            )
-            
-            owner = Owner(
-                id=row['owner_id'],
-                name=row['owner_name'],
-                contact_number=row['contact_number'],
-                address=row['address']
-            ) if row['owner_id'] else None
-            
-            return pet, owner
+            return pet_and_owner_from_row(row) if row else None
 
     def get_pets_with_owners(self) -> Tuple[List[Pet], List[Optional[Owner]]]:
         """
@@ -162,12 +310,16 @@ class PetController:
         Returns:
             Tuple of (list of Pets, list of corresponding Owners)
         """
+        return self._cached_list("pets_with_owners", self._load_pets_with_owners)
+
+    def _load_pets_with_owners(self) -> Tuple[List[Pet], List[Optional[Owner]]]:
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             cursor.execute('''
                 SELECT p.id AS pet_id, p.name AS pet_name, p.breed, p.birthdate, p.image_path,
+                    p.thumb_card_path, p.thumb_profile_path,
                     o.id AS owner_id, o.name AS owner_name, o.contact_number, o.address
                 FROM pets p
                 LEFT JOIN owner o ON p.owner_id = o.id
@@ -175,34 +327,99 @@ class PetController:
             
             pets = []
             owners = []
-            
             for row in cursor.fetchall():
-                pet = Pet(
-                    id=row['pet_id'],
-                    name=row['pet_name'],  # Changed to pet_name
-                    breed=row['breed'],
-                    birthdate=row['birthdate'],
-                    image_path=row['image_path'],
-                    owner_id=row['owner_id']
-                )
-                
-                owner = Owner(
-                    id=row['owner_id'],
-                    name=row['owner_name'],  # Changed to owner_name
-                    contact_number=row['contact_number'],
-                    address=row['address']
-                ) if row['owner_id'] else None
-                
+                pet, owner = pet_and_owner_from_row(row)
                 pets.append(pet)
                 owners.append(owner)
             
             return pets, owners
 
+    def get_pets_page(self, page_size: int = 50, after: Optional[tuple] = None,
+                      order_by: str = "id") -> Tuple[List[Pet], List[Optional[Owner]], Optional[tuple]]:
+        """
+        Retrieves one page of pets with owners using keyset (seek) pagination.
+
+        Args:
+            page_size: Maximum number of pets in the page
+            after: Cursor returned with the previous page, or None for the first page
+            order_by: One of PAGE_SORT_KEYS
+
+        Returns:
+            Tuple of (Pets, corresponding Owners, cursor for the next page or None
+            when this was the last page)
+        """
+        if order_by not in self.PAGE_SORT_KEYS:
+            raise ValueError(f"Unsupported sort key: {order_by}")
+        sort_column = self.PAGE_SORT_KEYS[order_by]
+
+        where, params = "", []
+        if after is not None:
+            # Row-value comparison seeks straight to the cursor via the index
+            where = f"WHERE ({sort_column}, p.id) > (?, ?)"
+            params = list(after)
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(f'''
+                SELECT p.id AS pet_id, p.name AS pet_name, p.breed, p.birthdate, p.image_path,
+                    p.thumb_card_path, p.thumb_profile_path,
+                    o.id AS owner_id, o.name AS owner_name, o.contact_number, o.address,
+                    {sort_column} AS sort_value
+                FROM pets p
+                LEFT JOIN owner o ON p.owner_id = o.id
+                {where}
+                ORDER BY {sort_column}, p.id
+                LIMIT ?
+            ''', params + [page_size])
+            rows = cursor.fetchall()
+
+        pets, owners = [], []
+        for row in rows:
+            pet, owner = pet_and_owner_from_row(row)
+            pets.append(pet)
+            owners.append(owner)
+
+        next_cursor = (rows[-1]['sort_value'], rows[-1]['pet_id']) if len(rows) == page_size else None
+        return pets, owners, next_cursor
+
+    def iter_pet_pages(self, page_size: int = 200,
+                       order_by: str = "id") -> Iterator[Tuple[List[Pet], List[Optional[Owner]]]]:
+        """
+        Lazily walks every pet page by page, so callers never hold the whole table.
+
+        Yields:
+            Tuple of (Pets, corresponding Owners) for each page
+        """
+        after = None
+        while True:
+            pets, owners, after = self.get_pets_page(page_size, after, order_by)
+            if pets:
+                yield pets, owners
+            if after is None:
+                return
+
+    def count_pets(self) -> int:
+        """Returns the number of pets, e.g. to size a virtualized list before any page is read."""
+        return model_cache.get_or_load(
+            ("count_pets", self.cache_scope), self._load_pet_count,
+            tags=[(self.cache_scope, "pets")])
+
+    def _load_pet_count(self) -> int:
+        with self._get_connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM pets").fetchone()[0]
+
     def get_owner_by_id(self, owner_id: int) -> Optional[Owner]:
         """Retrieves a single owner by ID."""
+        owner = model_cache.get_or_load(
+            ("owner", self.cache_scope, owner_id), lambda: self._load_owner_by_id(owner_id),
+            tags=[(self.cache_scope, "owner", owner_id)])
+        return owner.copy() if owner else None
+
+    def _load_owner_by_id(self, owner_id: int) -> Optional[Owner]:
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             cursor.execute('''
                 SELECT id, name, contact_number, address 
@@ -211,88 +428,88 @@ class PetController:
             ''', (owner_id,))
             
             row = cursor.fetchone()
-            return Owner(**dict(row)) if row else None
+            return Owner.from_row(*row) if row else None
 
     def get_all_owners(self) -> List[Owner]:
         """Retrieves all owners from the database."""
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             cursor.execute('''
                 SELECT id, name, contact_number, address 
                 FROM owner
             ''')
             
-            return [Owner(**dict(row)) for row in cursor.fetchall()]
+            return [Owner.from_row(*row) for row in cursor.fetchall()]
+
+    def _query_service(self) -> PetQueryService:
+        """Cross-database query service over the data directory holding this pets.db."""
+        return PetQueryService(data_dir=os.path.dirname(self.db_path))
+
+    def _pet_tags(self, pet: Pet) -> list:
+        """Cache tags for an entry built from one pet row and its owner."""
+        return [(self.cache_scope, "pet", pet.id), (self.cache_scope, "owner", pet.owner_id)]
 
-    def get_pets_with_vacc_and_vet_records(self):
+    def _cached_list(self, name: str, loader, record_tables: tuple = ()) -> Tuple[List[Pet], List[Optional[Owner]]]:
+        """
+        Read-through cache for (pets, owners) list results. The entry is dropped by
+        any pet or owner write and by writes to the record tables it was filtered on.
+        Callers get fresh lists of copied models, so sorting, filtering or editing
+        them leaves the cache intact.
+        """
+        tags = [(self.cache_scope, "pets"), (self.cache_scope, "owners")]
+        tags += [(self.cache_scope, table) for table in record_tables]
+        pets, owners = model_cache.get_or_load((name, self.cache_scope), loader, tags)
+        return [pet.copy() for pet in pets], [owner.copy() if owner else None for owner in owners]
+
+    def get_pets_with_vacc_and_vet_records(self) -> List[Pet]:
         """
         Returns pets that have at least one vaccination AND at least one vet visit record.
         """
-        with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT DISTINCT p.*
-                FROM pets p
-                INNER JOIN vaccinations vax ON p.id = vax.pet_id
-                INNER JOIN vet_visits vv ON p.id = vv.pet_id
-            """)
-            pets = [self._row_to_pet(row) for row in cursor.fetchall()]
-            return pets
-
-    def _row_to_pet(self, row: sqlite3.Row) -> Pet:
-        """Converts a database row to a Pet object."""
-        return Pet(
-            id=row['id'],
-            name=row['name'],
-            breed=row['breed'],
-            birthdate=row['birthdate'],
-            owner_id=row['owner_id'],
-            image_path=row.get('image_path')  # image_path may not always be present
-        )
+        pets, _ = self._cached_list(
+            "pets_with_vacc_and_vet", self._query_service().get_pets_with_vacc_and_vet_records,
+            ("vaccinations", "vet_visits"))
+        return pets
 
-    def get_pets_with_vacc_or_vet_records(self):
+    def get_pets_with_vacc_or_vet_records(self) -> Tuple[List[Pet], List[Optional[Owner]]]:
         """
         Returns pets (with owners) that have at least one vaccination OR at least one vet visit record.
-        Works even if vaccinations and vet_visits are in separate DB files.
+        Runs as a single query with the vaccination and vet visit databases ATTACHed.
         """
-        from backend.controllers.vaccination_controller import VaccinationController
-        from backend.controllers.vet_visit_controller import VetVisitController
-
-        pets, owners = self.get_pets_with_owners()
-        pets_with_records = []
-        owners_with_records = []
-
-        vax_ctrl = VaccinationController()
-        visit_ctrl = VetVisitController()
+        return self._cached_list(
+            "pets_with_vacc_or_vet", self._query_service().get_pets_with_vacc_or_vet_records,
+            ("vaccinations", "vet_visits"))
 
-        for pet, owner in zip(pets, owners):
-            has_vax = vax_ctrl.get_by_pet_id(pet.id)
-            has_visit = visit_ctrl.get_by_pet_id(pet.id)
-            if has_vax or has_visit:
-                pets_with_records.append(pet)
-                owners_with_records.append(owner)
-
-        return pets_with_records, owners_with_records
-
-    def get_pets_with_feeding_logs(self):
+    def get_pets_with_feeding_logs(self) -> Tuple[List[Pet], List[Optional[Owner]]]:
         """
         Returns pets (with owners) that have at least one feeding log.
         """
-        from backend.controllers.feeding_log_controller import FeedingLogController
-
-        pets, owners = self.get_pets_with_owners()
-        pets_with_logs = []
-        owners_with_logs = []
+        return self._cached_list(
+            "pets_with_feeding_logs", self._query_service().get_pets_with_feeding_logs,
+            ("feeding_logs",))
 
-        feeding_ctrl = FeedingLogController()
+    def get_pets_with_grooming_logs(self) -> Tuple[List[Pet], List[Optional[Owner]]]:
+        """
+        Returns pets (with owners) that have at least one grooming log.
+        """
+        return self._cached_list(
+            "pets_with_grooming_logs", self._query_service().get_pets_with_grooming_logs,
+            ("grooming_logs",))
 
-        for pet, owner in zip(pets, owners):
-            logs = feeding_ctrl.get_by_pet_id(pet.id)
-            if logs:
-                pets_with_logs.append(pet)
-                owners_with_logs.append(owner)
+    def get_pet_summaries(self, pet_ids: Optional[Iterable[int]] = None) -> dict:
+        """
+        Returns {pet_id: PetSummary} with record counts, last-event dates and totals,
+        using one aggregated query per record table instead of loading the records.
+        """
+        return PetSummaryService(data_dir=os.path.dirname(self.db_path)).get_summaries(pet_ids)
 
-        return pets_with_logs, owners_with_logs
\ No newline at end of file
+    def get_record_totals(self) -> PetSummary:
+        """
+        Returns record counts and spending across all pets (cached until a record write).
+        """
+        return model_cache.get_or_load(
+            ("record_totals", self.cache_scope),
+            PetSummaryService(data_dir=os.path.dirname(self.db_path)).get_totals,
+            tags=[(self.cache_scope, table)
+                  for table in ("vaccinations", "vet_visits", "feeding_logs", "grooming_logs")]).copy()
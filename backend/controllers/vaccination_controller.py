@@ -13,4 +13,11 @@ class VaccinationController(BaseController):
             return self.db_handler.get_by_pet_id(pet_id)
         except Exception as e:
             print(f"Error fetching vaccinations: {e}")
-            return []
\ No newline at end of file
+            return []
+
+    def get_by_pet_ids(self, pet_ids: list[int]) -> dict[int, list[Vaccination]]:
+        try:
+            return self.db_handler.get_by_pet_ids(pet_ids)
+        except Exception as e:
+            print(f"Error fetching vaccinations: {e}")
+            return {}
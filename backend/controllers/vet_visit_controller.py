@@ -13,4 +13,11 @@ class VetVisitController(BaseController):
             return self.db_handler.get_by_pet_id(pet_id)
         except Exception as e:
             print(f"Error fetching vet visits: {e}")
-            return []
\ No newline at end of file
+            return []
+
+    def get_by_pet_ids(self, pet_ids: list[int]) -> dict[int, list[VetVisit]]:
+        try:
+            return self.db_handler.get_by_pet_ids(pet_ids)
+        except Exception as e:
+            print(f"Error fetching vet visits: {e}")
+            return {}
@@ -0,0 +1,48 @@
+# File: backend/data/migrations.py
+import sqlite3
+from typing import List, Tuple
+
+Migration = Tuple[int, List[str]]
+
+
+class MigrationRunner:
+    """
+    Applies numbered schema migrations to a single database file.
+
+    The schema version is stored in PRAGMA user_version. Every migration whose
+    version is higher than the stored one runs inside its own transaction
+    together with the version bump, so a failed step leaves the file at the
+    last good version and the runner can simply be started again.
+    """
+
+    def __init__(self, db_path: str, migrations: List[Migration]):
+        self.db_path = db_path
+        self.migrations = sorted(migrations, key=lambda migration: migration[0])
+
+    @staticmethod
+    def current_version(conn: sqlite3.Connection) -> int:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def pending(self, conn: sqlite3.Connection) -> List[Migration]:
+        version = self.current_version(conn)
+        return [migration for migration in self.migrations if migration[0] > version]
+
+    def apply(self) -> int:
+        """Runs all pending migrations and returns how many were applied."""
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        try:
+            applied = 0
+            for version, statements in self.pending(conn):
+                conn.execute("BEGIN")
+                try:
+                    for statement in statements:
+                        conn.execute(statement)
+                    conn.execute(f"PRAGMA user_version = {int(version)}")
+                    conn.execute("COMMIT")
+                except sqlite3.Error:
+                    conn.execute("ROLLBACK")
+                    raise
+                applied += 1
+            return applied
+        finally:
+            conn.close()
@@ -1,12 +1,35 @@
 # File: backend/data/pets_db.py
 import sqlite3
 import os
+from backend.data.migrations import MigrationRunner
+from backend.services.storage_profile import apply_storage_profile
 
 class PetDatabaseInitializer:
     """
     Handles initialization of the pets.db database and creation of the tables.
     """
 
+    # owner(name, contact_number) is already indexed by its UNIQUE constraint
+    # (sqlite_autoindex_owner_1), so only the pets -> owner foreign key needs one.
+    MIGRATIONS = [
+        (1, [
+            "CREATE INDEX IF NOT EXISTS idx_pets_owner_id ON pets(owner_id)",
+        ]),
+        # Keyset pagination by name seeks on (name, id); id is the rowid, so it is implicit.
+        (2, [
+            "CREATE INDEX IF NOT EXISTS idx_pets_name ON pets(name)",
+        ]),
+        # Pre-generated image derivatives, one column per THUMBNAIL_SIZES entry
+        (3, [
+            "ALTER TABLE pets ADD COLUMN thumb_card_path TEXT",
+            "ALTER TABLE pets ADD COLUMN thumb_profile_path TEXT",
+        ]),
+        # Blob reference counts are COUNT(*) WHERE image_path = ?
+        (4, [
+            "CREATE INDEX IF NOT EXISTS idx_pets_image_path ON pets(image_path)",
+        ]),
+    ]
+
     def __init__(self):
         self.base_dir = os.path.dirname(os.path.abspath(__file__))
         self.data_dir = os.path.join(self.base_dir, '..', 'data')
@@ -17,6 +40,8 @@ class PetDatabaseInitializer:
         os.makedirs(self.data_dir, exist_ok=True)
 
         with sqlite3.connect(self.db_path) as conn:
+            # WAL is persistent, so setting it here covers every later connection
+            apply_storage_profile(conn)
             cursor = conn.cursor()
             
             # Create owner table first (since pets references it)
@@ -45,6 +70,9 @@ class PetDatabaseInitializer:
 
             conn.commit()
 
+        # Indexes and later schema changes are versioned via PRAGMA user_version
+        MigrationRunner(self.db_path, self.MIGRATIONS).apply()
+
 # Optional standalone run
 if __name__ == "__main__":
     PetDatabaseInitializer().initialize()
\ No newline at end of file
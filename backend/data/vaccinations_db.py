@@ -1,12 +1,21 @@
 # File: backend/data/vaccinations_db.py
 import sqlite3
 import os
+from backend.data.migrations import MigrationRunner
+from backend.services.storage_profile import apply_storage_profile
 
 class VaccinationsDatabaseInitializer:
     """
     Handles initialization of the vaccinations.db database and creation of the vaccinations table.
     """
 
+    MIGRATIONS = [
+        (1, [
+            "CREATE INDEX IF NOT EXISTS idx_vaccinations_pet_administered ON vaccinations(pet_id, date_administered)",
+            "CREATE INDEX IF NOT EXISTS idx_vaccinations_pet_next_due ON vaccinations(pet_id, next_due)",
+        ]),
+    ]
+
     def __init__(self):
         self.base_dir = os.path.dirname(os.path.abspath(__file__))
         self.data_dir = os.path.join(self.base_dir, '..', 'data')
@@ -17,6 +26,8 @@ class VaccinationsDatabaseInitializer:
         os.makedirs(self.data_dir, exist_ok=True)
 
         with sqlite3.connect(self.db_path) as conn:
+            # WAL is persistent, so setting it here covers every later connection
+            apply_storage_profile(conn)
             cursor = conn.cursor()
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS vaccinations (
@@ -33,6 +44,9 @@ class VaccinationsDatabaseInitializer:
 
             conn.commit()
 
+        # Indexes and later schema changes are versioned via PRAGMA user_version
+        MigrationRunner(self.db_path, self.MIGRATIONS).apply()
+
 # Optional standalone run
 if __name__ == "__main__":
     VaccinationsDatabaseInitializer().initialize()
\ No newline at end of file
@@ -1,12 +1,20 @@
 # File: backend/data/vet_visits_db.py
 import sqlite3
 import os
+from backend.data.migrations import MigrationRunner
+from backend.services.storage_profile import apply_storage_profile
 
 class VetVisitsDatabaseInitializer:
     """
     Handles initialization of the vet_visits.db database and creation of the vet_visits table.
     """
 
+    MIGRATIONS = [
+        (1, [
+            "CREATE INDEX IF NOT EXISTS idx_vet_visits_pet_visit_date ON vet_visits(pet_id, visit_date)",
+        ]),
+    ]
+
     def __init__(self):
         self.base_dir = os.path.dirname(os.path.abspath(__file__))
         self.data_dir = os.path.join(self.base_dir, '..', 'data')
@@ -17,6 +25,8 @@ class VetVisitsDatabaseInitializer:
         os.makedirs(self.data_dir, exist_ok=True)
 
         with sqlite3.connect(self.db_path) as conn:
+            # WAL is persistent, so setting it here covers every later connection
+            apply_storage_profile(conn)
             cursor = conn.cursor()
             cursor.execute('''
                     CREATE TABLE IF NOT EXISTS vet_visits (
@@ -32,6 +42,9 @@ class VetVisitsDatabaseInitializer:
 
             conn.commit()
 
+        # Indexes and later schema changes are versioned via PRAGMA user_version
+        MigrationRunner(self.db_path, self.MIGRATIONS).apply()
+
 # Optional standalone run
 if __name__ == "__main__":
     VetVisitsDatabaseInitializer().initialize()
\ No newline at end of file
@@ -0,0 +1,17 @@
+# File: backend/database_handlers/batch_utils.py
+from typing import Iterable, Iterator, List
+
+# Stays well below SQLite's host-parameter limit on older builds (999).
+MAX_IDS_PER_QUERY = 500
+
+
+def chunked(ids: Iterable[int], size: int = MAX_IDS_PER_QUERY) -> Iterator[List[int]]:
+    """Yields de-duplicated ids in lists small enough for one IN (...) clause."""
+    unique_ids = list(dict.fromkeys(ids))
+    for start in range(0, len(unique_ids), size):
+        yield unique_ids[start:start + size]
+
+
+def placeholders(count: int) -> str:
+    """Returns '?, ?, ...' with count parameters for an IN clause."""
+    return ", ".join("?" * count)
@@ -1,15 +1,19 @@
 # File: backend/database/feeding_logs_db_handler.py
-import sqlite3
 import os
 from backend.models.feeding_log import FeedingLog
+from backend.services.connection_pool import connection_pool
+from backend.services.model_cache import model_cache
+from backend.database_handlers.batch_utils import chunked, placeholders
 
 class FeedingLogDB:
-    def __init__(self):
+    def __init__(self, db_path: str = None):
         base_dir = os.path.dirname(os.path.abspath(__file__))
-        self.db_path = os.path.join(base_dir, '..', 'data', 'feeding_logs.db')
+        self.db_path = db_path or os.path.join(base_dir, '..', 'data', 'feeding_logs.db')
+        # Writes drop cached pet lists that were filtered on this table
+        self.cache_tag = (model_cache.scope(self.db_path), "feeding_logs")
 
     def connect(self):
-        return sqlite3.connect(self.db_path)
+        return connection_pool.get(self.db_path)
 
     def insert(self, log: FeedingLog):
         with self.connect() as conn:
@@ -28,8 +32,43 @@ class FeedingLogDB:
                 log.notes
             ))
             conn.commit()
+            model_cache.invalidate(self.cache_tag)
             return cursor.lastrowid
 
+    def insert_many(self, logs: list[FeedingLog], conn=None, schema: str = "main") -> int:
+        """
+        Insert many feeding logs with one executemany in a single transaction.
+        Pass conn/schema to join a caller's transaction on an attached connection;
+        the caller runs it inside model_cache.deferred_invalidation() so the cache
+        is only invalidated once that transaction commits.
+        """
+        rows = [
+            (
+                log.pet_id,
+                log.start_date,
+                log.num_days,
+                int(log.feed_once),
+                int(log.feed_twice),
+                int(log.feed_thrice),
+                log.notes
+            )
+            for log in logs
+        ]
+        if not rows:
+            return 0
+        sql = f"""
+            INSERT INTO {schema}.daycare_enrollments
+            (pet_id, start_date, num_days, feed_once, feed_twice, feed_thrice, notes)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """
+        if conn is not None:
+            conn.executemany(sql, rows)
+        else:
+            with self.connect() as conn:
+                conn.executemany(sql, rows)
+        model_cache.invalidate(self.cache_tag)
+        return len(rows)
+
     def update(self, record_id: int, log: FeedingLog):
         with self.connect() as conn:
             cursor = conn.cursor()
@@ -49,6 +88,7 @@ class FeedingLogDB:
                 record_id
             ))
             conn.commit()
+            model_cache.invalidate(self.cache_tag)
 
     def get_by_pet_id(self, pet_id: int) -> list[FeedingLog]:
         with self.connect() as conn:
@@ -58,13 +98,29 @@ class FeedingLogDB:
                 FROM daycare_enrollments
                 WHERE pet_id = ?
             """, (pet_id,))
-            return [FeedingLog(*row) for row in cursor.fetchall()]
+            return [FeedingLog.from_row(*row) for row in cursor.fetchall()]
+
+    def get_by_pet_ids(self, pet_ids: list[int]) -> dict[int, list[FeedingLog]]:
+        records = {pet_id: [] for pet_id in pet_ids}
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            for chunk in chunked(pet_ids):
+                cursor.execute(f"""
+                    SELECT pet_id, start_date, num_days, feed_once, feed_twice, feed_thrice, notes
+                    FROM daycare_enrollments
+                    WHERE pet_id IN ({placeholders(len(chunk))})
+                    ORDER BY pet_id, id
+                """, chunk)
+                for row in cursor.fetchall():
+                    records[row[0]].append(FeedingLog.from_row(*row))
+        return records
 
     def delete(self, record_id: int):
         with self.connect() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM daycare_enrollments WHERE id = ?", (record_id,))
             conn.commit()
+            model_cache.invalidate(self.cache_tag)
 
     def fetch_by_id(self, record_id: int):
         with self.connect() as conn:
@@ -75,4 +131,4 @@ class FeedingLogDB:
                 WHERE id = ?
             """, (record_id,))
             row = cursor.fetchone()
-            return FeedingLog(*row) if row else None
\ No newline at end of file
+            return FeedingLog.from_row(*row) if row else None
\ No newline at end of file
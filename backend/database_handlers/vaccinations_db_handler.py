@@ -1,15 +1,19 @@
 # File: backend/database/vaccinations_db_handler.py
-import sqlite3
 import os
 from backend.models.vaccination import Vaccination
+from backend.services.connection_pool import connection_pool
+from backend.services.model_cache import model_cache
+from backend.database_handlers.batch_utils import chunked, placeholders
 
 class VaccinationDB:
-    def __init__(self):
+    def __init__(self, db_path: str = None):
         base_dir = os.path.dirname(os.path.abspath(__file__))
-        self.db_path = os.path.join(base_dir, '..', 'data', 'vaccinations.db')
+        self.db_path = db_path or os.path.join(base_dir, '..', 'data', 'vaccinations.db')
+        # Writes drop cached pet lists that were filtered on this table
+        self.cache_tag = (model_cache.scope(self.db_path), "vaccinations")
 
     def connect(self):
-        return sqlite3.connect(self.db_path)
+        return connection_pool.get(self.db_path)
 
     def insert(self, vax: Vaccination):
         with self.connect() as conn:
@@ -22,8 +26,34 @@ class VaccinationDB:
                 (vax.pet_id, vax.vaccine_name, vax.date_administered, vax.next_due, vax.price, vax.notes)
             )
             conn.commit()
+            model_cache.invalidate(self.cache_tag)
             return cursor.lastrowid
 
+    def insert_many(self, vaccinations: list[Vaccination], conn=None, schema: str = "main") -> int:
+        """
+        Insert many vaccinations with one executemany in a single transaction.
+        Pass conn/schema to join a caller's transaction on an attached connection;
+        the caller runs it inside model_cache.deferred_invalidation() so the cache
+        is only invalidated once that transaction commits.
+        """
+        rows = [
+            (vax.pet_id, vax.vaccine_name, vax.date_administered, vax.next_due, vax.price, vax.notes)
+            for vax in vaccinations
+        ]
+        if not rows:
+            return 0
+        sql = f"""
+            INSERT INTO {schema}.vaccinations (pet_id, vaccine_name, date_administered, next_due, price, notes)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """
+        if conn is not None:
+            conn.executemany(sql, rows)
+        else:
+            with self.connect() as conn:
+                conn.executemany(sql, rows)
+        model_cache.invalidate(self.cache_tag)
+        return len(rows)
+
     def update(self, vax: Vaccination):
         with self.connect() as conn:
             cursor = conn.cursor()
@@ -36,6 +66,7 @@ class VaccinationDB:
                 (vax.pet_id, vax.vaccine_name, vax.date_administered, vax.next_due, vax.price, vax.notes)
             )
             conn.commit()
+            model_cache.invalidate(self.cache_tag)
 
     def get_by_pet_id(self, pet_id: int) -> list[Vaccination]:
         """Get all vaccinations for a specific pet ID"""
@@ -47,30 +78,47 @@ class VaccinationDB:
                 WHERE pet_id = ?
                 ORDER BY date_administered DESC
             """, (pet_id,))
-            return [Vaccination(*row) for row in cursor.fetchall()]
+            return [Vaccination.from_row(*row) for row in cursor.fetchall()]
+
+    def get_by_pet_ids(self, pet_ids: list[int]) -> dict[int, list[Vaccination]]:
+        """Get vaccinations for many pets at once, keyed by pet ID (one query per chunk)"""
+        records = {pet_id: [] for pet_id in pet_ids}
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            for chunk in chunked(pet_ids):
+                cursor.execute(f"""
+                    SELECT pet_id, vaccine_name, date_administered, next_due, price, notes
+                    FROM vaccinations
+                    WHERE pet_id IN ({placeholders(len(chunk))})
+                    ORDER BY pet_id, date_administered DESC
+                """, chunk)
+                for row in cursor.fetchall():
+                    records[row[0]].append(Vaccination.from_row(*row))
+        return records
 
     def delete(self, record_id: int):
         with self.connect() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM vaccinations WHERE id = ?", (record_id,))
             conn.commit()
+            model_cache.invalidate(self.cache_tag)
 
     def fetch_by_id(self, record_id: int):
         with self.connect() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM vaccinations WHERE id = ?", (record_id,))
+            cursor.execute("SELECT pet_id, vaccine_name, date_administered, next_due, price, notes FROM vaccinations WHERE id = ?", (record_id,))
             row = cursor.fetchone()
-            return Vaccination(*row) if row else None
+            return Vaccination.from_row(*row) if row else None
 
     def fetch_all(self, pet_id: int):
         with self.connect() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM vaccinations WHERE pet_id = ? ORDER BY next_due ASC", (pet_id,))
-            return [Vaccination(*row) for row in cursor.fetchall()]
+            cursor.execute("SELECT pet_id, vaccine_name, date_administered, next_due, price, notes FROM vaccinations WHERE pet_id = ? ORDER BY next_due ASC", (pet_id,))
+            return [Vaccination.from_row(*row) for row in cursor.fetchall()]
 
     def get_all(self):
         """Fetch all vaccination records."""
         with self.connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT pet_id, vaccine_name, date_administered, next_due, price, notes FROM vaccinations")
-            return [Vaccination(*row) for row in cursor.fetchall()]
\ No newline at end of file
+            return [Vaccination.from_row(*row) for row in cursor.fetchall()]
\ No newline at end of file
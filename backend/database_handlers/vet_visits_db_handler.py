@@ -1,15 +1,19 @@
 # File: backend/db/vet_visit_db_handler.py
-import sqlite3
 import os
 from backend.models.vet_visit import VetVisit
+from backend.services.connection_pool import connection_pool
+from backend.services.model_cache import model_cache
+from backend.database_handlers.batch_utils import chunked, placeholders
 
 class VetVisitDB:
-    def __init__(self):
+    def __init__(self, db_path: str = None):
         base_dir = os.path.dirname(os.path.abspath(__file__))
-        self.db_path = os.path.join(base_dir, '..', 'data', 'vet_visits.db')
+        self.db_path = db_path or os.path.join(base_dir, '..', 'data', 'vet_visits.db')
+        # Writes drop cached pet lists that were filtered on this table
+        self.cache_tag = (model_cache.scope(self.db_path), "vet_visits")
 
     def connect(self):
-        return sqlite3.connect(self.db_path)
+        return connection_pool.get(self.db_path)
 
     def insert(self, visit: VetVisit):
         with self.connect() as conn:
@@ -22,8 +26,31 @@ class VetVisitDB:
                 (visit.pet_id, visit.visit_date, visit.reason, visit.notes, visit.cost)
             )
             conn.commit()
+            model_cache.invalidate(self.cache_tag)
             return cursor.lastrowid
 
+    def insert_many(self, visits: list[VetVisit], conn=None, schema: str = "main") -> int:
+        """
+        Insert many vet visits with one executemany in a single transaction.
+        Pass conn/schema to join a caller's transaction on an attached connection;
+        the caller runs it inside model_cache.deferred_invalidation() so the cache
+        is only invalidated once that transaction commits.
+        """
+        rows = [(visit.pet_id, visit.visit_date, visit.reason, visit.notes, visit.cost) for visit in visits]
+        if not rows:
+            return 0
+        sql = f"""
+            INSERT INTO {schema}.vet_visits (pet_id, visit_date, reason, notes, cost)
+            VALUES (?, ?, ?, ?, ?)
+        """
+        if conn is not None:
+            conn.executemany(sql, rows)
+        else:
+            with self.connect() as conn:
+                conn.executemany(sql, rows)
+        model_cache.invalidate(self.cache_tag)
+        return len(rows)
+
     def update(self, visit: VetVisit):
         with self.connect() as conn:
             cursor = conn.cursor()
@@ -36,6 +63,7 @@ class VetVisitDB:
                 (visit.pet_id, visit.visit_date, visit.reason, visit.notes, visit.cost)
             )
             conn.commit()
+            model_cache.invalidate(self.cache_tag)
 
     def get_by_pet_id(self, pet_id: int) -> list[VetVisit]:
         """Get all vet visits for a specific pet ID"""
@@ -48,33 +76,50 @@ class VetVisitDB:
                 WHERE pet_id = ?
                 ORDER BY visit_date DESC
             """, (pet_id,))
-            return [VetVisit(*row) for row in cursor.fetchall()]
+            return [VetVisit.from_row(*row) for row in cursor.fetchall()]
+
+    def get_by_pet_ids(self, pet_ids: list[int]) -> dict[int, list[VetVisit]]:
+        """Get vet visits for many pets at once, keyed by pet ID (one query per chunk)"""
+        records = {pet_id: [] for pet_id in pet_ids}
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            for chunk in chunked(pet_ids):
+                cursor.execute(f"""
+                    SELECT pet_id, visit_date, reason, notes, cost
+                    FROM vet_visits
+                    WHERE pet_id IN ({placeholders(len(chunk))})
+                    ORDER BY pet_id, visit_date DESC
+                """, chunk)
+                for row in cursor.fetchall():
+                    records[row[0]].append(VetVisit.from_row(*row))
+        return records
 
     def delete(self, record_id: int):
         with self.connect() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM vet_visits WHERE id = ?", (record_id,))
             conn.commit()
+            model_cache.invalidate(self.cache_tag)
 
     def fetch_by_id(self, record_id: int):
         with self.connect() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM vet_visits WHERE id = ?", (record_id,))
+            cursor.execute("SELECT pet_id, visit_date, reason, notes, cost FROM vet_visits WHERE id = ?", (record_id,))
             row = cursor.fetchone()
-            return VetVisit(*row) if row else None
+            return VetVisit.from_row(*row) if row else None
 
     def fetch_all(self, pet_id: int):
         with self.connect() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM vet_visits WHERE pet_id = ? ORDER BY visit_date DESC", (pet_id,))
-            return [VetVisit(*row) for row in cursor.fetchall()]
+            cursor.execute("SELECT pet_id, visit_date, reason, notes, cost FROM vet_visits WHERE pet_id = ? ORDER BY visit_date DESC", (pet_id,))
+            return [VetVisit.from_row(*row) for row in cursor.fetchall()]
 
     def get_all(self):
         """Fetch all vet visit records."""
         with self.connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT pet_id, visit_date, reason, notes, cost FROM vet_visits")
-            return [VetVisit(*row) for row in cursor.fetchall()]
+            return [VetVisit.from_row(*row) for row in cursor.fetchall()]
         
 
 vet_visits_db_handler = VetVisitDB()
\ No newline at end of file
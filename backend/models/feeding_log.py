@@ -5,6 +5,8 @@ class FeedingLog:
     Represents a feeding log entry for a pet.
     """
 
+    __slots__ = ("pet_id", "start_date", "num_days", "feed_once", "feed_twice", "feed_thrice", "notes")
+
     def __init__(self, pet_id: int, start_date: str, num_days: int,
                  feed_once=False, feed_twice=False, feed_thrice=False, notes=""):
         self.pet_id = pet_id
@@ -15,6 +17,19 @@ class FeedingLog:
         self.feed_thrice = feed_thrice
         self.notes = notes
 
+    @classmethod
+    def from_row(cls, pet_id, start_date, num_days, feed_once, feed_twice, feed_thrice, notes):
+        """Builds a FeedingLog from a database row without going through __init__."""
+        log = cls.__new__(cls)
+        log.pet_id = pet_id
+        log.start_date = start_date
+        log.num_days = num_days
+        log.feed_once = feed_once
+        log.feed_twice = feed_twice
+        log.feed_thrice = feed_thrice
+        log.notes = notes
+        return log
+
     def to_dict(self):
         return {
             "pet_id": self.pet_id,
@@ -7,6 +7,8 @@ class GroomingLog:
     Represents a grooming log entry for a pet.
     """
 
+    __slots__ = ("id", "pet_id", "groom_date", "groom_type", "price", "groomer_name", "notes")
+
     def __init__(self, id: int, pet_id: int, groom_date: str, groom_type: str,
                  price: float, groomer_name: str, notes: str = ""):
         self.id = id
@@ -17,6 +19,19 @@ class GroomingLog:
         self.groomer_name = groomer_name
         self.notes = notes
 
+    @classmethod
+    def from_row(cls, id, pet_id, groom_date, groom_type, price, groomer_name, notes):
+        """Builds a GroomingLog from a database row without going through __init__."""
+        log = cls.__new__(cls)
+        log.id = id
+        log.pet_id = pet_id
+        log.groom_date = groom_date
+        log.groom_type = groom_type
+        log.price = price
+        log.groomer_name = groomer_name
+        log.notes = notes
+        return log
+
     def to_dict(self):
         return {
             "id": self.id,
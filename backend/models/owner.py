@@ -3,6 +3,8 @@ class Owner:
     Represents a pet owner with contact details.
     """
 
+    __slots__ = ("id", "name", "contact_number", "address")
+
     def __init__(self, id: int, name: str, contact_number: str = None, address: str = None):
         """
         Initializes an Owner instance.
@@ -18,6 +20,18 @@ class Owner:
         self.contact_number = contact_number
         self.address = address
 
+    @classmethod
+    def from_row(cls, id, name, contact_number=None, address=None):
+        """
+        Builds an Owner from a database row without going through __init__.
+        """
+        owner = cls.__new__(cls)
+        owner.id = id
+        owner.name = name
+        owner.contact_number = contact_number
+        owner.address = address
+        return owner
+
     def to_dict(self):
         """
         Returns a dictionary representation of the owner.
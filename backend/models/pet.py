@@ -5,6 +5,9 @@ import re
 class Pet:
     """Represents a pet with identifying information and helper methods."""
 
+    __slots__ = ("id", "name", "breed", "birthdate", "image_path", "owner_id",
+                 "thumb_card_path", "thumb_profile_path")
+
     def __init__(
         self,
         id: int,
@@ -12,7 +15,9 @@ class Pet:
         breed: str,
         birthdate: str,
         image_path: Optional[str] = None,
-        owner_id: Optional[int] = None  # Explicit link to owner
+        owner_id: Optional[int] = None,  # Explicit link to owner
+        thumb_card_path: Optional[str] = None,
+        thumb_profile_path: Optional[str] = None
     ):
         """
         Args:
@@ -22,6 +27,8 @@ class Pet:
             birthdate: Format YYYY-MM-DD (validated in age()).
             image_path: Optional path to pet photo (auto-trimmed).
             owner_id: Foreign key linking to Owner (optional but recommended).
+            thumb_card_path: Optional path of the pre-generated card thumbnail.
+            thumb_profile_path: Optional path of the pre-generated profile thumbnail.
         """
         self.id = id
         self.name = name.strip()
@@ -29,6 +36,28 @@ class Pet:
         self.birthdate = birthdate
         self.image_path = image_path.strip() if image_path else None
         self.owner_id = owner_id  # Critical for database relationships
+        self.thumb_card_path = thumb_card_path
+        self.thumb_profile_path = thumb_profile_path
+
+    @classmethod
+    def from_row(cls, id, name, breed, birthdate, image_path=None, owner_id=None,
+                 thumb_card_path=None, thumb_profile_path=None) -> "Pet":
+        """Builds a Pet from an already-stored row, skipping the input cleanup in __init__."""
+        pet = cls.__new__(cls)
+        pet.id = id
+        pet.name = name
+        pet.breed = breed
+        pet.birthdate = birthdate
+        pet.image_path = image_path
+        pet.owner_id = owner_id
+        pet.thumb_card_path = thumb_card_path
+        pet.thumb_profile_path = thumb_profile_path
+        return pet
+
+    def copy(self) -> "Pet":
+        """Independent copy, e.g. of a cached pet handed to a caller that may edit it."""
+        return Pet.from_row(self.id, self.name, self.breed, self.birthdate, self.image_path, self.owner_id,
+                            self.thumb_card_path, self.thumb_profile_path)
 
     def age(self) -> Union[int, str]:
         """Calculates age in years or 'Unknown' if invalid date."""
@@ -59,6 +88,8 @@ class Pet:
 class Owner:
     """Represents a pet owner with validated contact information."""
 
+    __slots__ = ("id", "name", "contact_number", "address")
+
     def __init__(
         self,
         id: int,
@@ -78,6 +109,20 @@ class Owner:
         self.contact_number = self._clean_phone(contact_number) if contact_number else None
         self.address = address.strip() if address else None
 
+    @classmethod
+    def from_row(cls, id, name, contact_number=None, address=None) -> "Owner":
+        """Builds an Owner from an already-stored row; the phone was cleaned on insert."""
+        owner = cls.__new__(cls)
+        owner.id = id
+        owner.name = name
+        owner.contact_number = contact_number
+        owner.address = address
+        return owner
+
+    def copy(self) -> "Owner":
+        """Independent copy, e.g. of a cached owner handed to a caller that may edit it."""
+        return Owner.from_row(self.id, self.name, self.contact_number, self.address)
+
     @staticmethod
     def _clean_phone(phone: str) -> Optional[str]:
         """Extracts digits only or returns None if invalid."""
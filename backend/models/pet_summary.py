@@ -0,0 +1,47 @@
+# File: backend/models/pet_summary.py
+
+class PetSummary:
+    """
+    Aggregated record statistics for one pet (or, with pet_id None, for all pets).
+    Built from SQL aggregates, so no record objects are loaded to fill it.
+    """
+
+    def __init__(self, pet_id: int = None,
+                 vaccination_count: int = 0, last_vaccination: str = None, next_vaccination_due: str = None,
+                 vaccination_total: float = 0,
+                 vet_visit_count: int = 0, last_vet_visit: str = None, vet_visit_total: float = 0,
+                 daycare_count: int = 0, daycare_days: int = 0, last_daycare: str = None,
+                 daycare_total: float = 0,
+                 grooming_count: int = 0, last_grooming: str = None, grooming_total: float = 0):
+        self.pet_id = pet_id
+        self.vaccination_count = vaccination_count
+        self.last_vaccination = last_vaccination
+        self.next_vaccination_due = next_vaccination_due
+        self.vaccination_total = vaccination_total
+        self.vet_visit_count = vet_visit_count
+        self.last_vet_visit = last_vet_visit
+        self.vet_visit_total = vet_visit_total
+        self.daycare_count = daycare_count
+        self.daycare_days = daycare_days
+        self.last_daycare = last_daycare
+        self.daycare_total = daycare_total
+        self.grooming_count = grooming_count
+        self.last_grooming = last_grooming
+        self.grooming_total = grooming_total
+
+    @property
+    def total_spent(self) -> float:
+        return self.vaccination_total + self.vet_visit_total + self.daycare_total + self.grooming_total
+
+    def copy(self) -> "PetSummary":
+        """Independent copy, e.g. of cached totals handed to a caller that may edit them."""
+        return PetSummary(**vars(self))
+
+    def to_dict(self):
+        data = dict(vars(self))
+        data["total_spent"] = self.total_spent
+        return data
+
+    def __str__(self):
+        return (f"💉 {self.vaccination_count}  🩺 {self.vet_visit_count}  "
+                f"🏠 {self.daycare_days}d  ✂️ {self.grooming_count}  — ₱{self.total_spent:,.2f}")
@@ -3,6 +3,8 @@ from datetime import datetime, timedelta
 class Vaccination:
     """Represents a vaccination record for a pet."""
 
+    __slots__ = ("pet_id", "vaccine_name", "date_administered", "next_due", "price", "notes")
+
     DEFAULT_INTERVALS = {
         "Rabies": 365,
         "Distemper": 365,
@@ -26,6 +28,18 @@ class Vaccination:
         self.price = price or self.VACCINE_PRICES.get(vaccine_name, 0)
         self.notes = notes
 
+    @classmethod
+    def from_row(cls, pet_id, vaccine_name, date_administered, next_due, price, notes):
+        """Builds a stored vaccination; NULL next_due or price get the same defaults as __init__."""
+        vax = cls.__new__(cls)
+        vax.pet_id = pet_id
+        vax.vaccine_name = vaccine_name
+        vax.date_administered = date_administered
+        vax.next_due = next_due or vax.auto_calculate_next_due()
+        vax.price = price or cls.VACCINE_PRICES.get(vaccine_name, 0)
+        vax.notes = notes
+        return vax
+
     def auto_calculate_next_due(self) -> str:
         """Sets default `next_due` based on known intervals."""
         try:
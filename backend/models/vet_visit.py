@@ -5,6 +5,8 @@ class VetVisit:
     Represents a veterinary visit record for a pet.
     """
 
+    __slots__ = ("pet_id", "visit_date", "reason", "notes", "cost")
+
     def __init__(self, pet_id: int, visit_date: str, reason: str, notes: str = "", cost: float = 0.0):
         self.pet_id = pet_id
         self.visit_date = visit_date
@@ -12,6 +14,17 @@ class VetVisit:
         self.notes = notes
         self.cost = cost
 
+    @classmethod
+    def from_row(cls, pet_id, visit_date, reason, notes, cost):
+        """Builds a VetVisit from a database row without going through __init__."""
+        visit = cls.__new__(cls)
+        visit.pet_id = pet_id
+        visit.visit_date = visit_date
+        visit.reason = reason
+        visit.notes = notes
+        visit.cost = cost
+        return visit
+
     def to_dict(self):
         return {
             "pet_id": self.pet_id,
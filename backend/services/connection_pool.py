@@ -0,0 +1,123 @@
+# File: backend/services/connection_pool.py
+import os
+import sqlite3
+import threading
+from backend.services.storage_profile import apply_storage_profile
+
+
+class ConnectionPool:
+    """
+    Process-wide manager that keeps one long-lived SQLite connection per database
+    file and per thread, so handlers and controllers stop reconnecting on every call.
+
+    Connections are thread-local because sqlite3 objects must not be used by two
+    threads at once; those of a thread that has exited are closed the next time a
+    connection is opened or stats() is read. Pragmas, including the shared storage
+    profile, are applied once, when a connection is opened.
+    """
+
+    def __init__(self, profile: dict = None):
+        self.profile = profile
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all_connections = []  # (owning thread, connection)
+        self._opened = 0
+        self._reused = 0
+
+    @staticmethod
+    def _normalize(db_path: str) -> str:
+        if db_path == ":memory:":
+            return db_path
+        return os.path.normcase(os.path.abspath(db_path))
+
+    def get(self, db_path: str, foreign_keys: bool = False, attach: dict = None) -> sqlite3.Connection:
+        """
+        Returns the calling thread's connection for db_path, opening it on first use.
+
+        Args:
+            db_path: Path to the SQLite database file
+            foreign_keys: Enable PRAGMA foreign_keys on the connection. Only pets.db
+                can enforce its constraints; the record databases reference a pets
+                table that lives in another file.
+            attach: Optional mapping of schema alias to database path, ATTACHed once
+                when the connection is opened. Attached connections are pooled
+                separately from plain ones.
+        """
+        attached = tuple(sorted(
+            (alias, self._normalize(path)) for alias, path in (attach or {}).items()
+        ))
+        key = (self._normalize(db_path), foreign_keys, attached)
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+
+        conn = connections.get(key)
+        if conn is not None:
+            with self._lock:
+                self._reused += 1
+            return conn
+
+        conn = self._open(key[0], foreign_keys, attached)
+        connections[key] = conn
+        with self._lock:
+            self._opened += 1
+            self._all_connections.append((threading.current_thread(), conn))
+        self._close_orphaned()
+        return conn
+
+    def _close_orphaned(self) -> None:
+        """Closes the connections of threads that have exited; nothing can reach them again."""
+        with self._lock:
+            orphaned = [conn for thread, conn in self._all_connections if not thread.is_alive()]
+            if not orphaned:
+                return
+            self._all_connections = [
+                (thread, conn) for thread, conn in self._all_connections if thread.is_alive()
+            ]
+        for conn in orphaned:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+    def _open(self, db_path: str, foreign_keys: bool, attached: tuple) -> sqlite3.Connection:
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        if foreign_keys:
+            conn.execute("PRAGMA foreign_keys = ON")
+        for alias, path in attached:
+            conn.execute(f"ATTACH DATABASE ? AS {alias}", (path,))
+        apply_storage_profile(conn, ["main"] + [alias for alias, _ in attached], self.profile)
+        return conn
+
+    def stats(self) -> dict:
+        """
+        Returns how many connections were opened versus handed out again, and how
+        many are open now (threads that have exited no longer count).
+        """
+        self._close_orphaned()
+        with self._lock:
+            return {
+                "opened": self._opened,
+                "reused": self._reused,
+                "open_now": len(self._all_connections),
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._opened = 0
+            self._reused = 0
+
+    def close_all(self) -> None:
+        """Closes every pooled connection (all threads). Used at shutdown and in tests."""
+        with self._lock:
+            connections, self._all_connections = self._all_connections, []
+        for _, conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        # Forces every thread to reopen on its next call.
+        self._local = threading.local()
+
+
+connection_pool = ConnectionPool()
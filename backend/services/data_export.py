@@ -1,4 +1,3 @@
-import sqlite3
 import os
 
 def export_pets_to_txt(pets, filename="export-import/pets_export.txt"):
@@ -17,22 +16,18 @@ def export_pets_to_txt_from_db(
     
 ):
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    # Connect to the SQLite database
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, name, breed, birthdate, image_path FROM pets")
-    pets = cursor.fetchall()
-    conn.close()
+    from backend.controllers.pet_controller import PetController
 
-    # Write to text file
+    # Walk the pets table page by page so large databases never sit in memory at once
     with open(output_path, "w", encoding="utf-8") as f:
-        for pet in pets:
-            f.write(f"ID: {pet[0]}\n")
-            f.write(f"Name: {pet[1]}\n")
-            f.write(f"Breed: {pet[2]}\n")
-            f.write(f"Birthdate: {pet[3]}\n")
-            f.write(f"Image Path: {pet[4]}\n")
-            f.write("-" * 20 + "\n")
+        for pets, _ in PetController(db_path=db_path).iter_pet_pages():
+            for pet in pets:
+                f.write(f"ID: {pet.id}\n")
+                f.write(f"Name: {pet.name}\n")
+                f.write(f"Breed: {pet.breed}\n")
+                f.write(f"Birthdate: {pet.birthdate}\n")
+                f.write(f"Image Path: {pet.image_path}\n")
+                f.write("-" * 20 + "\n")
     print(f"Exported pet data to: {output_path}")
 
 # Optional: Run directly for testing
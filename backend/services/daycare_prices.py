@@ -1,12 +1,26 @@
 # File: backend/services/daycare_prices.py
 
+DAILY_RATE = 350
+
+# Per-day feeding add-on, checked in this order (first selected plan wins)
+FEEDING_ADDONS = (
+    ("feed_once", 85),
+    ("feed_twice", 170),
+    ("feed_thrice", 255),
+)
+
+
 def compute_total_fee(num_days: int, feed_once=False, feed_twice=False, feed_thrice=False) -> int:
-    if feed_once:
-        feed_cost = 85
-    elif feed_twice:
-        feed_cost = 170
-    elif feed_thrice:
-        feed_cost = 255
-    else:
-        feed_cost = 0
-    return num_days * (350 + feed_cost)
\ No newline at end of file
+    selected = {"feed_once": feed_once, "feed_twice": feed_twice, "feed_thrice": feed_thrice}
+    feed_cost = next((cost for flag, cost in FEEDING_ADDONS if selected[flag]), 0)
+    return num_days * (DAILY_RATE + feed_cost)
+
+
+def total_fee_sql(alias: str = "") -> str:
+    """
+    compute_total_fee as a SQL expression over daycare_enrollments columns,
+    so fees can be summed in the database without loading FeedingLog objects.
+    """
+    prefix = f"{alias}." if alias else ""
+    cases = " ".join(f"WHEN {prefix}{flag} THEN {cost}" for flag, cost in FEEDING_ADDONS)
+    return f"({prefix}num_days * ({DAILY_RATE} + CASE {cases} ELSE 0 END))"
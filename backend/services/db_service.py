@@ -2,9 +2,27 @@
 
 import sqlite3
 import os
+from backend.data.pets_db import PetDatabaseInitializer
+from backend.data.vaccinations_db import VaccinationsDatabaseInitializer
+from backend.data.vet_visits_db import VetVisitsDatabaseInitializer
+from backend.data.feeding_logs_db import FeedingLogsDatabaseInitializer
+from backend.data.grooming_logs_db import GroomingLogsDatabaseInitializer
 
 DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data'))
 
+DATABASE_INITIALIZERS = [
+    PetDatabaseInitializer,
+    VaccinationsDatabaseInitializer,
+    VetVisitsDatabaseInitializer,
+    FeedingLogsDatabaseInitializer,
+    GroomingLogsDatabaseInitializer,
+]
+
+def initialize_all_databases():
+    """Creates missing tables and applies pending migrations for every database."""
+    for initializer_cls in DATABASE_INITIALIZERS:
+        initializer_cls().initialize()
+
 def test_db_connection(db_filename):
     db_path = f'/{db_filename}'
     try:
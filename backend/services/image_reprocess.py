@@ -0,0 +1,232 @@
+# File: backend/services/image_reprocess.py
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Optional, Tuple
+from PIL import Image
+from backend.services.connection_pool import connection_pool
+from backend.services.model_cache import model_cache
+from backend.services.image_service import (
+    DATA_DIR, IMAGE_POLICY, THUMBNAIL_SIZES, ensure_thumbnails, generate_thumbnails, storage_extension
+)
+from backend.services.image_store import ImageStore
+
+# Completed (and failed) images of an interrupted run, kept in the data directory
+# until the run finishes
+CHECKPOINT_FILE = "reprocess_checkpoint.json"
+
+# reencode   - encode originals under the storage policy (new blobs) and rebuild thumbnails
+# thumbnails - regenerate every THUMBNAIL_SIZES derivative from the stored originals
+MODES = ("reencode", "thumbnails")
+
+
+def _needs_reencode(store: ImageStore, image_path: str, policy: dict) -> bool:
+    """Blobs already in the policy's format and size are skipped, so reruns do not re-compress them."""
+    if not store.is_blob(image_path) or not image_path.endswith(storage_extension(policy)):
+        return True
+    with Image.open(os.path.join(store.data_dir, image_path)) as image:
+        return max(image.size) > policy["max_dimension"]
+
+
+def _reencode_one(data_dir: str, image_path: str, policy: dict) -> Tuple[str, str, dict]:
+    """
+    Worker: encodes one stored photo under the policy and moves it into the store.
+    Runs in a child process, so it only takes and returns plain values.
+
+    Returns:
+        (old image path, new blob path, {size name: thumbnail path})
+    """
+    store = ImageStore(data_dir)
+    staged_path = store.stage(os.path.join(data_dir, image_path), policy)
+    new_path = store.put(staged_path)
+    return image_path, new_path, ensure_thumbnails(new_path, data_dir)
+
+
+def _rethumbnail_one(data_dir: str, image_path: str, policy: dict) -> Tuple[str, str, dict]:
+    """Worker: rewrites the thumbnails of one stored photo; the original is kept."""
+    thumbnails = generate_thumbnails(image_path, data_dir)
+    if not thumbnails:
+        raise OSError(f"cannot read {image_path}")
+    return image_path, image_path, thumbnails
+
+
+WORKERS = {
+    "reencode": _reencode_one,
+    "thumbnails": _rethumbnail_one,
+}
+
+
+def _run_signature(mode: str, policy: dict) -> str:
+    """What a run produces; a checkpoint left by a run with other settings is ignored."""
+    return json.dumps({"mode": mode, "policy": policy, "thumbnail_sizes": THUMBNAIL_SIZES}, sort_keys=True)
+
+
+def _load_checkpoint(path: str, signature: str) -> set:
+    try:
+        with open(path, encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return set()
+    return set(checkpoint["done"]) if checkpoint.get("signature") == signature else set()
+
+
+def _save_checkpoint(path: str, signature: str, done: set, failed: set) -> None:
+    # Written under a temporary name so an interruption never leaves half a checkpoint.
+    # Failed images are listed for reference only; a resumed run tries them again.
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"signature": signature, "done": sorted(done), "failed": sorted(failed)}, f)
+    os.replace(tmp_path, path)
+
+
+def _remove_checkpoint(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def print_progress(done: int, total: int, failed: int, elapsed: float) -> None:
+    rate = done / elapsed if elapsed else 0.0
+    print(f"🖼️ {done}/{total} image(s) processed, {failed} failed - {rate:.1f} images/s")
+
+
+def reprocess_images(data_dir: str = DATA_DIR, db_path: str = None, mode: str = "reencode",
+                     policy: dict = None, max_workers: Optional[int] = None, batch_size: int = 100,
+                     force: bool = False, resume: bool = True,
+                     progress: Optional[Callable[[int, int, int, float], None]] = print_progress) -> dict:
+    """
+    Re-encodes or re-thumbnails every stored pet photo in a process pool.
+
+    Images are handled in batches: each batch is processed in parallel, then the
+    pets rows pointing at it are rewritten in one transaction, originals no longer
+    referenced are deleted, and the batch is added to a checkpoint file. An
+    interrupted run with the same mode, policy and THUMBNAIL_SIZES picks up after
+    its last committed batch. The checkpoint is removed once every pending image
+    was attempted; failed images are reported and tried again by the next run.
+
+    Args:
+        mode: One of MODES
+        policy: Storage policy for "reencode"; defaults to IMAGE_POLICY
+        max_workers: Worker processes; defaults to the CPU count
+        batch_size: Images per transaction and checkpoint
+        force: Also re-encode blobs that already match the policy
+        resume: Skip images completed by an interrupted run's checkpoint
+        progress: Called after every batch with (done, total, failed, elapsed seconds)
+
+    Returns:
+        {"processed", "failed", "failed_images", "skipped", "seconds"}
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode {mode!r}; expected one of {MODES}")
+    policy = IMAGE_POLICY if policy is None else policy
+    store = ImageStore(data_dir, db_path)
+    checkpoint_path = os.path.join(data_dir, CHECKPOINT_FILE)
+    signature = _run_signature(mode, policy)
+    done = _load_checkpoint(checkpoint_path, signature) if resume else set()
+    failed = set()
+
+    conn = connection_pool.get(store.db_path, foreign_keys=True)
+    image_paths = [row[0] for row in conn.execute(
+        "SELECT DISTINCT image_path FROM pets WHERE image_path IS NOT NULL AND image_path != '' ORDER BY image_path"
+    )]
+    pending = []
+    for path in image_paths:
+        if path in done or not os.path.exists(os.path.join(data_dir, path)):
+            continue
+        try:
+            if mode == "reencode" and not force and not _needs_reencode(store, path, policy):
+                continue
+        except Exception as e:
+            # An unreadable original is reported instead of stopping the whole run
+            failed.add(path)
+            print(f"⚠️ Could not read image {path}: {e}")
+            continue
+        pending.append(path)
+
+    unreadable = len(failed)
+    stats = {"processed": 0, "failed": unreadable, "failed_images": sorted(failed),
+             "skipped": len(image_paths) - len(pending) - unreadable, "seconds": 0.0}
+    if not pending:
+        _remove_checkpoint(checkpoint_path)
+        return stats
+
+    worker = WORKERS[mode]
+    scope = model_cache.scope(store.db_path)
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for start in range(0, len(pending), batch_size):
+            results, futures = [], {}
+            for path in pending[start:start + batch_size]:
+                try:
+                    futures[pool.submit(worker, data_dir, path, policy)] = path
+                except Exception as e:
+                    # e.g. BrokenProcessPool once a worker process died
+                    failed.add(path)
+                    print(f"⚠️ Could not reprocess image {path}: {e}")
+            # Any failure only costs its own image; the rest of the batch still commits
+            for future in as_completed(futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    failed.add(futures[future])
+                    print(f"⚠️ Could not reprocess image {futures[future]}: {e}")
+
+            with conn:
+                pet_ids = [row[0] for old_path, _, _ in results for row in conn.execute(
+                    "SELECT id FROM pets WHERE image_path = ?", (old_path,)
+                )]
+                conn.executemany(
+                    "UPDATE pets SET image_path = ?, thumb_card_path = ?, thumb_profile_path = ? WHERE image_path = ?",
+                    [(new_path, thumbs.get("card"), thumbs.get("profile"), old_path)
+                     for old_path, new_path, thumbs in results]
+                )
+            model_cache.invalidate((scope, "pets"), *[(scope, "pet", pet_id) for pet_id in pet_ids])
+
+            for old_path, new_path, _ in results:
+                if old_path != new_path:
+                    store.remove_unreferenced(old_path, conn)
+                done.update((old_path, new_path))
+            _save_checkpoint(checkpoint_path, signature, done, failed)
+
+            stats["processed"] += len(results)
+            stats["failed"] = len(failed)
+            stats["seconds"] = time.perf_counter() - started
+            if progress:
+                progress(stats["processed"] + stats["failed"], len(pending) + unreadable,
+                         stats["failed"], stats["seconds"])
+
+    # Every pending image was attempted; failed ones are retried by the next run
+    _remove_checkpoint(checkpoint_path)
+    stats["failed_images"] = sorted(failed)
+    return stats
+
+
+def reencode_images(data_dir: str = DATA_DIR, db_path: str = None, policy: dict = None,
+                    max_workers: Optional[int] = None, force: bool = False) -> int:
+    """
+    Re-encodes every stored pet photo under the storage policy (see reprocess_images).
+
+    Returns:
+        Number of images re-encoded
+    """
+    return reprocess_images(data_dir, db_path, "reencode", policy, max_workers,
+                            force=force, progress=None)["processed"]
+
+
+# Standalone run: python -m backend.services.image_reprocess [reencode|thumbnails]
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-encode pet photos or rebuild their thumbnails.")
+    parser.add_argument("mode", nargs="?", choices=MODES, default="reencode")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=100, help="images per transaction and checkpoint")
+    parser.add_argument("--force", action="store_true", help="re-encode photos that already match the policy")
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoint of an interrupted run")
+    args = parser.parse_args()
+
+    result = reprocess_images(mode=args.mode, max_workers=args.workers, batch_size=args.batch_size,
+                              force=args.force, resume=not args.restart)
+    print(f"✅ {result['processed']} processed, {result['failed']} failed, {result['skipped']} skipped "
+          f"in {result['seconds']:.1f}s")
@@ -0,0 +1,146 @@
+# File: backend/services/image_service.py
+import os
+from typing import Dict, Optional
+from PIL import Image, ImageOps
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+# Square thumbnail edge (px) per view; the pets table has a thumb_<name>_path column for each
+THUMBNAIL_SIZES = {
+    "card": 140,
+    "profile": 300,
+}
+
+# How originals are encoded when they enter the image store.
+#   max_dimension - longest stored edge in px; larger photos are downscaled (LANCZOS)
+#   format        - "JPEG" (optimized, progressive) or "WEBP"
+#   quality       - encoder quality, 1-95
+# EXIF orientation is applied to the pixels first, and no EXIF/ICC metadata is written.
+IMAGE_POLICY = {
+    "max_dimension": 1200,
+    "format": "JPEG",
+    "quality": 85,
+}
+
+STORAGE_EXTENSIONS = {
+    "JPEG": ".jpg",
+    "WEBP": ".webp",
+}
+
+
+def storage_extension(policy: dict = None) -> str:
+    """File extension of images stored under the policy."""
+    policy = IMAGE_POLICY if policy is None else policy
+    return STORAGE_EXTENSIONS[policy["format"]]
+
+
+def save_for_storage(image: Image.Image, dest_path: str, policy: dict = None) -> None:
+    """
+    Encodes an image the way the store keeps originals: orientation baked in,
+    downscaled to the policy's max_dimension, metadata stripped.
+    """
+    policy = IMAGE_POLICY if policy is None else policy
+    image = ImageOps.exif_transpose(image)
+    if max(image.size) > policy["max_dimension"]:
+        image = image.copy()
+        image.thumbnail((policy["max_dimension"], policy["max_dimension"]), Image.LANCZOS)
+
+    # Pillow only writes EXIF/ICC data passed explicitly, so none is carried over
+    if policy["format"] == "WEBP":
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+        image.save(dest_path, "WEBP", quality=policy["quality"], method=4)
+    else:
+        image.convert("RGB").save(dest_path, "JPEG", quality=policy["quality"],
+                                  optimize=True, progressive=True)
+
+
+def encode_for_storage(src_path: str, dest_path: str, policy: dict = None) -> None:
+    """Re-encodes an image file under the storage policy (see save_for_storage)."""
+    policy = IMAGE_POLICY if policy is None else policy
+    with Image.open(src_path) as image:
+        # JPEG can decode straight at a reduced scale, never below the stored size
+        image.draft("RGB", (policy["max_dimension"], policy["max_dimension"]))
+        image.load()
+        save_for_storage(image, dest_path, policy)
+
+
+def thumbnail_relpath(image_path: str, size_name: str) -> str:
+    """
+    Where the derivative of a stored image lives, relative to the data directory:
+    next to the original as <name>_<size_name>.<ext> (PNG when the source may carry
+    transparency, JPEG otherwise).
+    """
+    stem, ext = os.path.splitext(image_path)
+    ext = ".png" if ext.lower() in (".png", ".gif", ".webp") else ".jpg"
+    return f"{stem}_{size_name}{ext}"
+
+
+def _write_thumbnail(image: Image.Image, dest_path: str, edge: int) -> None:
+    thumb = image.resize((edge, edge), Image.LANCZOS)
+    if dest_path.endswith(".jpg"):
+        thumb.convert("RGB").save(dest_path, "JPEG", quality=85, optimize=True)
+    else:
+        thumb.save(dest_path, "PNG", optimize=True)
+
+
+def generate_thumbnails(image_path: str, data_dir: str = DATA_DIR) -> Dict[str, str]:
+    """
+    Writes every THUMBNAIL_SIZES derivative of a stored image, decoding the original once.
+
+    Args:
+        image_path: Stored image path, relative to data_dir
+        data_dir: Directory image paths are relative to
+
+    Returns:
+        {size_name: thumbnail path relative to data_dir}; empty if the original
+        cannot be read (views then fall back to their placeholder)
+    """
+    try:
+        with Image.open(os.path.join(data_dir, image_path)) as original:
+            # JPEG can decode straight at a reduced scale, never smaller than the largest thumbnail
+            largest = max(THUMBNAIL_SIZES.values())
+            original.draft("RGB", (largest, largest))
+            original.load()
+            thumbnails = {}
+            for size_name, edge in THUMBNAIL_SIZES.items():
+                relpath = thumbnail_relpath(image_path, size_name)
+                _write_thumbnail(original, os.path.join(data_dir, relpath), edge)
+                thumbnails[size_name] = relpath
+            return thumbnails
+    except OSError as e:
+        print(f"⚠️ Could not create thumbnails for {image_path}: {e}")
+        return {}
+
+
+def ensure_thumbnails(image_path: str, data_dir: str = DATA_DIR) -> Dict[str, str]:
+    """
+    Like generate_thumbnails, but reuses derivatives that already exist, e.g. when
+    the same blob is shared by several pets.
+    """
+    thumbnails = {name: thumbnail_relpath(image_path, name) for name in THUMBNAIL_SIZES}
+    if all(os.path.exists(os.path.join(data_dir, relpath)) for relpath in thumbnails.values()):
+        return thumbnails
+    return generate_thumbnails(image_path, data_dir)
+
+
+def thumbnail_path(pet, size_name: str, data_dir: str = DATA_DIR) -> Optional[str]:
+    """Absolute path where a pet's thumbnail should be, without touching the disk."""
+    if not getattr(pet, "image_path", None):
+        return None
+    relpath = getattr(pet, f"thumb_{size_name}_path", None) or thumbnail_relpath(pet.image_path, size_name)
+    return os.path.join(data_dir, relpath)
+
+
+def thumbnail_for(pet, size_name: str, data_dir: str = DATA_DIR) -> Optional[str]:
+    """
+    Returns the absolute path of a pet's thumbnail, regenerating it from the
+    original when the file is missing (e.g. deleted, or a pet stored before
+    thumbnails existed). Returns None when the pet has no readable image.
+    """
+    path = thumbnail_path(pet, size_name, data_dir)
+    if path is None:
+        return None
+    if os.path.exists(path):
+        return path
+    regenerated = generate_thumbnails(pet.image_path, data_dir).get(size_name)
+    return os.path.join(data_dir, regenerated) if regenerated else None
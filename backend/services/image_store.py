@@ -0,0 +1,216 @@
+# File: backend/services/image_store.py
+import hashlib
+import os
+import sqlite3
+import time
+import uuid
+from typing import Optional
+from backend.services.connection_pool import connection_pool
+from backend.services.model_cache import model_cache
+from backend.services.image_service import (
+    DATA_DIR, THUMBNAIL_SIZES, encode_for_storage, ensure_thumbnails, storage_extension, thumbnail_relpath
+)
+
+BLOB_PREFIX = "images/blobs/"
+
+# Edited uploads are encoded here, on the same filesystem as the blobs, so that
+# storing them is a rename rather than a copy
+STAGING_DIR = "temp"
+
+
+class ImageStore:
+    """
+    Content-addressed storage for pet photos.
+
+    A photo is stored once under images/blobs/<first two hex digits>/<sha256>.<ext>
+    and pets.image_path points at that blob, so the same picture uploaded for
+    several pets (and its thumbnails) is kept on disk only once. The reference
+    count of a blob is the number of pets rows pointing at it; release() deletes
+    the blob when that drops to zero.
+
+    Every photo enters through the staging directory, encoded under IMAGE_POLICY
+    (see image_service), and is then renamed into place.
+    """
+
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, data_dir: str = DATA_DIR, db_path: str = None):
+        self.data_dir = data_dir
+        self.db_path = db_path or os.path.join(data_dir, 'pets.db')
+
+    @classmethod
+    def hash_file(cls, path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(cls.HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def blob_relpath(digest: str, ext: str) -> str:
+        """Blob location relative to the data directory (always with forward slashes)."""
+        return f"{BLOB_PREFIX}{digest[:2]}/{digest}{ext.lower()}"
+
+    @staticmethod
+    def is_blob(image_path: Optional[str]) -> bool:
+        return bool(image_path) and image_path.replace("\\", "/").startswith(BLOB_PREFIX)
+
+    @property
+    def staging_dir(self) -> str:
+        return os.path.join(self.data_dir, STAGING_DIR)
+
+    def new_staging_path(self, ext: str = ".jpg") -> str:
+        """Unique path in the staging directory for an upload that is about to be encoded."""
+        os.makedirs(self.staging_dir, exist_ok=True)
+        return os.path.join(self.staging_dir, f"{uuid.uuid4().hex}{ext}")
+
+    def is_staged(self, path: str) -> bool:
+        return os.path.dirname(os.path.abspath(path)) == os.path.abspath(self.staging_dir)
+
+    def stage(self, src_path: str, policy: dict = None) -> str:
+        """
+        Encodes a photo under the storage policy into the staging directory and
+        returns the staged path. Files already staged (the uploader encodes with the
+        policy itself) are returned unchanged.
+        """
+        if self.is_staged(src_path):
+            return src_path
+        staged_path = self.new_staging_path(storage_extension(policy))
+        try:
+            encode_for_storage(src_path, staged_path, policy)
+        except OSError:
+            if os.path.exists(staged_path):
+                os.remove(staged_path)
+            raise
+        return staged_path
+
+    def plan(self, staged_path: str) -> str:
+        """Blob path a staged file will be stored under, without writing anything."""
+        return self.blob_relpath(self.hash_file(staged_path), os.path.splitext(staged_path)[1])
+
+    def put(self, src_path: str, relpath: str = None) -> str:
+        """
+        Stores a photo and returns its blob path relative to the data directory.
+        Identical content is stored once; a second put of the same photo writes nothing.
+
+        The staged file is moved into place with a single rename (never leaving a
+        truncated blob), or removed when the blob already exists. Unstaged files are
+        staged first, so the original is left untouched.
+
+        Args:
+            relpath: Blob path from plan(), to avoid hashing the file twice
+        """
+        staged_path = self.stage(src_path)
+        relpath = relpath or self.plan(staged_path)
+        dest_path = os.path.join(self.data_dir, relpath)
+        if os.path.exists(dest_path):
+            os.remove(staged_path)
+        else:
+            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+            os.replace(staged_path, dest_path)
+        return relpath
+
+    def cleanup_staging(self, max_age_seconds: float = 3600) -> int:
+        """
+        Deletes staged uploads older than max_age_seconds: edits that were never
+        saved, or whose pet insert failed. Newer files may belong to a save in progress.
+
+        Returns:
+            Number of files removed
+        """
+        try:
+            entries = list(os.scandir(self.staging_dir))
+        except FileNotFoundError:
+            return 0
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    removed += 1
+            except OSError:
+                # Already gone, or still open on Windows; the next run retries
+                pass
+        return removed
+
+    def ref_count(self, image_path: str, conn: sqlite3.Connection = None) -> int:
+        conn = conn or connection_pool.get(self.db_path)
+        return conn.execute("SELECT COUNT(*) FROM pets WHERE image_path = ?", (image_path,)).fetchone()[0]
+
+    def release(self, image_path: str, conn: sqlite3.Connection = None) -> bool:
+        """
+        Deletes a blob and its thumbnails once no pet references it.
+        Call after the change that dropped the reference has been committed.
+
+        Returns:
+            True if the files were removed
+        """
+        return self.is_blob(image_path) and self.remove_unreferenced(image_path, conn)
+
+    def remove_unreferenced(self, image_path: str, conn: sqlite3.Connection = None) -> bool:
+        """
+        Deletes a stored image (blob or legacy file) and its thumbnails unless a pet
+        still references it. Like release, call it after the change is committed.
+
+        Returns:
+            True if the files were removed
+        """
+        if self.ref_count(image_path, conn):
+            return False
+        self._remove_with_thumbnails(image_path)
+        return True
+
+    def _remove_with_thumbnails(self, image_path: str) -> None:
+        for relpath in [image_path] + [thumbnail_relpath(image_path, name) for name in THUMBNAIL_SIZES]:
+            try:
+                os.remove(os.path.join(self.data_dir, relpath))
+            except FileNotFoundError:
+                pass
+
+    def migrate_legacy_images(self, batch_size: int = 200) -> int:
+        """
+        Moves photos stored under the old <name>_<id>.<ext> scheme into the blob store
+        and rewrites pets.image_path and the thumbnail columns to match. Safe to run
+        repeatedly: rows already pointing at a blob are skipped, and missing files are
+        left untouched. Old files are deleted only after the rows stop referencing them.
+
+        Returns:
+            Number of pets rewritten
+        """
+        conn = connection_pool.get(self.db_path, foreign_keys=True)
+        rows = conn.execute(
+            "SELECT id, image_path FROM pets WHERE image_path IS NOT NULL AND image_path != ''"
+        ).fetchall()
+        legacy = [(pet_id, path) for pet_id, path in rows if not self.is_blob(path)]
+
+        rewritten = 0
+        for start in range(0, len(legacy), batch_size):
+            updates, replaced = [], set()
+            for pet_id, old_path in legacy[start:start + batch_size]:
+                src_path = os.path.join(self.data_dir, old_path)
+                if not os.path.exists(src_path):
+                    continue
+                blob_path = self.put(src_path)
+                thumbnails = ensure_thumbnails(blob_path, self.data_dir)
+                updates.append((blob_path, thumbnails.get("card"), thumbnails.get("profile"), pet_id))
+                replaced.add(old_path)
+
+            with conn:
+                conn.executemany(
+                    "UPDATE pets SET image_path = ?, thumb_card_path = ?, thumb_profile_path = ? WHERE id = ?",
+                    updates
+                )
+            rewritten += len(updates)
+            scope = model_cache.scope(self.db_path)
+            model_cache.invalidate((scope, "pets"), *[(scope, "pet", update[-1]) for update in updates])
+
+            for old_path in replaced:
+                self.remove_unreferenced(old_path, conn)
+        return rewritten
+
+
+# Optional standalone run: python -m backend.services.image_store
+if __name__ == "__main__":
+    count = ImageStore().migrate_legacy_images()
+    print(f"🖼️ Moved {count} pet image(s) into the content-addressed store")
@@ -0,0 +1,164 @@
+# File: backend/services/model_cache.py
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable, Iterable
+
+
+class ModelCache:
+    """
+    Bounded, in-process read-through cache for Pet/Owner lookups and list results.
+
+    Entries are evicted least-recently-used once max_entries is reached. Every
+    entry carries a set of tags such as (scope, "pet", 7) or (scope, "vaccinations");
+    write paths invalidate the tags they touch, which drops exactly the entries
+    built from that data. The scope is the data directory, so test databases and
+    the real ones never share entries.
+
+    Loads run outside the lock. A load that overlaps an invalidation is returned
+    but not cached, since it may have read the rows being replaced.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._tag_index = {}
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._listeners = []
+        self._generation = 0
+        self._local = threading.local()
+
+    @staticmethod
+    def scope(db_path: str) -> str:
+        """Returns the cache scope (normalized data directory) of a database file."""
+        return os.path.normcase(os.path.dirname(os.path.abspath(db_path)))
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], tags=()) -> Any:
+        """
+        Returns the cached value for key, calling loader() and caching its result on a miss.
+        None results are not cached, so missing rows are looked up again next time.
+
+        Args:
+            tags: Iterable of tags, or a callable that derives them from the loaded value
+                (e.g. the owner id of a pet is only known after the row is read)
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key][0]
+            self._misses += 1
+            generation = self._generation
+
+        value = loader()
+        if value is not None:
+            with self._lock:
+                if generation == self._generation:
+                    self.put(key, value, tags(value) if callable(tags) else tags)
+        return value
+
+    def put(self, key: Hashable, value: Any, tags: Iterable[Hashable] = ()) -> None:
+        tags = frozenset(tags)
+        with self._lock:
+            if key in self._entries:
+                self._discard(key)
+            self._entries[key] = (value, tags)
+            for tag in tags:
+                self._tag_index.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._discard(next(iter(self._entries)))
+                self._evictions += 1
+
+    def add_listener(self, listener: Callable[[tuple], None]) -> None:
+        """
+        Registers a callback run with the tags of every invalidate() call, so layers
+        above the models (e.g. cached views) learn that data changed. It runs on
+        the thread that wrote the data and must not block.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[tuple], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    @contextmanager
+    def deferred_invalidation(self):
+        """
+        Holds back this thread's invalidate() calls until the block exits. Wrap write
+        transactions in it so entries are dropped after the commit: dropped before it,
+        a concurrent reader could cache the old rows again with nothing to drop them.
+        """
+        if getattr(self._local, "pending", None) is not None:
+            # Nested: the outermost block flushes
+            yield
+            return
+        self._local.pending = []
+        try:
+            yield
+        finally:
+            tags, self._local.pending = self._local.pending, None
+            if tags:
+                self.invalidate(*tags)
+
+    def invalidate(self, *tags: Hashable) -> int:
+        """
+        Drops every entry carrying any of the given tags and returns how many were
+        dropped (0 inside deferred_invalidation, where tags are only queued).
+        """
+        pending = getattr(self._local, "pending", None)
+        if pending is not None:
+            pending.extend(tags)
+            return 0
+        with self._lock:
+            self._generation += 1
+            keys = set()
+            for tag in tags:
+                keys.update(self._tag_index.get(tag, ()))
+            for key in keys:
+                self._discard(key)
+            self._invalidations += len(keys)
+        for listener in list(self._listeners):
+            listener(tags)
+        return len(keys)
+
+    def _discard(self, key: Hashable) -> None:
+        _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tag_index.clear()
+
+    def stats(self) -> dict:
+        """Returns hit/miss counters and the current number of entries."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidated": self._invalidations,
+                "entries": len(self._entries),
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._invalidations = 0
+
+
+model_cache = ModelCache()
@@ -0,0 +1,99 @@
+# File: backend/services/pet_query_service.py
+import os
+import sqlite3
+from typing import List, Optional, Tuple
+from backend.models.pet import Pet, Owner
+from backend.services.connection_pool import connection_pool
+
+
+def pet_and_owner_from_row(row: sqlite3.Row) -> Tuple[Pet, Optional[Owner]]:
+    """
+    Builds the Pet and Owner from a pets/owner join row (trusted, already-stored values).
+    Expects the pet_id/pet_name/owner_id/owner_name aliases and the thumb_card_path/thumb_profile_path columns.
+    """
+    pet = Pet.from_row(
+        row['pet_id'], row['pet_name'], row['breed'], row['birthdate'], row['image_path'], row['owner_id'],
+        row['thumb_card_path'], row['thumb_profile_path']
+    )
+    owner = Owner.from_row(
+        row['owner_id'], row['owner_name'], row['contact_number'], row['address']
+    ) if row['owner_id'] else None
+    return pet, owner
+
+
+class PetQueryService:
+    """
+    Answers cross-database pet questions with single SQL statements.
+
+    pets.db is opened as the main schema and the four record databases are
+    ATTACHed under their file names, so filters such as "pets with feeding logs"
+    become one EXISTS query instead of one query per pet.
+    """
+
+    ATTACHED_DATABASES = {
+        "vaccinations": "vaccinations.db",
+        "vet_visits": "vet_visits.db",
+        "feeding_logs": "feeding_logs.db",
+        "grooming_logs": "grooming_logs.db",
+    }
+
+    HAS_VACCINATION = "EXISTS (SELECT 1 FROM vaccinations.vaccinations v WHERE v.pet_id = p.id)"
+    HAS_VET_VISIT = "EXISTS (SELECT 1 FROM vet_visits.vet_visits vv WHERE vv.pet_id = p.id)"
+    HAS_FEEDING_LOG = "EXISTS (SELECT 1 FROM feeding_logs.daycare_enrollments d WHERE d.pet_id = p.id)"
+    HAS_GROOMING_LOG = "EXISTS (SELECT 1 FROM grooming_logs.grooming_logs g WHERE g.pet_id = p.id)"
+
+    def __init__(self, data_dir: str = None):
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.data_dir = data_dir or os.path.join(base_dir, 'data')
+        self.db_path = os.path.join(self.data_dir, 'pets.db')
+        self.attached = {
+            alias: os.path.join(self.data_dir, filename)
+            for alias, filename in self.ATTACHED_DATABASES.items()
+        }
+
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Returns the pooled pets.db connection with every record database attached.
+        Writes through it share one transaction across all five files.
+        """
+        return connection_pool.get(self.db_path, attach=self.attached)
+
+    def _pets_where(self, condition: str) -> Tuple[List[Pet], List[Optional[Owner]]]:
+        """Runs one pets/owner query filtered by the given SQL condition."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(f'''
+                SELECT p.id AS pet_id, p.name AS pet_name, p.breed, p.birthdate, p.image_path,
+                    p.thumb_card_path, p.thumb_profile_path,
+                    o.id AS owner_id, o.name AS owner_name, o.contact_number, o.address
+                FROM pets p
+                LEFT JOIN owner o ON p.owner_id = o.id
+                WHERE {condition}
+                ORDER BY p.id
+            ''')
+
+            pets = []
+            owners = []
+            for row in cursor.fetchall():
+                pet, owner = pet_and_owner_from_row(row)
+                pets.append(pet)
+                owners.append(owner)
+
+            return pets, owners
+
+    def get_pets_with_vacc_or_vet_records(self) -> Tuple[List[Pet], List[Optional[Owner]]]:
+        """Pets (with owners) having at least one vaccination OR one vet visit."""
+        return self._pets_where(f"{self.HAS_VACCINATION} OR {self.HAS_VET_VISIT}")
+
+    def get_pets_with_vacc_and_vet_records(self) -> Tuple[List[Pet], List[Optional[Owner]]]:
+        """Pets (with owners) having at least one vaccination AND one vet visit."""
+        return self._pets_where(f"{self.HAS_VACCINATION} AND {self.HAS_VET_VISIT}")
+
+    def get_pets_with_feeding_logs(self) -> Tuple[List[Pet], List[Optional[Owner]]]:
+        """Pets (with owners) having at least one feeding log."""
+        return self._pets_where(self.HAS_FEEDING_LOG)
+
+    def get_pets_with_grooming_logs(self) -> Tuple[List[Pet], List[Optional[Owner]]]:
+        """Pets (with owners) having at least one grooming log."""
+        return self._pets_where(self.HAS_GROOMING_LOG)
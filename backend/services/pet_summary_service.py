@@ -0,0 +1,84 @@
+# File: backend/services/pet_summary_service.py
+import os
+from typing import Dict, Iterable, Optional
+from backend.models.pet_summary import PetSummary
+from backend.services.daycare_prices import total_fee_sql
+from backend.services.pet_query_service import PetQueryService
+from backend.database_handlers.batch_utils import chunked, placeholders
+
+
+class PetSummaryService:
+    """
+    Per-pet counts, last-event dates and spending, computed with one GROUP BY
+    query per record table over the attached databases.
+
+    Each entry of AGGREGATES maps a record table to the aggregate expressions
+    it contributes and the PetSummary fields they fill, in order.
+    """
+
+    AGGREGATES = (
+        ("vaccinations.vaccinations", (
+            ("COUNT(*)", "vaccination_count"),
+            ("MAX(date_administered)", "last_vaccination"),
+            ("MIN(CASE WHEN next_due >= date('now') THEN next_due END)", "next_vaccination_due"),
+            ("COALESCE(SUM(price), 0)", "vaccination_total"),
+        )),
+        ("vet_visits.vet_visits", (
+            ("COUNT(*)", "vet_visit_count"),
+            ("MAX(visit_date)", "last_vet_visit"),
+            ("COALESCE(SUM(cost), 0)", "vet_visit_total"),
+        )),
+        ("feeding_logs.daycare_enrollments", (
+            ("COUNT(*)", "daycare_count"),
+            ("COALESCE(SUM(num_days), 0)", "daycare_days"),
+            ("MAX(start_date)", "last_daycare"),
+            (f"COALESCE(SUM({total_fee_sql()}), 0)", "daycare_total"),
+        )),
+        ("grooming_logs.grooming_logs", (
+            ("COUNT(*)", "grooming_count"),
+            ("MAX(groom_date)", "last_grooming"),
+            ("COALESCE(SUM(price), 0)", "grooming_total"),
+        )),
+    )
+
+    def __init__(self, data_dir: str = None):
+        self.query_service = PetQueryService(data_dir=data_dir)
+
+    def get_summaries(self, pet_ids: Optional[Iterable[int]] = None) -> Dict[int, PetSummary]:
+        """
+        Returns {pet_id: PetSummary} for the given pets (every pet with records when
+        pet_ids is None). Pets without any records get an all-zero summary.
+        """
+        if pet_ids is not None:
+            pet_ids = list(pet_ids)  # read once per record table below
+        summaries = {pet_id: PetSummary(pet_id) for pet_id in (pet_ids or [])}
+        conn = self.query_service.get_connection()
+        cursor = conn.cursor()
+        for table, aggregates in self.AGGREGATES:
+            select = ", ".join(expression for expression, _ in aggregates)
+            fields = [field for _, field in aggregates]
+            if pet_ids is None:
+                batches = [(f"SELECT pet_id, {select} FROM {table} GROUP BY pet_id", [])]
+            else:
+                batches = [
+                    (f"SELECT pet_id, {select} FROM {table} "
+                     f"WHERE pet_id IN ({placeholders(len(chunk))}) GROUP BY pet_id", chunk)
+                    for chunk in chunked(pet_ids)
+                ]
+            for sql, params in batches:
+                for pet_id, *values in cursor.execute(sql, params).fetchall():
+                    summary = summaries.setdefault(pet_id, PetSummary(pet_id))
+                    for field, value in zip(fields, values):
+                        setattr(summary, field, value)
+        return summaries
+
+    def get_totals(self) -> PetSummary:
+        """Returns the same statistics aggregated over every pet (pet_id is None)."""
+        totals = PetSummary()
+        conn = self.query_service.get_connection()
+        for table, aggregates in self.AGGREGATES:
+            select = ", ".join(expression for expression, _ in aggregates)
+            values = conn.execute(f"SELECT {select} FROM {table}").fetchone()
+            for (_, field), value in zip(aggregates, values):
+                setattr(totals, field, value)
+        return totals
@@ -0,0 +1,171 @@
+# File: backend/services/photo_ingest.py
+import argparse
+import csv
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from PIL import Image, ImageOps
+from backend.controllers.pet_controller import PetController
+from backend.services.connection_pool import connection_pool
+from backend.services.image_service import IMAGE_POLICY, save_for_storage, storage_extension
+
+PHOTO_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp")
+
+# File naming conventions, tried in order on the lower-cased file name without extension:
+#   12, pet_12, pet-12  - pet id
+#   brownie_12          - name and id (the old image naming scheme); both must match
+#                         the same pet, so camera names like IMG_0042 are not taken for ids
+#   brownie             - pet name, when exactly one pet has it
+ID_PATTERN = re.compile(r"^(?:pet[_-]?)?(\d+)$")
+NAME_ID_PATTERN = re.compile(r"^(.+?)[_-](\d+)$")
+
+# Columns of the optional mapping CSV (header names are matched case-insensitively)
+MAPPING_COLUMNS = ("filename", "pet_id")
+
+
+def _normalize_name(name: str) -> str:
+    return re.sub(r"[\s_-]+", " ", name).strip().lower()
+
+
+def _read_mapping(mapping_csv: str) -> Dict[str, str]:
+    """Reads {filename: pet_id} from the mapping CSV, skipping rows missing either value."""
+    # utf-8-sig drops the byte order mark spreadsheet programs put in front of the header
+    with open(mapping_csv, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        columns = {(name or "").strip().lower(): name for name in reader.fieldnames or []}
+        missing = [column for column in MAPPING_COLUMNS if column not in columns]
+        if missing:
+            raise ValueError(f"{mapping_csv} needs a header with {' and '.join(MAPPING_COLUMNS)} columns "
+                             f"(missing: {', '.join(missing)})")
+        mapping = {}
+        for row in reader:
+            filename, pet_id = (row.get(columns[column]) for column in MAPPING_COLUMNS)
+            if filename and filename.strip() and pet_id and pet_id.strip():
+                mapping[filename.strip()] = pet_id.strip()
+        return mapping
+
+
+def match_photos(folder: str, pets: List[Tuple[int, str]],
+                 mapping_csv: Optional[str] = None) -> Tuple[Dict[int, str], List[str]]:
+    """
+    Pairs the photos in a folder with pets.
+
+    Args:
+        folder: Directory of photos (not searched recursively)
+        pets: (id, name) of every pet
+        mapping_csv: Optional CSV with "filename" and "pet_id" columns; when given,
+            only listed files are used and naming conventions are ignored
+
+    Raises:
+        ValueError: If the mapping CSV lacks a filename or pet_id column
+
+    Returns:
+        Tuple of ({pet_id: photo path}, [unmatched file names]). When several files
+        match one pet, the last one in name order wins.
+    """
+    names = {pet_id: _normalize_name(name) for pet_id, name in pets}
+    by_name = {}
+    for pet_id, name in names.items():
+        by_name.setdefault(name, []).append(pet_id)
+
+    mapping = _read_mapping(mapping_csv) if mapping_csv else None
+
+    matches, unmatched = {}, []
+    for filename in sorted(os.listdir(folder)):
+        stem, ext = os.path.splitext(filename)
+        if ext.lower() not in PHOTO_EXTENSIONS:
+            continue
+        if mapping is not None:
+            pet_id = int(mapping[filename]) if mapping.get(filename, "").isdigit() else None
+        else:
+            stem = stem.lower()
+            found = ID_PATTERN.match(stem)
+            name_id = None if found else NAME_ID_PATTERN.match(stem)
+            if found:
+                candidates = [int(found.group(1))]
+            elif name_id and names.get(int(name_id.group(2))) == _normalize_name(name_id.group(1)):
+                candidates = [int(name_id.group(2))]
+            else:
+                candidates = by_name.get(_normalize_name(stem), [])
+            pet_id = candidates[0] if len(candidates) == 1 else None
+        if pet_id in names:
+            matches[pet_id] = os.path.join(folder, filename)
+        else:
+            unmatched.append(filename)
+    return matches, unmatched
+
+
+def _prepare_photo(src_path: str, staged_path: str, policy: dict) -> str:
+    """
+    Worker: decodes a photo, crops it to the centred square the uploader produces,
+    and encodes it under the storage policy into the staging directory.
+    """
+    with Image.open(src_path) as image:
+        image.draft("RGB", (policy["max_dimension"], policy["max_dimension"]))
+        image = ImageOps.exif_transpose(image)
+        edge = min(min(image.size), policy["max_dimension"])
+        image = ImageOps.fit(image, (edge, edge), Image.LANCZOS)
+    save_for_storage(image, staged_path, policy)
+    return staged_path
+
+
+def ingest_photos(folder: str, mapping_csv: Optional[str] = None, db_path: str = None,
+                  max_workers: Optional[int] = None, policy: dict = None) -> dict:
+    """
+    Attaches a folder of photos to existing pets (see match_photos).
+
+    Photos are prepared in a process pool, then every pets row is updated in one
+    transaction through PetController.attach_images, the same staged path the
+    add-pet form uses.
+
+    Returns:
+        {"attached": count, "unmatched": [file names], "failed": [file names]}
+    """
+    policy = IMAGE_POLICY if policy is None else policy
+    controller = PetController(db_path)
+    pets = connection_pool.get(controller.db_path).execute("SELECT id, name FROM pets").fetchall()
+    matches, unmatched = match_photos(folder, pets, mapping_csv)
+
+    staged, failed = {}, []
+    ext = storage_extension(policy)
+
+    def fail(pet_id, staged_path, error):
+        # A bad photo only costs itself; a partly written staged file is removed
+        failed.append(os.path.basename(matches[pet_id]))
+        print(f"⚠️ Could not read {matches[pet_id]}: {error}")
+        if staged_path and os.path.exists(staged_path):
+            os.remove(staged_path)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {}
+        for pet_id, src_path in matches.items():
+            staged_path = controller.image_store.new_staging_path(ext)
+            try:
+                futures[pet_id] = (pool.submit(_prepare_photo, src_path, staged_path, policy), staged_path)
+            except Exception as e:
+                # e.g. BrokenProcessPool once a worker process died
+                fail(pet_id, staged_path, e)
+        for pet_id, (future, staged_path) in futures.items():
+            try:
+                staged[pet_id] = future.result()
+            except Exception as e:
+                fail(pet_id, staged_path, e)
+
+    return {"attached": controller.attach_images(staged), "unmatched": unmatched, "failed": failed}
+
+
+# Standalone run: python -m backend.services.photo_ingest FOLDER [--csv mapping.csv]
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Attach a folder of photos to existing pets.")
+    parser.add_argument("folder")
+    parser.add_argument("--csv", dest="mapping_csv", help="CSV with filename,pet_id columns")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    result = ingest_photos(args.folder, args.mapping_csv, max_workers=args.workers)
+    print(f"✅ Attached {result['attached']} photo(s)")
+    for filename in result["unmatched"]:
+        print(f"   No pet matched: {filename}")
+    for filename in result["failed"]:
+        print(f"   Unreadable: {filename}")
@@ -0,0 +1,37 @@
+# File: backend/services/storage_profile.py
+import sqlite3
+from typing import Iterable
+
+# Tuned settings shared by every PetTrackr database.
+#   journal_mode WAL  - readers no longer block on a writer (persistent, stored in the file)
+#   synchronous NORMAL - safe with WAL; fsync on checkpoint instead of every commit
+#   busy_timeout      - wait for a competing writer instead of failing with "database is locked"
+#   cache_size        - negative values are KiB, so -16000 is about 16 MB of page cache
+#   mmap_size         - read pages through a memory map instead of read() calls
+STORAGE_PROFILE = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    "cache_size": -16000,
+    "mmap_size": 64 * 1024 * 1024,
+}
+
+# Pragmas that belong to a single schema (main or an ATTACHed database).
+PER_SCHEMA_PRAGMAS = ("journal_mode", "synchronous", "cache_size", "mmap_size")
+
+
+def apply_storage_profile(conn: sqlite3.Connection, schemas: Iterable[str] = ("main",),
+                          profile: dict = None) -> None:
+    """
+    Applies the storage profile to a connection and each of its schemas.
+
+    Must run outside a transaction, since journal_mode cannot change inside one.
+    In-memory databases silently keep their "memory" journal.
+    """
+    profile = STORAGE_PROFILE if profile is None else profile
+    if "busy_timeout" in profile:
+        conn.execute(f"PRAGMA busy_timeout = {int(profile['busy_timeout'])}")
+    for schema in schemas:
+        for name in PER_SCHEMA_PRAGMAS:
+            if name in profile:
+                conn.execute(f"PRAGMA {schema}.{name} = {profile[name]}")
@@ -5,11 +5,28 @@ from PIL import Image, ImageTk, ImageOps
 import os
 import uuid
 from math import degrees, radians
+from backend.services.image_service import save_for_storage, storage_extension
+from backend.services.image_store import ImageStore
+
+# Rotations are multiples of 90°, which transpose does losslessly and far faster than rotate()
+ROTATIONS = {
+    90: Image.Transpose.ROTATE_90,
+    180: Image.Transpose.ROTATE_180,
+    270: Image.Transpose.ROTATE_270,
+}
+
+# Smallest preview pyramid level; below this the canvas would be upscaling
+PREVIEW_MIN_SIDE = 256
+
+# Interactive redraws are coalesced to at most one per display frame (~60 Hz)
+REDRAW_FRAME_MS = 16
 
 class ImageUploader(ctk.CTkFrame):
-    def __init__(self, parent, temp_dir="backend/data/temp"):
+    def __init__(self, parent, temp_dir=None):
         super().__init__(parent)
-        self.temp_dir = temp_dir
+        # Saved edits go to the image store's staging directory, from where the
+        # pet controller renames them into place after the pet is committed
+        self.temp_dir = temp_dir or ImageStore().staging_dir
         self.image_path = None
         self.original_image = None
         self.current_image = None
@@ -20,6 +37,11 @@ class ImageUploader(ctk.CTkFrame):
         self.zoom_factor = 1.0
         self.min_zoom = 0.5  # Can now zoom out to 50%
         self.max_zoom = 3.0
+        self.preview_levels = []  # current_image halved repeatedly, for interactive redraws
+        self._rotated_levels = None
+        self._levels_angle = None
+        self._rendered = None  # (render key, rendered region, canvas item) of the last draw
+        self._redraw_after_id = None
         
         # Create widgets
         self.image_status = ctk.CTkLabel(self, text="📂 No image selected.", font=("Segoe UI", 10))
@@ -114,6 +136,7 @@ class ImageUploader(ctk.CTkFrame):
         try:
             self.original_image = Image.open(path).convert("RGB")
             self.current_image = self.original_image.copy()
+            self._build_preview_pyramid()
             self.rotation_angle = 0
             self.image_offset = [0, 0]
             self.zoom_factor = 1.0
@@ -126,24 +149,92 @@ class ImageUploader(ctk.CTkFrame):
             self.image_status.configure(text=f"❌ Error: {str(e)}")
             self.disable_controls()
     
+    @staticmethod
+    def _rotate(img, angle):
+        """Same result as img.rotate(angle, expand=True) for the 90° steps the editor uses."""
+        transpose = ROTATIONS.get(angle % 360)
+        return img.transpose(transpose) if transpose is not None else img
+
+    def _build_preview_pyramid(self):
+        """
+        Halves current_image with Image.reduce until it is small, so pan and zoom
+        redraws resample a level close to the on-screen size instead of the full photo.
+        """
+        levels = [self.current_image]
+        while min(levels[-1].size) >= PREVIEW_MIN_SIDE * 2:
+            levels.append(levels[-1].reduce(2))
+        self.preview_levels = levels
+        self._rotated_levels = None
+        self._levels_angle = None
+        self._rendered = None
+
+    def _current_preview_levels(self):
+        """Pyramid levels with the current display rotation applied (recomputed only when it changes)."""
+        angle = self.rotation_angle % 360
+        if self._levels_angle != angle:
+            self._rotated_levels = [self._rotate(level, angle) for level in self.preview_levels]
+            self._levels_angle = angle
+        return self._rotated_levels
+
+    def request_redraw(self):
+        """
+        Schedules display_image for the next display frame. Pan and zoom events that
+        arrive before then only update state, so a fast drag draws the latest state
+        once per frame instead of once per event.
+        """
+        if self._redraw_after_id is None:
+            self._redraw_after_id = self.after(REDRAW_FRAME_MS, self._flush_redraw)
+
+    def _flush_redraw(self):
+        self._redraw_after_id = None
+        self.display_image()
+
+    def _cancel_redraw(self):
+        if self._redraw_after_id is not None:
+            self.after_cancel(self._redraw_after_id)
+            self._redraw_after_id = None
+
     def display_image(self):
         """Display the current image on canvas with square crop frame"""
+        self._cancel_redraw()
         if not self.current_image:
             return
-            
-        # Clear canvas
-        self.canvas.delete("all")
         
         # Get canvas dimensions
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
         
-        # Create a working copy of the image
-        img = self.current_image.copy()
+        # Full-resolution level with rotation applied for display (doesn't modify original)
+        levels = self._current_preview_levels()
+        img = levels[0]
+            
+        # Calculate the image size after zoom
+        img_width, img_height = img.size
+        zoomed_width = int(img_width * self.zoom_factor)
+        zoomed_height = int(img_height * self.zoom_factor)
+        
+        # Calculate the position to display the image with current offset
+        img_x = (canvas_width - zoomed_width) / 2 + self.image_offset[0]
+        img_y = (canvas_height - zoomed_height) / 2 + self.image_offset[1]
+        
+        # Part of the zoomed image inside the canvas, in zoomed-image coordinates
+        visible = (
+            max(-img_x, 0), max(-img_y, 0),
+            min(canvas_width - img_x, zoomed_width), min(canvas_height - img_y, zoomed_height),
+        )
+        
+        # Only the offset changed and the last render still covers the visible part: move it
+        render_key = (self._levels_angle, self.zoom_factor, canvas_width, canvas_height)
+        rendered = self._rendered
+        if (rendered is not None and rendered[0] == render_key and rendered[2] is not None
+                and all(rendered[1][i] <= visible[i] for i in (0, 1))
+                and all(rendered[1][i] >= visible[i] for i in (2, 3))):
+            self.canvas.coords(rendered[2], img_x + rendered[1][0], img_y + rendered[1][1])
+            return
         
-        # Apply rotation for display (doesn't modify original)
-        if self.rotation_angle != 0:
-            img = img.rotate(self.rotation_angle, expand=True)
+        # Clear canvas
+        self.canvas.delete("all")
+        self._rendered = None
         
         # Calculate the size of the square crop area (80% of canvas size)
         square_size = min(canvas_width, canvas_height) * 0.8
@@ -155,31 +246,33 @@ class ImageUploader(ctk.CTkFrame):
         self.crop_x2 = self.crop_x1 + square_size
         self.crop_y2 = self.crop_y1 + square_size
         
-        # Draw the square crop area (always visible after upload)
-        self.canvas.create_rectangle(
-            self.crop_x1, self.crop_y1,
-            self.crop_x2, self.crop_y2,
-            outline="red", width=2, dash=(5,5))
+        image_item = None
+        if visible[2] > visible[0] and visible[3] > visible[1]:
+            # Render the visible part plus one canvas of margin on each side,
+            # so the following pan steps only need to move the item
+            region = (
+                max(visible[0] - canvas_width, 0), max(visible[1] - canvas_height, 0),
+                min(visible[2] + canvas_width, zoomed_width), min(visible[3] + canvas_height, zoomed_height),
+            )
+            region = tuple(int(round(edge)) for edge in region)
             
-        # Calculate the image size after zoom
-        img_width, img_height = img.size
-        zoomed_width = int(img_width * self.zoom_factor)
-        zoomed_height = int(img_height * self.zoom_factor)
-        
-        # Resize the image with the current zoom factor
-        img = img.resize((zoomed_width, zoomed_height), Image.Resampling.LANCZOS)
-        
-        # Calculate the position to display the image with current offset
-        img_x = (canvas_width - zoomed_width) / 2 + self.image_offset[0]
-        img_y = (canvas_height - zoomed_height) / 2 + self.image_offset[1]
-        
-        # Convert to PhotoImage
-        self.tk_image = ImageTk.PhotoImage(img)
-        
-        # Display the image
-        self.canvas.create_image(img_x, img_y, anchor="nw", image=self.tk_image)
+            # Smallest pyramid level that is still at least as large as the zoomed image,
+            # resampled with a fast filter; LANCZOS is kept for apply_crop/save_image
+            level = next((lvl for lvl in reversed(levels) if lvl.width >= zoomed_width), img)
+            scale = level.width / zoomed_width
+            preview = level.resize(
+                (region[2] - region[0], region[3] - region[1]),
+                Image.Resampling.BILINEAR,
+                box=tuple(edge * scale for edge in region)
+            )
+            
+            # Convert to PhotoImage and display it
+            self.tk_image = ImageTk.PhotoImage(preview)
+            image_item = self.canvas.create_image(
+                img_x + region[0], img_y + region[1], anchor="nw", image=self.tk_image)
+            self._rendered = (render_key, region, image_item)
         
-        # Draw the square crop area again on top
+        # Draw the square crop area on top (always visible after upload)
         self.canvas.create_rectangle(
             self.crop_x1, self.crop_y1,
             self.crop_x2, self.crop_y2,
@@ -211,7 +304,7 @@ class ImageUploader(ctk.CTkFrame):
         self.image_offset[1] += dy
         
         self.pan_start = (event.x, event.y)
-        self.display_image()
+        self.request_redraw()
     
     def on_pan_end(self, event):
         """Handle panning end"""
@@ -244,7 +337,7 @@ class ImageUploader(ctk.CTkFrame):
         if new_zoom != self.zoom_factor:
             self.zoom_factor = new_zoom
             self.zoom_label.configure(text=f"Zoom: {int(self.zoom_factor * 100)}%")
-            self.display_image()
+            self.request_redraw()
     
     def apply_crop(self):
         """Apply the crop to the current image"""
@@ -257,7 +350,7 @@ class ImageUploader(ctk.CTkFrame):
             
             # Apply rotation if needed
             if self.rotation_angle != 0:
-                img = img.rotate(self.rotation_angle, expand=True)
+                img = self._rotate(img, self.rotation_angle)
             
             # Get image and canvas dimensions
             img_width, img_height = img.size
@@ -294,6 +387,7 @@ class ImageUploader(ctk.CTkFrame):
             
             # Update the current image
             self.current_image = cropped_img
+            self._build_preview_pyramid()
             self.rotation_angle = 0  # Reset rotation since we've applied it
             self.image_offset = [0, 0]
             self.zoom_factor = 1.0
@@ -312,6 +406,7 @@ class ImageUploader(ctk.CTkFrame):
         """Reset all edits to original image"""
         if self.original_image:
             self.current_image = self.original_image.copy()
+            self._build_preview_pyramid()
             self.rotation_angle = 0
             self.image_offset = [0, 0]
             self.zoom_factor = 1.0
@@ -352,12 +447,12 @@ class ImageUploader(ctk.CTkFrame):
             os.makedirs(self.temp_dir, exist_ok=True)
             
             # Generate unique filename
-            ext = ".jpg"  # Save as JPEG by default
-            unique_name = f"{uuid.uuid4().hex[:8]}{ext}"
+            ext = storage_extension()  # Encoded once, in the image store's format
+            unique_name = f"{uuid.uuid4().hex}{ext}"
             final_path = os.path.join(self.temp_dir, unique_name)
             
             # Save the final image
-            final_image.save(final_path, quality=95)
+            save_for_storage(final_image, final_path)
             self.image_path = final_path
             self.image_status.configure(text="✅ Image saved and ready to use")
             return final_path
@@ -376,6 +471,11 @@ class ImageUploader(ctk.CTkFrame):
         self.image_path = None
         self.original_image = None
         self.current_image = None
+        self._cancel_redraw()
+        self.preview_levels = []
+        self._rotated_levels = None
+        self._levels_angle = None
+        self._rendered = None
         self.rotation_angle = 0
         self.image_offset = [0, 0]
         self.zoom_factor = 1.0
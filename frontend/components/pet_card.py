@@ -1,7 +1,8 @@
 # frontend/components/pet_card.py
 import os
-from PIL import Image
 import customtkinter as ctk
+from backend.services.image_service import thumbnail_for, thumbnail_path
+from frontend.services.image_cache import load_ctk_image
 from frontend.style.style import (
     create_label, 
     create_frame, 
@@ -13,7 +14,10 @@ from frontend.style.style import (
 
 class PetCard(ctk.CTkFrame):
 
-    def __init__(self, master, pet, image_store, owner=None, on_click=None, *args, **kwargs):
+    # Optional PetSummary (SQL aggregates); subclasses set it before building the card
+    summary = None
+
+    def __init__(self, master, pet, owner=None, on_click=None, *args, on_hover=None, **kwargs):
         super().__init__(
             master,
             fg_color="white",
@@ -25,8 +29,8 @@ class PetCard(ctk.CTkFrame):
         )
         self.pet = pet
         self.owner = owner
-        self.image_store = image_store
         self.on_click = on_click
+        self.on_hover = on_hover
         self.configure(width=260)
         self.columnconfigure(0, weight=1)
         self._build_card()
@@ -37,6 +41,9 @@ class PetCard(ctk.CTkFrame):
     def _add_hover_effects(self):
         def on_enter(e):
             self.configure(border_color="#3b8ed0", fg_color="#f7faff")
+            # Lets the view start loading what a click on this card will need
+            if self.on_hover:
+                self.on_hover(self.pet)
         def on_leave(e):
             self.configure(border_color="#e0e0e0", fg_color="white")
         self.bind("<Enter>", on_enter)
@@ -69,6 +76,7 @@ class PetCard(ctk.CTkFrame):
             compound="top"
         )
         label_image.pack()
+        self._image_label = label_image
 
         # Info section
         info_frame = create_frame(container, "white")
@@ -88,6 +96,7 @@ class PetCard(ctk.CTkFrame):
             font=get_card_title_font()
         )
         label_name.pack(side="left")
+        self._name_label = label_name
 
         # Details with icon-text pairs
         details_frame = create_frame(info_frame, "white")
@@ -103,12 +112,13 @@ class PetCard(ctk.CTkFrame):
             width=24,
             anchor="w"
         ).pack(side="left")
-        create_label(
+        self._breed_label = create_label(
             breed_row, 
             self.pet.breed or "Unknown", 
             font=get_card_detail_font(),
             anchor="w"
-        ).pack(side="left", padx=5)
+        )
+        self._breed_label.pack(side="left", padx=5)
 
         # Birthdate row
         birth_row = create_frame(details_frame, "white")
@@ -120,12 +130,13 @@ class PetCard(ctk.CTkFrame):
             width=24,
             anchor="w"
         ).pack(side="left")
-        create_label(
+        self._birth_label = create_label(
             birth_row, 
             self.pet.birthdate, 
             font=get_card_detail_font(),
             anchor="w"
-        ).pack(side="left", padx=5)
+        )
+        self._birth_label.pack(side="left", padx=5)
 
         # Age row
         age_row = create_frame(details_frame, "white")
@@ -137,40 +148,72 @@ class PetCard(ctk.CTkFrame):
             width=24,
             anchor="w"
         ).pack(side="left")
-        create_label(
+        self._age_label = create_label(
             age_row, 
             self.pet.age(), 
             font=get_card_detail_font(),
             anchor="w"
-        ).pack(side="left", padx=5)
+        )
+        self._age_label.pack(side="left", padx=5)
 
-        # Owner row (only if owner exists)
-# In the owner section (replace the existing owner_row code)
+        # Owner row (only shown if owner exists; kept so show_pet can reuse it)
+        self._owner_row = create_frame(details_frame, "white")
+        ctk.CTkLabel(
+            self._owner_row, 
+            text="👤", 
+            font=get_card_icon_font(),
+            width=24,
+            anchor="w"
+        ).pack(side="left")
+        self._owner_label = create_label(
+            self._owner_row, 
+            self._owner_text(), 
+            font=get_card_detail_font(),
+            anchor="w"
+        )
+        self._owner_label.pack(side="left", padx=5)
         if self.owner:
-            
-            owner_row = create_frame(details_frame, "white")
-            owner_row.pack(fill="x", pady=3)
-            ctk.CTkLabel(
-                owner_row, 
-                text="👤", 
-                font=get_card_icon_font(),
-                width=24,
-                anchor="w"
-            ).pack(side="left")
-            create_label(
-                owner_row, 
-                f"{self.owner.name} ({self.owner.contact_number})", 
-                font=get_card_detail_font(),
-                anchor="w"
-            ).pack(side="left", padx=5)
+            self._owner_row.pack(fill="x", pady=3)
+
+    def _owner_text(self):
+        return f"{self.owner.name} ({self.owner.contact_number})" if self.owner else ""
+
+    def show_pet(self, pet, owner=None):
+        """
+        Re-points the card at another pet without rebuilding its widgets, so a
+        virtualized grid can recycle cards while scrolling. Only for plain
+        PetCards; the record card subclasses build a different layout.
+        """
+        self.pet = pet
+        self.owner = owner
+        self._image_label.configure(image=self._get_pet_thumbnail())
+        self._name_label.configure(text=pet.name)
+        self._breed_label.configure(text=pet.breed or "Unknown")
+        self._birth_label.configure(text=pet.birthdate)
+        self._age_label.configure(text=pet.age())
+        self._owner_label.configure(text=self._owner_text())
+        if owner:
+            self._owner_row.pack(fill="x", pady=3)
+        else:
+            self._owner_row.pack_forget()
+
+    def _build_summary_row(self, parent):
+        """Shows record counts and spending from self.summary, if the tab supplied one."""
+        if self.summary is None:
+            return
+        create_label(
+            parent,
+            str(self.summary),
+            font=get_card_detail_font(),
+            anchor="w"
+        ).pack(fill="x", pady=(8, 0))
 
     def _get_pet_thumbnail(self):
-        try:
-            img_path = os.path.join("backend", "data", self.pet.image_path)
-            image = Image.open(img_path).resize((140, 140))  # Larger image
-        except Exception:
-            image = Image.new("RGB", (140, 140), color="lightgray")
-
-        thumb = ctk.CTkImage(light_image=image, dark_image=image, size=(140, 140))
-        self.image_store.append(thumb)
-        return thumb
\ No newline at end of file
+        # Shared cached image, or a placeholder filled in once the 140x140
+        # derivative is decoded off the Tk thread
+        return load_ctk_image(
+            thumbnail_path(self.pet, "card"),
+            (140, 140),
+            widget=self,
+            source=lambda pet=self.pet: thumbnail_for(pet, "card")
+        )
\ No newline at end of file
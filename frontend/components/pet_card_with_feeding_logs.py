@@ -12,9 +12,12 @@ from backend.controllers.feeding_log_controller import FeedingLogController
 from backend.services.daycare_prices import compute_total_fee
 
 class PetCardWithFeedingLogs(PetCard):
-    def __init__(self, master, pet, image_store, owner=None, on_click=None, *args, **kwargs):
-        self.feeding_logs = FeedingLogController().get_by_pet_id(pet.id)
-        super().__init__(master, pet, image_store, owner, on_click, *args, **kwargs)
+    def __init__(self, master, pet, owner=None, on_click=None, feeding_logs=None, summary=None,
+                 *args, **kwargs):
+        # Tabs pass logs loaded in one batch; fall back to a per-pet query otherwise
+        self.feeding_logs = feeding_logs if feeding_logs is not None else FeedingLogController().get_by_pet_id(pet.id)
+        self.summary = summary
+        super().__init__(master, pet, owner, on_click, *args, **kwargs)
 
     def _build_card(self):
         # Main container
@@ -129,6 +132,8 @@ class PetCardWithFeedingLogs(PetCard):
         )
         label_image.pack(anchor="center", pady=5)
 
+        self._build_summary_row(container)
+
         # --- BELOW: Feeding Logs Section ---
         logs_frame = create_frame(container, "white")
         logs_frame.pack(fill="x", pady=(10, 0))
@@ -12,10 +12,14 @@ from frontend.style.style import (
 from backend.controllers.grooming_controller import GroomingLogsController
 
 class PetCardWithGroomingLogs(PetCard):
-    def __init__(self, master, pet, image_store, owner=None, on_click=None, *args, **kwargs):
-        # FIX: Use GroomingLogsController and correct method to get logs
-        self.grooming_logs = GroomingLogsController().get_grooming_logs_for_pet(pet.id)
-        super().__init__(master, pet, image_store, owner, on_click, *args, **kwargs)
+    def __init__(self, master, pet, owner=None, on_click=None, grooming_logs=None, summary=None,
+                 *args, **kwargs):
+        # Tabs pass logs loaded in one batch; fall back to a per-pet query otherwise
+        if grooming_logs is None:
+            grooming_logs = GroomingLogsController().get_grooming_logs_for_pet(pet.id)
+        self.grooming_logs = grooming_logs
+        self.summary = summary
+        super().__init__(master, pet, owner, on_click, *args, **kwargs)
 
     def _build_card(self):
         # Main container
@@ -130,6 +134,8 @@ class PetCardWithGroomingLogs(PetCard):
         )
         label_image.pack(anchor="center", pady=5)
 
+        self._build_summary_row(container)
+
         # --- BELOW: Grooming Logs Section ---
         logs_frame = create_frame(container, "white")
         logs_frame.pack(fill="x", pady=(10, 0))
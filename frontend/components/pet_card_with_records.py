@@ -12,11 +12,14 @@ from backend.controllers.vaccination_controller import VaccinationController
 from backend.controllers.vet_visit_controller import VetVisitController
 
 class PetCardWithRecords(PetCard):
-    def __init__(self, master, pet, image_store, owner=None, on_click=None, *args, **kwargs):
-        self.vaccinations = VaccinationController().get_by_pet_id(pet.id)
-        self.vet_visits = VetVisitController().get_by_pet_id(pet.id)
+    def __init__(self, master, pet, owner=None, on_click=None,
+                 vaccinations=None, vet_visits=None, summary=None, *args, **kwargs):
+        # Tabs pass records loaded in one batch; fall back to per-pet queries otherwise
+        self.vaccinations = vaccinations if vaccinations is not None else VaccinationController().get_by_pet_id(pet.id)
+        self.vet_visits = vet_visits if vet_visits is not None else VetVisitController().get_by_pet_id(pet.id)
+        self.summary = summary
         self.on_click = on_click  # Save the callback
-        super().__init__(master, pet, image_store, owner, on_click, *args, **kwargs)
+        super().__init__(master, pet, owner, on_click, *args, **kwargs)
 
     def _build_card(self):
         # Main container
@@ -132,6 +135,8 @@ class PetCardWithRecords(PetCard):
         )
         label_image.pack(anchor="center", pady=5)
 
+        self._build_summary_row(container)
+
         # --- BELOW: Vaccination and Vet Visit Records Section ---
         records_frame = create_frame(container, "white")
         records_frame.pack(fill="x", pady=(10, 0))
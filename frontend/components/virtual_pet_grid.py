@@ -0,0 +1,114 @@
+# frontend/components/virtual_pet_grid.py
+import customtkinter as ctk
+from frontend.components.pet_card import PetCard
+
+
+class VirtualPetGrid(ctk.CTkFrame):
+    """
+    Scrollable grid of PetCards that only builds the cards in and near the viewport.
+
+    Every row has the same height, so the visible index range follows directly
+    from the scroll position and the scroll region can be sized from the pet
+    count alone. Cards that scroll out of range are kept and re-pointed at the
+    pets scrolling in (PetCard.show_pet) instead of being destroyed, so scrolling
+    never rebuilds widget trees. Pets are read through a PetPageSource.
+    """
+
+    COLUMNS = 4
+    ROW_HEIGHT = 340
+    CARD_PADDING = 12
+    OVERSCAN_ROWS = 1
+    SCROLL_INCREMENT = 60
+    BACKGROUND = "#f5f7fa"
+
+    def __init__(self, master, source, on_card_click=None, on_card_hover=None, **kwargs):
+        super().__init__(master, fg_color=self.BACKGROUND, **kwargs)
+        self.source = source
+        self.on_card_click = on_card_click
+        self.on_card_hover = on_card_hover
+        self._cards = {}    # pet index -> card showing it
+        self._windows = {}  # card -> canvas window item
+        self._spare = []    # built cards not showing any pet
+        self._refresh_pending = False
+
+        self.canvas = ctk.CTkCanvas(self, bg=self.BACKGROUND, highlightthickness=0, bd=0,
+                                    yscrollincrement=self.SCROLL_INCREMENT)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.canvas.pack(side="left", fill="both", expand=True, padx=(0, 4))
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 8))
+        self.canvas.bind("<Configure>", lambda e: self._relayout())
+
+    @property
+    def row_count(self) -> int:
+        return -(-len(self.source) // self.COLUMNS)
+
+    def reload(self):
+        """Re-reads the pet count and redraws every visible card."""
+        self.source.reload()
+        self._spare.extend(self._cards.values())
+        self._cards.clear()
+        self._relayout()
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.request_refresh()
+
+    def request_refresh(self):
+        """Updates the visible cards once the current burst of scroll events is handled."""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self._refresh)
+
+    def _relayout(self):
+        width = self.canvas.winfo_width()
+        self.canvas.configure(scrollregion=(0, 0, width, self.row_count * self.ROW_HEIGHT))
+        for index, card in self._cards.items():
+            self._place(card, index)
+        self.request_refresh()
+
+    def _place(self, card, index):
+        row, column = divmod(index, self.COLUMNS)
+        column_width = self.canvas.winfo_width() / self.COLUMNS
+        window = self._windows[card]
+        self.canvas.coords(window, column * column_width + self.CARD_PADDING,
+                           row * self.ROW_HEIGHT + self.CARD_PADDING)
+        self.canvas.itemconfigure(window, width=max(int(column_width) - 2 * self.CARD_PADDING, 1),
+                                  height=self.ROW_HEIGHT - 2 * self.CARD_PADDING)
+
+    def _visible_indexes(self) -> range:
+        top = self.canvas.canvasy(0)
+        first_row = max(int(top // self.ROW_HEIGHT) - self.OVERSCAN_ROWS, 0)
+        last_row = int((top + self.canvas.winfo_height()) // self.ROW_HEIGHT) + self.OVERSCAN_ROWS
+        return range(first_row * self.COLUMNS, min((last_row + 1) * self.COLUMNS, len(self.source)))
+
+    def _refresh(self):
+        self._refresh_pending = False
+        if not self.winfo_exists():
+            return
+        wanted = self._visible_indexes()
+
+        # Cards that left the range are recycled for the pets entering it
+        for index in [index for index in self._cards if index not in wanted]:
+            self._spare.append(self._cards.pop(index))
+
+        for index in wanted:
+            if index in self._cards:
+                continue
+            item = self.source.get(index)
+            if item is None:
+                continue
+            pet, owner = item
+            if self._spare:
+                card = self._spare.pop()
+                card.show_pet(pet, owner)
+            else:
+                card = PetCard(self.canvas, pet, owner=owner, on_click=self.on_card_click,
+                               on_hover=self.on_card_hover)
+                self._windows[card] = self.canvas.create_window(0, 0, window=card, anchor="nw")
+            self._cards[index] = card
+            self._place(card, index)
+
+        # Spare cards wait outside the scroll region until they are needed again
+        for card in self._spare:
+            self.canvas.coords(self._windows[card], -10000, -10000)
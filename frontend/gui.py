@@ -1,3 +1,4 @@
+import threading
 import customtkinter as ctk
 from frontend.views.dashboard import create_dashboard
 from frontend.views.add_pet_view import create_add_pet_view
@@ -7,7 +8,28 @@ from frontend.views.vaccination_visits_tab import VaccinationVisitsTab
 from frontend.views.view_feeding_logs_tab import create_view_feeding_logs_tab
 from frontend.views.grooming_logs_tab import create_grooming_logs_tab  # <-- add this import
 from frontend.style.style import configure_table_style
+from frontend.services.image_loader import image_loader
+from frontend.services.image_cache import image_cache
+from frontend.services.view_cache import ViewCache
+from frontend.services.task_runner import task_runner
+from frontend.services.profile_prefetch import profile_prefetcher
 from backend.controllers.grooming_controller import GroomingLogsController
+from backend.services.image_store import ImageStore
+from backend.services.model_cache import model_cache
+
+# How often abandoned staged uploads are swept from the image store
+STAGING_SWEEP_MS = 10 * 60 * 1000
+
+# Data kinds (model_cache tag names) each cached view shows; views not listed,
+# like the add-pet form, are rebuilt on every visit
+VIEW_DEPENDENCIES = {
+    "dashboard": ("pets", "vaccinations", "vet_visits", "feeding_logs", "grooming_logs"),
+    "view_pets": ("pets", "pet", "owner", "owners"),
+    "pet_profile": ("pet", "owner", "vaccinations", "vet_visits", "feeding_logs", "grooming_logs"),
+    "vaccination_visits": ("pets", "pet", "owner", "vaccinations", "vet_visits"),
+    "view_feeding_logs": ("pets", "pet", "owner", "feeding_logs"),
+    "grooming_logs": ("pets", "pet", "owner", "grooming_logs"),
+}
 
 def launch_gui():
     """Initializes the main application window and sets up dynamic view navigation."""
@@ -25,16 +47,37 @@ def launch_gui():
 
     navigation_stack = []
 
+    # Built views stay alive while hidden; data changes mark the affected ones stale
+    view_cache = ViewCache()
+    model_cache.add_listener(view_cache.on_model_invalidated)
+    model_cache.add_listener(profile_prefetcher.on_model_invalidated)
+
     def show_frame(name: str, from_back=False, **kwargs):
         """Show different frames based on the name."""
         # Only push to stack if not coming from a back action
         if not from_back:
             navigation_stack.append((name, kwargs.copy()))
 
-        # Clear the current frame
-        for widget in main_frame.winfo_children():
-            widget.destroy()
+        key = None
+        if name in VIEW_DEPENDENCIES:
+            pet = kwargs.get("pet")
+            key = (name, pet.id) if name == "pet_profile" and pet else name
+
+        def build():
+            view_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+            build_view(view_frame, name, **kwargs)
+            return view_frame
+
+        # Loads and card rendering of the view being left are stopped; if either
+        # was unfinished the view is marked stale, so it is rebuilt on the next visit
+        left_frame = view_cache.current_frame
+        if left_frame is not None and task_runner.cancel_group(left_frame):
+            view_cache.discard(view_cache.current_key)
+
+        view_cache.show(key, build, VIEW_DEPENDENCIES.get(name, ()))
 
+    def build_view(main_frame, name: str, **kwargs):
+        """Builds a view into its own container frame."""
         if name == "dashboard":
             create_dashboard(main_frame, show_frame)
         elif name == "add_pet":
@@ -43,7 +86,9 @@ def launch_gui():
             create_view_pets_tab(main_frame, show_frame)
         elif name == "pet_profile":
             pet = kwargs.get("pet")
-            grooming_logs = GroomingLogsController().get_grooming_logs_for_pet(pet.id) if pet else []
+            grooming_logs = kwargs.get("grooming_logs")
+            if grooming_logs is None:
+                grooming_logs = GroomingLogsController().get_grooming_logs_for_pet(pet.id) if pet else []
             # Define a go_back function that pops the stack and shows the previous frame
             def go_back():
                 if len(navigation_stack) > 1:
@@ -76,4 +121,37 @@ def launch_gui():
     configure_table_style()
 
     show_frame("dashboard")
-    root.mainloop()
\ No newline at end of file
+
+    staging_store = ImageStore()
+
+    def sweep_staging():
+        # Deleting files stays off the Tk thread
+        threading.Thread(target=staging_store.cleanup_staging, daemon=True).start()
+        root.after(STAGING_SWEEP_MS, sweep_staging)
+
+    sweep_staging()
+
+    def migrate_legacy_images():
+        def on_done(moved):
+            if moved:
+                print(f"🖼️ Moved {moved} pet image(s) into the content-addressed store")
+
+        def on_error(error):
+            print(f"⚠️ Could not move legacy pet images: {error}")
+
+        # Rewritten pets are invalidated in model_cache, so affected views are rebuilt
+        task_runner.submit(staging_store.migrate_legacy_images, on_done, widget=root, on_error=on_error)
+
+    # Photos saved before the content-addressed store are moved into it once the
+    # first view is painted, off the launch path (a no-op when nothing is left)
+    root.after_idle(migrate_legacy_images)
+    try:
+        root.mainloop()
+    finally:
+        model_cache.remove_listener(view_cache.on_model_invalidated)
+        model_cache.remove_listener(profile_prefetcher.on_model_invalidated)
+        image_loader.shutdown()
+        task_runner.shutdown()
+        stats = image_cache.stats()
+        print(f"🖼️ Image cache hits: {stats['hits']}, misses: {stats['misses']}, "
+              f"resident: {stats['resident_bytes'] / (1024 * 1024):.1f} MB")
\ No newline at end of file
@@ -0,0 +1,119 @@
+# File: frontend/services/image_cache.py
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+from PIL import Image
+from frontend.services.image_loader import image_loader
+
+
+def estimate_bytes(image: Image.Image) -> int:
+    """Approximate resident size of a displayed image: the PIL pixels plus Tk's 4-byte-per-pixel photo."""
+    width, height = image.size
+    return width * height * (len(image.getbands()) + 4)
+
+
+class ImageCache:
+    """
+    Process-wide LRU cache of display images shared by every view.
+
+    Keys are (path, mtime, size), so a replaced photo or a regenerated thumbnail
+    is picked up automatically while navigating between tabs reuses the images
+    already decoded. Entries are evicted least-recently-used once the total
+    estimated size exceeds max_bytes. Labels keep their own reference to the
+    image they show, so evicting an entry never blanks a visible card.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._resident_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def key(path: Optional[str], size: Tuple[int, int]) -> Optional[tuple]:
+        """Cache key for a file at a display size, or None if the file does not exist."""
+        if not path:
+            return None
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        return os.path.normcase(os.path.abspath(path)), mtime, tuple(size)
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, nbytes: int) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._resident_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, nbytes)
+            self._resident_bytes += nbytes
+            while self._resident_bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self._resident_bytes -= evicted_bytes
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._resident_bytes = 0
+
+    def stats(self) -> dict:
+        """Returns hit/miss counters, entry count and estimated resident bytes."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "resident_bytes": self._resident_bytes,
+            }
+
+
+image_cache = ImageCache()
+
+
+def load_ctk_image(path: Optional[str], size: Tuple[int, int], widget,
+                   source: Callable[[], Optional[str]] = None):
+    """
+    Returns a CTkImage for path at size: the cached one when the file is unchanged,
+    otherwise a placeholder that image_loader fills in the background and that is
+    cached once decoded.
+
+    Args:
+        path: Expected image file; may not exist yet
+        size: Display size
+        widget: Widget the image is shown in (see ImageLoader.load)
+        source: Optional callable run on the worker to produce the file when it is
+            missing (e.g. regenerating a thumbnail); defaults to path
+    """
+    import customtkinter as ctk
+
+    key = image_cache.key(path, size)
+    cached = image_cache.get(key) if key else None
+    if cached is not None:
+        return cached
+
+    placeholder = image_loader.placeholder(size)
+    ctk_image = ctk.CTkImage(light_image=placeholder, dark_image=placeholder, size=size)
+
+    def on_ready(image):
+        ctk_image.configure(light_image=image, dark_image=image)
+        ready_key = key or image_cache.key(path, size)
+        if ready_key:
+            image_cache.put(ready_key, ctk_image, estimate_bytes(image))
+
+    image_loader.load(source or path, size, on_ready, widget=widget)
+    return ctk_image
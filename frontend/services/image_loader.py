@@ -0,0 +1,68 @@
+# File: frontend/services/image_loader.py
+import os
+from typing import Callable, Optional, Tuple, Union
+from PIL import Image
+from frontend.services.task_runner import TaskRunner
+
+PathSource = Union[str, Callable[[], Optional[str]]]
+
+
+class ImageLoader:
+    """
+    Decodes pet photos in the background so building a grid of cards never
+    waits on disk or PIL.
+
+    Cards show a placeholder right away and call load(); the decoded PIL image is
+    handed to on_ready on the Tk thread by a TaskRunner with its own pool, so
+    decodes never queue behind data loads. Results for widgets destroyed in the
+    meantime (the user left the view) are dropped.
+    """
+
+    def __init__(self, max_workers: int = 4, poll_ms: int = 15, max_per_tick: int = 24):
+        self._runner = TaskRunner(max_workers, poll_ms, max_per_tick, thread_name_prefix="image-loader")
+        self._placeholders = {}
+
+    def placeholder(self, size: Tuple[int, int], color: str = "lightgray") -> Image.Image:
+        """Shared solid placeholder shown until the real image arrives."""
+        key = (size, color)
+        if key not in self._placeholders:
+            self._placeholders[key] = Image.new("RGB", size, color)
+        return self._placeholders[key]
+
+    def load(self, source: PathSource, size: Tuple[int, int],
+             on_ready: Callable[[Image.Image], None], widget) -> None:
+        """
+        Decodes an image in the background and hands it to on_ready on the Tk thread.
+
+        Args:
+            source: Image path, or a callable returning one (run on the worker, so
+                it may do slow work such as regenerating a thumbnail)
+            size: Size the decoded image is resized to when it differs
+            on_ready: Called with the PIL image; not called if decoding fails
+            widget: Widget the result belongs to; used to schedule the pump and
+                skipped once destroyed
+        """
+        def deliver(image):
+            if image is not None:
+                on_ready(image)
+
+        self._runner.submit(
+            lambda: self._decode(source, size), deliver, widget,
+            on_error=lambda e: print(f"⚠️ Could not load image: {e}")
+        )
+
+    @staticmethod
+    def _decode(source: PathSource, size: Tuple[int, int]) -> Optional[Image.Image]:
+        path = source() if callable(source) else source
+        if not path or not os.path.exists(path):
+            return None
+        with Image.open(path) as image:
+            image.draft("RGB", size)
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+        return image if image.size == size else image.resize(size, Image.BILINEAR)
+
+    def shutdown(self) -> None:
+        self._runner.shutdown()
+
+
+image_loader = ImageLoader()
@@ -0,0 +1,68 @@
+# File: frontend/services/pet_page_source.py
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+class PetPageSource:
+    """
+    Index-based access to the pets table for a virtualized view, read page by page.
+
+    Pages come from PetController.get_pets_page (keyset pagination) only when an
+    index inside them is requested. Since a keyset page can only be reached through
+    the cursor of the page before it, the cursor of every page seen is remembered;
+    jumping far ahead walks forward from the furthest known page once. At most
+    max_pages pages of pets are kept, least-recently-used first out.
+    """
+
+    def __init__(self, controller, page_size: int = 48, max_pages: int = 8, order_by: str = "id"):
+        self.controller = controller
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.order_by = order_by
+        self.reload()
+
+    def reload(self) -> None:
+        """Forgets every page and re-reads the pet count, e.g. after pets were added."""
+        self._pages = OrderedDict()
+        self._cursors = {0: None}
+        self._last_page = None
+        self._count = self.controller.count_pets()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get(self, index: int) -> Optional[Tuple[object, object]]:
+        """Returns (pet, owner) at index, or None past the end."""
+        number, offset = divmod(index, self.page_size)
+        page = self._page(number)
+        return page[offset] if offset < len(page) else None
+
+    def _page(self, number: int) -> list:
+        if number in self._pages:
+            self._pages.move_to_end(number)
+            return self._pages[number]
+
+        if self._last_page is not None and number > self._last_page:
+            return []
+        known = max(self._cursors)
+        while known < number:
+            self._fetch(known)
+            if self._last_page is not None:
+                return []
+            known += 1
+        return self._fetch(number)
+
+    def _fetch(self, number: int) -> list:
+        pets, owners, next_cursor = self.controller.get_pets_page(
+            self.page_size, self._cursors[number], self.order_by)
+        page = list(zip(pets, owners))
+        if next_cursor is None:
+            self._last_page = number
+        else:
+            self._cursors[number + 1] = next_cursor
+
+        self._pages[number] = page
+        self._pages.move_to_end(number)
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+        return page
@@ -0,0 +1,124 @@
+# File: frontend/services/profile_prefetch.py
+import time
+from collections import OrderedDict
+from typing import Callable
+from backend.controllers.vet_visit_controller import VetVisitController
+from backend.controllers.vaccination_controller import VaccinationController
+from backend.controllers.feeding_log_controller import FeedingLogController
+from backend.controllers.grooming_controller import GroomingLogsController
+from frontend.services.task_runner import task_runner
+
+# Data kinds (model_cache tag names) a profile bundle is built from
+PROFILE_KINDS = frozenset({"pet", "pets", "vaccinations", "vet_visits", "feeding_logs", "grooming_logs"})
+
+
+def load_profile_bundle(pet_id: int) -> dict:
+    """Every record list the pet profile shows, as show_frame("pet_profile") keyword arguments."""
+    return {
+        "vet_visits": VetVisitController().get_by_pet_id(pet_id),
+        "vaccinations": VaccinationController().get_by_pet_id(pet_id),
+        "feeding_logs": FeedingLogController().get_by_pet_id(pet_id),
+        "grooming_logs": GroomingLogsController().get_grooming_logs_for_pet(pet_id),
+    }
+
+
+class ProfilePrefetcher:
+    """
+    Short-lived cache of profile bundles, filled in the background while the
+    pointer rests on a pet card so the profile opens without querying on click.
+
+    Bundles expire after ttl seconds and are dropped whenever records they are
+    built from change (on_model_invalidated, registered as a model_cache
+    listener). A prefetch that was running across such a change is not stored.
+    """
+
+    def __init__(self, loader: Callable[[int], dict] = load_profile_bundle, ttl: float = 30.0,
+                 max_entries: int = 32, runner=task_runner, clock: Callable[[], float] = time.monotonic,
+                 click_wait: float = 0.2):
+        self.loader = loader
+        self.ttl = ttl
+        self.click_wait = click_wait
+        self.max_entries = max_entries
+        self.runner = runner
+        self.clock = clock
+        self._bundles = OrderedDict()  # pet id -> (loaded at, bundle)
+        self._in_flight = {}           # pet id -> (Task, generation it started in)
+        self._generation = 0
+
+    def _fresh(self, pet_id: int):
+        entry = self._bundles.get(pet_id)
+        if entry is None:
+            return None
+        loaded_at, bundle = entry
+        if self.clock() - loaded_at > self.ttl:
+            del self._bundles[pet_id]
+            return None
+        return bundle
+
+    def _store(self, pet_id: int, bundle: dict) -> None:
+        self._bundles[pet_id] = (self.clock(), bundle)
+        self._bundles.move_to_end(pet_id)
+        while len(self._bundles) > self.max_entries:
+            self._bundles.popitem(last=False)
+
+    def prefetch(self, pet_id: int, widget) -> None:
+        """Starts loading a pet's bundle unless a fresh one is cached or already loading."""
+        if self._fresh(pet_id) is not None or pet_id in self._in_flight:
+            return
+        generation = self._generation
+
+        def on_done(bundle):
+            self._in_flight.pop(pet_id, None)
+            if generation == self._generation:
+                self._store(pet_id, bundle)
+
+        def on_error(error):
+            self._in_flight.pop(pet_id, None)
+            print(f"⚠️ Could not prefetch profile of pet {pet_id}: {error}")
+
+        task = self.runner.submit(lambda: self.loader(pet_id), on_done, widget=widget, on_error=on_error)
+        self._in_flight[pet_id] = (task, generation)
+
+    def get(self, pet_id: int) -> dict:
+        """
+        Returns the pet's bundle: the cached one, the one a running prefetch
+        delivers within click_wait seconds, or else one loaded right away.
+
+        Runs on the Tk thread, so it never waits for a prefetch still queued
+        behind other work on the shared runner; such a prefetch is cancelled.
+        """
+        bundle = self._fresh(pet_id)
+        if bundle is not None:
+            return bundle
+
+        task, started_in = self._in_flight.pop(pet_id, (None, None))
+        generation = self._generation
+        if task is not None:
+            # Only a prefetch a worker has already picked up is worth waiting for
+            started = task.future.running() or task.future.done()
+            if started_in == generation and started:
+                try:
+                    bundle = task.future.result(timeout=self.click_wait)
+                except Exception:
+                    # Timed out, failed or cancelled: load directly instead
+                    bundle = None
+            if bundle is None:
+                task.cancel()
+        if bundle is None:
+            bundle = self.loader(pet_id)
+        if generation == self._generation:
+            self._store(pet_id, bundle)
+        return bundle
+
+    def invalidate(self) -> None:
+        # May run on a worker thread (see ModelCache.add_listener)
+        self._generation += 1
+        self._bundles.clear()
+
+    def on_model_invalidated(self, tags: tuple) -> None:
+        """model_cache listener: drops every bundle when profile data changes."""
+        if any(isinstance(tag, tuple) and len(tag) > 1 and tag[1] in PROFILE_KINDS for tag in tags):
+            self.invalidate()
+
+
+profile_prefetcher = ProfilePrefetcher()
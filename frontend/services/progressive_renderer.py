@@ -0,0 +1,112 @@
+# File: frontend/services/progressive_renderer.py
+import time
+from typing import Callable, Hashable, Optional, Sequence
+from frontend.services.task_runner import task_runner
+
+
+class ProgressiveRenderer:
+    """
+    Builds widgets for a list of items a batch per event-loop tick instead of in
+    one loop, so the first cards are painted right away and input stays responsive
+    while the rest fill in.
+
+    The first batch (initial_batch items, e.g. the first rows) is built as soon as
+    start() is called. Later batches are sized from the average build time seen so
+    far to fit budget_ms; between ticks Tk repaints and handles pending events.
+    Rendering stops early if the widget is destroyed or cancel() is called. With a
+    group (the view's container frame), the renderer is registered with the task
+    runner, so leaving the view cancels it like the view's loads.
+    """
+
+    TICK_MS = 1
+
+    def __init__(self, widget, items: Sequence, build: Callable[[object, int], None],
+                 budget_ms: float = 12.0, initial_batch: int = 6, max_batch: int = 64,
+                 on_complete: Optional[Callable[[], None]] = None, group: Hashable = None,
+                 runner=task_runner):
+        """
+        Args:
+            widget: Widget whose after() schedules the batches, usually the cards' parent
+            items: Items to render, in display order
+            build: Called as build(item, index) on the Tk thread for every item
+            budget_ms: Time each tick may spend building
+            initial_batch: Items built immediately by start()
+            max_batch: Upper bound on a batch, whatever the measured cost
+            on_complete: Called once every item is built
+            group: Cancel group to register with (see TaskRunner.register)
+        """
+        self.widget = widget
+        self.items = items
+        self.build = build
+        self.budget = budget_ms / 1000
+        self.initial_batch = initial_batch
+        self.max_batch = max_batch
+        self.on_complete = on_complete
+        self.group = group
+        self.runner = runner
+        self.batch_sizes = []
+        self._next = 0
+        self._avg_cost = None
+        self._cancelled = False
+
+    @property
+    def done(self) -> bool:
+        return self._next >= len(self.items)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def start(self) -> "ProgressiveRenderer":
+        if self.group is not None:
+            self.runner.register(self.group, self)
+        self._render_batch(self.initial_batch)
+        return self
+
+    def cancel(self) -> None:
+        self._cancelled = True
+        self._finish()
+
+    def _finish(self) -> None:
+        if self.group is not None:
+            self.runner.unregister(self.group, self)
+
+    def _next_batch_size(self) -> int:
+        if not self._avg_cost:
+            return self.initial_batch
+        return max(1, min(self.max_batch, int(self.budget / self._avg_cost)))
+
+    def _tick(self) -> None:
+        if self._cancelled:
+            return
+        if not self._alive():
+            self._finish()
+            return
+        self._render_batch(self._next_batch_size())
+
+    def _render_batch(self, size: int) -> None:
+        start = self._next
+        end = min(start + size, len(self.items))
+        started = time.perf_counter()
+        for index in range(start, end):
+            self.build(self.items[index], index)
+        self._next = end
+
+        if end > start:
+            self.batch_sizes.append(end - start)
+            cost = (time.perf_counter() - started) / (end - start)
+            # Smoothed, so one slow card (e.g. a cold thumbnail) does not collapse the batch size
+            self._avg_cost = cost if self._avg_cost is None else 0.5 * self._avg_cost + 0.5 * cost
+
+        if self.done:
+            self._finish()
+            if self.on_complete:
+                self.on_complete()
+        else:
+            self.widget.after(self.TICK_MS, self._tick)
+
+    def _alive(self) -> bool:
+        try:
+            return bool(self.widget.winfo_exists())
+        except Exception:
+            return False
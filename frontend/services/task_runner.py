@@ -0,0 +1,169 @@
+# File: frontend/services/task_runner.py
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Optional
+
+
+class Task:
+    """Handle of a submitted job; cancel() drops its result (and skips it if not started)."""
+
+    __slots__ = ("future", "group", "_cancelled")
+
+    def __init__(self, group: Optional[Hashable]):
+        self.future = None
+        self.group = group
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+
+class TaskRunner:
+    """
+    Runs blocking work (SQLite queries, image decodes) on a small thread pool and
+    hands the results back on the Tk thread.
+
+    Finished jobs go through a queue that is drained via after(), so on_done and
+    on_error callbacks may touch widgets safely. Results are dropped when the task
+    was cancelled, e.g. because the user navigated away (cancel_group), or when
+    the widget it belongs to has been destroyed.
+    """
+
+    def __init__(self, max_workers: int = 4, poll_ms: int = 15, max_per_tick: int = 24,
+                 thread_name_prefix: str = "task-runner"):
+        self.poll_ms = poll_ms
+        self.max_per_tick = max_per_tick
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._results = queue.Queue()
+        self._groups = {}
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._pump_widget = None
+
+    def submit(self, fn: Callable[[], Any], on_done: Callable[[Any], None], widget,
+               on_error: Callable[[Exception], None] = None, group: Hashable = None) -> Task:
+        """
+        Runs fn() on a worker and calls on_done(result) on the Tk thread.
+
+        Args:
+            fn: Blocking work; must not touch widgets
+            on_done: Called with fn's return value
+            widget: Widget the result belongs to; used to schedule the pump and
+                skipped once destroyed
+            on_error: Called with the exception if fn raises (default: printed)
+            group: Optional key, usually the view's container frame, so every load
+                of a view can be cancelled together with cancel_group()
+        """
+        task = Task(group)
+        if group is not None:
+            with self._lock:
+                self._groups.setdefault(group, set()).add(task)
+        self._pending += 1
+        task.future = self._executor.submit(self._run, task, fn)
+        task.future.add_done_callback(lambda f: self._results.put((task, f, on_done, on_error, widget)))
+        self._schedule_pump(widget)
+        return task
+
+    @staticmethod
+    def _run(task: Task, fn: Callable[[], Any]) -> Any:
+        return None if task.cancelled else fn()
+
+    def cancel_group(self, group: Hashable) -> int:
+        """Cancels every unfinished task and handle of a group; returns how many were cancelled."""
+        with self._lock:
+            handles = self._groups.pop(group, set())
+        for handle in handles:
+            handle.cancel()
+        return len(handles)
+
+    def register(self, group: Hashable, handle) -> None:
+        """
+        Adds other unfinished work of a view to its group, e.g. a ProgressiveRenderer,
+        so cancel_group() stops it too. handle needs a cancel() method and should be
+        unregistered once it is done.
+        """
+        with self._lock:
+            self._groups.setdefault(group, set()).add(handle)
+
+    def unregister(self, group: Hashable, handle) -> None:
+        with self._lock:
+            handles = self._groups.get(group)
+            if handles is not None:
+                handles.discard(handle)
+                if not handles:
+                    del self._groups[group]
+
+    def _forget(self, task: Task) -> None:
+        if task.group is not None:
+            self.unregister(task.group, task)
+
+    def _schedule_pump(self, widget) -> None:
+        if self._pump_widget is None:
+            self._pump_widget = widget.winfo_toplevel()
+            self._pump_widget.after(self.poll_ms, self._pump)
+
+    def _pump(self) -> None:
+        for _ in range(self.max_per_tick):
+            try:
+                task, future, on_done, on_error, widget = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            self._forget(task)
+            if task.cancelled or future.cancelled() or not self._alive(widget):
+                continue
+            try:
+                result = future.result()
+            except Exception as e:
+                if on_error:
+                    on_error(e)
+                else:
+                    print(f"⚠️ Background task failed: {e}")
+                continue
+            on_done(result)
+
+        if self._pending:
+            try:
+                self._pump_widget.after(self.poll_ms, self._pump)
+                return
+            except Exception:
+                # The window is gone; results still in flight are discarded
+                pass
+        self._pump_widget = None
+
+    @staticmethod
+    def _alive(widget) -> bool:
+        try:
+            return bool(widget.winfo_exists())
+        except Exception:
+            return False
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+task_runner = TaskRunner()
+
+
+def load_view_data(view, placeholder, load: Callable[[], Any], render: Callable[[Any], None]) -> Task:
+    """
+    Runs a view's queries off the Tk thread while placeholder (e.g. a "Loading..."
+    label) is shown, then replaces it with render(result). The load is grouped
+    under the view's container frame, so leaving the view can cancel it.
+    """
+    def on_done(result):
+        placeholder.destroy()
+        render(result)
+
+    def on_error(error):
+        print(f"⚠️ Could not load view data: {error}")
+        placeholder.configure(text="⚠️ Could not load data.")
+
+    return task_runner.submit(load, on_done, widget=view, on_error=on_error, group=view)
@@ -0,0 +1,129 @@
+# File: frontend/services/view_cache.py
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable, Optional
+
+
+def count_widgets(widget) -> int:
+    """Size of a widget tree, used as the memory cost of a cached view."""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+class _CachedView:
+    __slots__ = ("frame", "depends_on", "widgets", "stale")
+
+    def __init__(self, frame, depends_on: frozenset, widgets: int):
+        self.frame = frame
+        self.depends_on = depends_on
+        self.widgets = widgets
+        self.stale = False
+
+
+class ViewCache:
+    """
+    Keeps built views alive between navigations and swaps them with pack/pack_forget.
+
+    A view declares the kinds of data it shows (the second element of model_cache
+    tags, e.g. "pets" or "vaccinations"). When data of such a kind is invalidated
+    the view is marked stale and rebuilt the next time it is shown. Views that are
+    not cached (key None) are destroyed as soon as another view is shown. Least
+    recently shown views are destroyed once more than max_views are kept or their
+    widget trees exceed max_widgets in total.
+    """
+
+    def __init__(self, max_views: int = 8, max_widgets: int = 15000):
+        self.max_views = max_views
+        self.max_widgets = max_widgets
+        self._views = OrderedDict()
+        self._current_key = None
+        self._current_frame = None
+
+    @property
+    def current_key(self) -> Optional[Hashable]:
+        return self._current_key
+
+    @property
+    def current_frame(self):
+        return self._current_frame
+
+    def show(self, key: Optional[Hashable], build: Callable[[], object],
+             depends_on: Iterable[str] = ()):
+        """
+        Shows the cached view for key, building it with build() when it is missing
+        or stale. build() must return the view's (not yet packed) container frame.
+
+        Returns:
+            The container frame now shown
+        """
+        self._hide_current()
+
+        view = self._views.get(key) if key is not None else None
+        if view is not None and view.stale:
+            self.discard(key)
+            view = None
+        if view is None:
+            frame = build()
+            if key is not None:
+                view = _CachedView(frame, frozenset(depends_on), count_widgets(frame))
+                self._views[key] = view
+        else:
+            frame = view.frame
+        if key is not None:
+            self._views.move_to_end(key)
+
+        frame.pack(expand=True, fill="both")
+        self._current_key, self._current_frame = key, frame
+        self._evict()
+        return frame
+
+    def _hide_current(self) -> None:
+        if self._current_frame is None:
+            return
+        if self._current_key is None:
+            self._current_frame.destroy()
+        else:
+            self._current_frame.pack_forget()
+        self._current_key = self._current_frame = None
+
+    def _evict(self) -> None:
+        def over_budget():
+            return (len(self._views) > self.max_views
+                    or sum(view.widgets for view in self._views.values()) > self.max_widgets)
+
+        for key in list(self._views):
+            if not over_budget():
+                break
+            if key != self._current_key:
+                self.discard(key)
+
+    def discard(self, key: Hashable) -> None:
+        """Destroys a cached view (unless it is the one on screen, which is only marked stale)."""
+        view = self._views.get(key)
+        if view is None:
+            return
+        if key == self._current_key:
+            view.stale = True
+            return
+        del self._views[key]
+        view.frame.destroy()
+
+    def invalidate(self, *kinds: str) -> None:
+        """Marks views showing any of the given data kinds stale; no kinds marks every view."""
+        # May run on a worker thread (see ModelCache.add_listener): only flags change
+        for view in list(self._views.values()):
+            if not kinds or view.depends_on.intersection(kinds):
+                view.stale = True
+
+    def on_model_invalidated(self, tags: tuple) -> None:
+        """model_cache listener: maps (scope, kind, ...) tags to invalidate(kind, ...)."""
+        kinds = {tag[1] for tag in tags if isinstance(tag, tuple) and len(tag) > 1}
+        if kinds:
+            self.invalidate(*kinds)
+
+    def clear(self) -> None:
+        self._hide_current()
+        for view in self._views.values():
+            view.frame.destroy()
+        self._views.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._views
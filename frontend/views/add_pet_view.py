@@ -7,10 +7,8 @@ from backend.models.pet import Pet, Owner
 from backend.models.vet_visit import VetVisit
 from backend.models.vaccination import Vaccination
 from backend.models.feeding_log import FeedingLog
+from backend.models.grooming_log import GroomingLog
 from backend.controllers.pet_controller import PetController
-from backend.controllers.vet_visit_controller import VetVisitController
-from backend.controllers.vaccination_controller import VaccinationController
-from backend.controllers.feeding_log_controller import FeedingLogController
 from frontend.components.floating_placeholder_entry import FloatingPlaceholderEntry
 from frontend.components.image_uploader import ImageUploader
 from frontend.style.style import (
@@ -18,7 +16,6 @@ from frontend.style.style import (
     get_title_font, get_subtitle_font, create_back_button
 )
 from backend.services.daycare_prices import compute_total_fee
-import os  # Add this import at the top if not present
 
 class AddPetView:
     VACCINE_NAMES = ["Rabies", "Distemper", "Bordetella", "Parvo"]
@@ -361,17 +358,8 @@ class AddPetView:
                     except: pass
 
     def save_pet(self):
-        # Clear all images in the temp folder before saving
-        temp_dir = "backend/data/temp"
-        if os.path.exists(temp_dir):
-            for f in os.listdir(temp_dir):
-                file_path = os.path.join(temp_dir, f)
-                if os.path.isfile(file_path):
-                    try:
-                        os.remove(file_path)
-                    except Exception:
-                        pass
-
+        # The edited photo is staged once and moved into the image store by the
+        # controller; leftovers from abandoned edits are swept in the background
         required = {
             "pet": [self.name_entry.get(), self.bdate_entry.get()],
             "owner": [self.owner_name_entry.get(), self.owner_phone_entry.get()],
@@ -388,43 +376,28 @@ class AddPetView:
                 return
         try:
             pet_controller = PetController()
-            pet_id = pet_controller.add_pet_with_owner(
+            # Every queued record is written with one executemany per table, in a
+            # single transaction spanning all five databases.
+            pet_controller.add_pet_with_records(
                 Pet(0, required["pet"][0], self.breed_entry.get(), required["pet"][1]),
                 Owner(0, required["owner"][0], required["owner"][1], self.owner_address_entry.get()),
-                required["image"][0]
+                required["image"][0],
+                vet_visits=[VetVisit(pet_id=0, **record) for record in self.records["vet_visits"]],
+                vaccinations=[Vaccination(pet_id=0, **record) for record in self.records["vaccinations"]],
+                feeding_logs=[FeedingLog(pet_id=0, **record) for record in self.records["feeding_logs"]],
+                grooming_logs=[
+                    GroomingLog(
+                        id=0,
+                        pet_id=0,
+                        groom_date="",  # DB will auto-generate
+                        groom_type=record["groom_type"],
+                        price=record["price"],
+                        groomer_name=record["groomer_name"],
+                        notes=record["notes"]
+                    )
+                    for record in self.records["groomings"]
+                ]
             )
-            controllers = {
-                "vet_visits": (VetVisitController, VetVisit),
-                "vaccinations": (VaccinationController, Vaccination),
-                "feeding_logs": (FeedingLogController, FeedingLog),
-                "groomings": (None, None),  # NEW
-            }
-            for record_type, (ctrl_cls, model_cls) in controllers.items():
-                if record_type == "groomings":
-                    from backend.controllers.grooming_controller import GroomingLogsController
-                    from backend.models.grooming_log import GroomingLog
-                    ctrl = GroomingLogsController()
-                    for record in self.records[record_type]:
-                        model_instance = GroomingLog(
-                            id=0,
-                            pet_id=pet_id,
-                            groom_date="",  # DB will auto-generate
-                            groom_type=record["groom_type"],
-                            price=record["price"],
-                            groomer_name=record["groomer_name"],
-                            notes=record["notes"]
-                        )
-                        ctrl.add_grooming_log(
-                            pet_id=pet_id,
-                            groom_type=record["groom_type"],
-                            groomer_name=record["groomer_name"],
-                            notes=record["notes"]
-                        )
-                else:
-                    ctrl = ctrl_cls()
-                    for record in self.records[record_type]:
-                        model_instance = model_cls(pet_id=pet_id, **record)
-                        ctrl.db_handler.insert(model_instance)
             messagebox.showinfo("Saved", f"{required['pet'][0]} and all records added successfully!")
             self.records = {k: [] for k in self.records}
         except Exception as e:
@@ -4,7 +4,9 @@ from frontend.style.style import (
     create_label,
     create_frame,
     create_exit_button,
+    get_card_detail_font,
 )
+from backend.controllers.pet_controller import PetController
 from frontend.components.dashboard_buttons import (
     add_pet_button,
     view_pets_button,
@@ -21,6 +23,17 @@ def create_dashboard(parent, show_frame):
     title = create_label(parent, "🐾 PetTrackr Dashboard")
     title.pack(pady=(20, 10))
 
+    # Clinic-wide totals from SQL aggregates; no record objects are loaded
+    totals = PetController().get_record_totals()
+    stats = create_label(
+        parent,
+        f"💉 {totals.vaccination_count} vaccinations   🩺 {totals.vet_visit_count} vet visits   "
+        f"🏠 {totals.daycare_days} daycare days   ✂️ {totals.grooming_count} groomings   "
+        f"💰 ₱{totals.total_spent:,.2f}",
+        font=get_card_detail_font()
+    )
+    stats.pack(pady=(0, 10))
+
     # Main container for bento grid (centered and compact)
     main_frame = create_frame(parent)
     main_frame.pack(expand=True)
@@ -2,6 +2,8 @@ import customtkinter as ctk
 from backend.controllers.pet_controller import PetController
 from frontend.components.pet_card_with_grooming_logs import PetCardWithGroomingLogs
 from frontend.style.style import create_label, create_frame, create_back_button
+from frontend.services.task_runner import load_view_data
+from frontend.services.progressive_renderer import ProgressiveRenderer
 
 def create_grooming_logs_tab(master, show_frame):
     # Clear the master frame
@@ -54,38 +56,45 @@ def create_grooming_logs_tab(master, show_frame):
         cards_frame.grid(row=0, column=0, sticky="nsew")
     cards_frame.grid_columnconfigure((0, 1, 2), weight=1)
 
-    pet_controller = PetController()
-    pets, owners = pet_controller.get_pets_with_owners()
-    image_store = []
-
     # Only show pets with grooming logs
     from backend.controllers.grooming_controller import GroomingLogsController
     from backend.controllers.feeding_log_controller import FeedingLogController
     from backend.controllers.vaccination_controller import VaccinationController
     from backend.controllers.vet_visit_controller import VetVisitController
 
-    grooming_ctrl = GroomingLogsController()
-    feeding_ctrl = FeedingLogController()
-    vacc_ctrl = VaccinationController()
-    vet_ctrl = VetVisitController()
-
-    pets_with_logs = []
-    owners_with_logs = []
-    for pet, owner in zip(pets, owners):
-        logs = grooming_ctrl.get_grooming_logs_for_pet(pet.id)
-        if logs:
-            pets_with_logs.append(pet)
-            owners_with_logs.append(owner)
-
-    if not pets_with_logs:
-        no_pets_label = create_label(cards_frame, "No pets with grooming logs found.")
-        no_pets_label.grid(row=0, column=0, pady=40)
-    else:
-        for idx, (pet, owner) in enumerate(zip(pets_with_logs, owners_with_logs)):
-            vet_visits = vet_ctrl.get_by_pet_id(pet.id)
-            vaccinations = vacc_ctrl.get_by_pet_id(pet.id)
-            feeding_logs = feeding_ctrl.get_by_pet_id(pet.id)
-            grooming_logs = grooming_ctrl.get_grooming_logs_for_pet(pet.id)
+    def load_records():
+        # Runs on a worker thread: queries only, no widgets
+        pet_controller = PetController()
+        pets_with_logs, owners_with_logs = pet_controller.get_pets_with_grooming_logs()
+        if not pets_with_logs:
+            return pets_with_logs, owners_with_logs, {}, {}, {}, {}, {}
+
+        # One batched query per record table instead of four queries per card
+        pet_ids = [pet.id for pet in pets_with_logs]
+        return (
+            pets_with_logs,
+            owners_with_logs,
+            VetVisitController().get_by_pet_ids(pet_ids),
+            VaccinationController().get_by_pet_ids(pet_ids),
+            FeedingLogController().get_by_pet_ids(pet_ids),
+            GroomingLogsController().get_by_pet_ids(pet_ids),
+            pet_controller.get_pet_summaries(pet_ids),
+        )
+
+    def render_cards(data):
+        (pets_with_logs, owners_with_logs, vet_visits_by_pet, vaccinations_by_pet,
+         feeding_logs_by_pet, grooming_logs_by_pet, summaries) = data
+        if not pets_with_logs:
+            no_pets_label = create_label(cards_frame, "No pets with grooming logs found.")
+            no_pets_label.grid(row=0, column=0, pady=40)
+            return
+
+        def build_card(pet_and_owner, idx):
+            pet, owner = pet_and_owner
+            vet_visits = vet_visits_by_pet.get(pet.id, [])
+            vaccinations = vaccinations_by_pet.get(pet.id, [])
+            feeding_logs = feeding_logs_by_pet.get(pet.id, [])
+            grooming_logs = grooming_logs_by_pet.get(pet.id, [])
             def on_card_click(
                 pet=pet, owner=owner, vet_visits=vet_visits, vaccinations=vaccinations,
                 feeding_logs=feeding_logs, grooming_logs=grooming_logs
@@ -100,11 +109,21 @@ def create_grooming_logs_tab(master, show_frame):
                     grooming_logs=grooming_logs
                 )
             card = PetCardWithGroomingLogs(
-                cards_frame, pet, image_store, owner=owner, on_click=on_card_click
+                cards_frame, pet, owner=owner, on_click=on_card_click,
+                grooming_logs=grooming_logs, summary=summaries.get(pet.id)
             )
             row, col = divmod(idx, 3)
             card.grid(row=row, column=col, padx=12, pady=12, sticky="nsew")
 
+        # Cards are created a few at a time so the first rows paint immediately;
+        # leaving the view stops the rendering (see show_frame)
+        items = list(zip(pets_with_logs, owners_with_logs))
+        ProgressiveRenderer(cards_frame, items, build_card, group=master).start()
+
+    loading_label = create_label(cards_frame, "⏳ Loading grooming logs...")
+    loading_label.grid(row=0, column=0, columnspan=3, pady=40)
+    load_view_data(master, loading_label, load_records, render_cards)
+
     # Bottom frame for the back button (outside main container)
     bottom_frame = ctk.CTkFrame(master)
     bottom_frame.grid(row=1, column=0, sticky="se", padx=20, pady=(0, 20))
@@ -1,11 +1,11 @@
 import customtkinter as ctk
-from PIL import Image
-import os
 from frontend.style.style import (
     create_label1, create_frame, create_button,
     get_title_font, get_subtitle_font, get_card_detail_font
 )
 from backend.services.daycare_prices import compute_total_fee
+from backend.services.image_service import thumbnail_for, thumbnail_path
+from frontend.services.image_cache import load_ctk_image
 
 class PetProfileTab:
     def __init__(self, parent, pet, owner, vet_visits, vaccinations, feeding_logs, grooming_logs, show_frame, go_back):
@@ -49,18 +49,18 @@ class PetProfileTab:
         panel.grid_propagate(False)
         panel.configure(width=340, height=420)
 
-        img = self._get_image()
-        ctk.CTkLabel(panel, image=ctk.CTkImage(light_image=img, dark_image=img, size=(300, 300)), 
-                    text="").pack(pady=(32, 12))
+        ctk.CTkLabel(panel, image=self._get_image(panel), text="").pack(pady=(32, 12))
         create_label1(panel, f"🐾 {self.pet.name}'s Profile", font=get_title_font(), 
                     justify="center").pack(pady=(0, 8))
 
-    def _get_image(self):
-        try:
-            img_path = os.path.join("backend", "data", getattr(self.pet, 'image_path', "")) if hasattr(self.pet, 'image_path') else None
-            return Image.open(img_path).resize((300, 300)) if img_path and os.path.exists(img_path) else Image.new("RGB", (300, 300), "lightgray")
-        except Exception:
-            return Image.new("RGB", (300, 300), "lightgray")
+    def _get_image(self, panel):
+        # Shared cached 300x300 derivative; decoded in the background on a cache miss
+        return load_ctk_image(
+            thumbnail_path(self.pet, "profile"),
+            (300, 300),
+            widget=panel,
+            source=lambda pet=self.pet: thumbnail_for(pet, "profile")
+        )
 
     def _content_panel(self, parent):
         scroll = ctk.CTkScrollableFrame(parent, fg_color="transparent")
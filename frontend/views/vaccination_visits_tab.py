@@ -4,15 +4,12 @@ from frontend.components.pet_card_with_records import PetCardWithRecords
 from backend.controllers.pet_controller import PetController
 from backend.controllers.vaccination_controller import VaccinationController
 from backend.controllers.vet_visit_controller import VetVisitController
-from backend.database_handlers.vaccinations_db_handler import VaccinationDB
-from backend.database_handlers.vet_visits_db_handler import VetVisitDB
+from backend.controllers.feeding_log_controller import FeedingLogController
+from backend.controllers.grooming_controller import GroomingLogsController
+from frontend.services.task_runner import load_view_data
+from frontend.services.progressive_renderer import ProgressiveRenderer
 
 class VaccinationVisitsTab:
-    @staticmethod
-    def filter_pets_with_records(pet_list, vaccination_records, vet_visit_records):
-        pet_ids = {rec.pet_id for rec in vaccination_records} | {rec.pet_id for rec in vet_visit_records}
-        return [pet for pet in pet_list if pet.id in pet_ids]
-
     @classmethod
     def create(cls, parent, show_frame):
         for widget in parent.winfo_children():
@@ -20,20 +17,6 @@ class VaccinationVisitsTab:
 
         create_label(parent, "💉 Vaccinations & Vet Visits").pack(pady=(20, 10))
 
-        # Fetch data here
-        pet_ctrl = PetController()
-        vacc_ctrl = VaccinationController()
-        vet_ctrl = VetVisitController()
-        pets, owners = pet_ctrl.get_pets_with_owners()
-        vacc_db = VaccinationDB()
-        vet_db = VetVisitDB()
-        vaccinations = vacc_db.get_all()
-        vet_visits = vet_db.get_all()
-        image_store = []  # Or fetch as needed
-        owner_lookup = {owner.id: owner for owner in owners if owner}
-
-        pets_with_records = cls.filter_pets_with_records(pets, vaccinations, vet_visits)
-
         main_frame = create_frame(parent)
         main_frame.pack(expand=True, fill="both", padx=20, pady=10)
 
@@ -58,33 +41,11 @@ class VaccinationVisitsTab:
             cards_frame.pack(expand=True, fill="both")
         cards_frame.grid_columnconfigure((0, 1, 2), weight=1)
 
-        if not pets_with_records:
-            create_label(cards_frame, "No pets with vaccination or vet visit records.").pack(pady=40)
-        else:
-            for idx, pet in enumerate(pets_with_records):
-                owner = owner_lookup(pet.owner_id) if callable(owner_lookup) else owner_lookup.get(pet.owner_id)
-                vet_visits = vet_ctrl.get_by_pet_id(pet.id)
-                vaccinations = vacc_ctrl.get_by_pet_id(pet.id)
-                # If you have a FeedingLogController and GroomingLogController, use them:
-                from backend.controllers.feeding_log_controller import FeedingLogController
-                from backend.controllers.grooming_controller import GroomingLogsController
-                feeding_logs = FeedingLogController().get_by_pet_id(pet.id)
-                grooming_logs = GroomingLogsController().get_grooming_logs_for_pet(pet.id)
-                card = PetCardWithRecords(
-                    cards_frame, pet, image_store, owner=owner,
-                    on_click=lambda pet=pet, owner=owner, vet_visits=vet_visits, vaccinations=vaccinations, feeding_logs=feeding_logs, grooming_logs=grooming_logs:
-                        show_frame(
-                            "pet_profile",
-                            pet=pet,
-                            owner=owner,
-                            vet_visits=vet_visits,
-                            vaccinations=vaccinations,
-                            feeding_logs=feeding_logs,
-                            grooming_logs=grooming_logs
-                        )
-                )
-                row, col = divmod(idx, 3)
-                card.grid(row=row, column=col, padx=12, pady=12, sticky="nsew")
+        loading_label = create_label(cards_frame, "⏳ Loading records...")
+        loading_label.grid(row=0, column=0, columnspan=3, pady=40)
+        # Queries run on a worker; the cards are built once the results arrive
+        load_view_data(parent, loading_label, cls._load_records,
+                       lambda data: cls._render_cards(cards_frame, show_frame, *data))
 
         back_btn_frame = create_frame(parent)
         back_btn_frame.pack(side="bottom", anchor="se", pady=20, padx=20, fill="x")
@@ -96,4 +57,60 @@ class VaccinationVisitsTab:
             width=120
         ).grid(row=0, column=1, sticky="e")
 
-        return parent
\ No newline at end of file
+        return parent
+
+    @staticmethod
+    def _load_records():
+        """Runs on a worker thread: every query the tab needs, nothing that touches widgets."""
+        pet_ctrl = PetController()
+        # One EXISTS query across the attached databases instead of loading every record
+        pets_with_records, owners = pet_ctrl.get_pets_with_vacc_or_vet_records()
+        owner_lookup = {owner.id: owner for owner in owners if owner}
+        if not pets_with_records:
+            return pets_with_records, owner_lookup, {}, {}, {}, {}, {}
+
+        # One batched query per record table instead of four queries per card
+        pet_ids = [pet.id for pet in pets_with_records]
+        return (
+            pets_with_records,
+            owner_lookup,
+            VetVisitController().get_by_pet_ids(pet_ids),
+            VaccinationController().get_by_pet_ids(pet_ids),
+            FeedingLogController().get_by_pet_ids(pet_ids),
+            GroomingLogsController().get_by_pet_ids(pet_ids),
+            pet_ctrl.get_pet_summaries(pet_ids),
+        )
+
+    @staticmethod
+    def _render_cards(cards_frame, show_frame, pets_with_records, owner_lookup, vet_visits_by_pet,
+                      vaccinations_by_pet, feeding_logs_by_pet, grooming_logs_by_pet, summaries):
+        if not pets_with_records:
+            create_label(cards_frame, "No pets with vaccination or vet visit records.").grid(row=0, column=0, columnspan=3, pady=40)
+            return
+
+        def build_card(pet, idx):
+            owner = owner_lookup(pet.owner_id) if callable(owner_lookup) else owner_lookup.get(pet.owner_id)
+            vet_visits = vet_visits_by_pet.get(pet.id, [])
+            vaccinations = vaccinations_by_pet.get(pet.id, [])
+            feeding_logs = feeding_logs_by_pet.get(pet.id, [])
+            grooming_logs = grooming_logs_by_pet.get(pet.id, [])
+            card = PetCardWithRecords(
+                cards_frame, pet, owner=owner,
+                vaccinations=vaccinations, vet_visits=vet_visits, summary=summaries.get(pet.id),
+                on_click=lambda pet=pet, owner=owner, vet_visits=vet_visits, vaccinations=vaccinations, feeding_logs=feeding_logs, grooming_logs=grooming_logs:
+                    show_frame(
+                        "pet_profile",
+                        pet=pet,
+                        owner=owner,
+                        vet_visits=vet_visits,
+                        vaccinations=vaccinations,
+                        feeding_logs=feeding_logs,
+                        grooming_logs=grooming_logs
+                    )
+            )
+            row, col = divmod(idx, 3)
+            card.grid(row=row, column=col, padx=12, pady=12, sticky="nsew")
+
+        # Cards are created a few at a time so the first rows paint immediately;
+        # leaving the view stops the rendering (see show_frame)
+        ProgressiveRenderer(cards_frame, pets_with_records, build_card, group=parent).start()
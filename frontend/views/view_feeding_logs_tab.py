@@ -6,6 +6,8 @@ from backend.controllers.feeding_log_controller import FeedingLogController
 from backend.controllers.grooming_controller import GroomingLogsController
 from frontend.components.pet_card_with_feeding_logs import PetCardWithFeedingLogs
 from frontend.style.style import create_label, create_frame, create_back_button
+from frontend.services.task_runner import load_view_data
+from frontend.services.progressive_renderer import ProgressiveRenderer
 
 def create_view_feeding_logs_tab(master, show_frame):
     # Clear the master frame
@@ -54,27 +56,40 @@ def create_view_feeding_logs_tab(master, show_frame):
         cards_frame.grid(row=0, column=0, sticky="nsew")
     cards_frame.grid_columnconfigure((0, 1, 2), weight=1)
 
-    # Fetch all data
-    pet_controller = PetController()
-    vacc_ctrl = VaccinationController()
-    vet_ctrl = VetVisitController()
-    feeding_ctrl = FeedingLogController()
-    grooming_ctrl = GroomingLogsController()
+    def load_records():
+        # Runs on a worker thread: queries only, no widgets
+        pet_controller = PetController()
+        pets, owners = pet_controller.get_pets_with_feeding_logs()
+        owner_lookup = {owner.id: owner for owner in owners if owner}
+        if not pets:
+            return pets, owner_lookup, {}, {}, {}, {}, {}
 
-    pets, owners = pet_controller.get_pets_with_feeding_logs()
-    image_store = []
-    owner_lookup = {owner.id: owner for owner in owners if owner}
+        # One batched query per record table instead of four queries per card
+        pet_ids = [pet.id for pet in pets]
+        return (
+            pets,
+            owner_lookup,
+            VetVisitController().get_by_pet_ids(pet_ids),
+            VaccinationController().get_by_pet_ids(pet_ids),
+            FeedingLogController().get_by_pet_ids(pet_ids),
+            GroomingLogsController().get_by_pet_ids(pet_ids),
+            pet_controller.get_pet_summaries(pet_ids),
+        )
 
-    if not pets:
-        no_pets_label = create_label(cards_frame, "No pets with feeding logs found.")
-        no_pets_label.grid(row=0, column=0, pady=40)
-    else:
-        for idx, pet in enumerate(pets):
+    def render_cards(data):
+        (pets, owner_lookup, vet_visits_by_pet, vaccinations_by_pet,
+         feeding_logs_by_pet, grooming_logs_by_pet, summaries) = data
+        if not pets:
+            no_pets_label = create_label(cards_frame, "No pets with feeding logs found.")
+            no_pets_label.grid(row=0, column=0, pady=40)
+            return
+
+        def build_card(pet, idx):
             owner = owner_lookup.get(pet.owner_id)
-            vet_visits = vet_ctrl.get_by_pet_id(pet.id)
-            vaccinations = vacc_ctrl.get_by_pet_id(pet.id)
-            feeding_logs = feeding_ctrl.get_by_pet_id(pet.id)
-            grooming_logs = grooming_ctrl.get_grooming_logs_for_pet(pet.id)
+            vet_visits = vet_visits_by_pet.get(pet.id, [])
+            vaccinations = vaccinations_by_pet.get(pet.id, [])
+            feeding_logs = feeding_logs_by_pet.get(pet.id, [])
+            grooming_logs = grooming_logs_by_pet.get(pet.id, [])
             def on_card_click(
                 pet=pet, owner=owner, vet_visits=vet_visits, vaccinations=vaccinations,
                 feeding_logs=feeding_logs, grooming_logs=grooming_logs
@@ -89,11 +104,20 @@ def create_view_feeding_logs_tab(master, show_frame):
                     grooming_logs=grooming_logs
                 )
             card = PetCardWithFeedingLogs(
-                cards_frame, pet, image_store, owner=owner, on_click=on_card_click
+                cards_frame, pet, owner=owner, on_click=on_card_click,
+                feeding_logs=feeding_logs, summary=summaries.get(pet.id)
             )
             row, col = divmod(idx, 3)
             card.grid(row=row, column=col, padx=12, pady=12, sticky="nsew")
 
+        # Cards are created a few at a time so the first rows paint immediately;
+        # leaving the view stops the rendering (see show_frame)
+        ProgressiveRenderer(cards_frame, pets, build_card, group=master).start()
+
+    loading_label = create_label(cards_frame, "⏳ Loading feeding logs...")
+    loading_label.grid(row=0, column=0, columnspan=3, pady=40)
+    load_view_data(master, loading_label, load_records, render_cards)
+
     # Bottom frame for the back button (outside main container)
     bottom_frame = ctk.CTkFrame(master)
     bottom_frame.grid(row=1, column=0, sticky="se", padx=20, pady=(0, 20))
@@ -17,11 +17,21 @@ def install_requirements():
 def run_pettrackr():
     """Launch the PetTrackr application."""
     from backend.services import db_service
+    from backend.services.connection_pool import connection_pool
+    from backend.services.model_cache import model_cache
     from frontend.gui import launch_gui
 
     print("🐾 Starting PetTrackr...")
+    db_service.initialize_all_databases()
     db_service.test_all_connections()
-    launch_gui()
+    try:
+        launch_gui()
+    finally:
+        stats = connection_pool.stats()
+        print(f"🔌 SQLite connections opened: {stats['opened']}, reused: {stats['reused']}")
+        cache_stats = model_cache.stats()
+        print(f"🗃️ Model cache hits: {cache_stats['hits']}, misses: {cache_stats['misses']}")
+        connection_pool.close_all()
 
 if __name__ == "__main__":
     install_requirements()
@@ -0,0 +1,56 @@
+# tests_pettrackr/conftest.py
+import os
+import time
+import pytest
+
+from backend.data.pets_db import PetDatabaseInitializer
+from backend.data.vaccinations_db import VaccinationsDatabaseInitializer
+from backend.data.vet_visits_db import VetVisitsDatabaseInitializer
+from backend.data.feeding_logs_db import FeedingLogsDatabaseInitializer
+from backend.data.grooming_logs_db import GroomingLogsDatabaseInitializer
+from backend.services.connection_pool import connection_pool
+from backend.services.model_cache import model_cache
+
+INITIALIZERS = {
+    "pets.db": PetDatabaseInitializer,
+    "vaccinations.db": VaccinationsDatabaseInitializer,
+    "vet_visits.db": VetVisitsDatabaseInitializer,
+    "feeding_logs.db": FeedingLogsDatabaseInitializer,
+    "grooming_logs.db": GroomingLogsDatabaseInitializer,
+}
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """A throwaway data directory with all five PetTrackr databases initialized."""
+    for filename, initializer_cls in INITIALIZERS.items():
+        initializer = initializer_cls()
+        initializer.data_dir = str(tmp_path)
+        initializer.db_path = os.path.join(str(tmp_path), filename)
+        initializer.initialize()
+    yield str(tmp_path)
+    connection_pool.close_all()
+    model_cache.clear()
+
+
+class FakeWidget:
+    """Stands in for a Tk widget: after() callbacks run when the test calls run_pending()."""
+
+    def __init__(self):
+        self.callbacks = []
+        self.exists = True
+
+    def winfo_toplevel(self):
+        return self
+
+    def winfo_exists(self):
+        return self.exists
+
+    def after(self, ms, callback):
+        self.callbacks.append(callback)
+
+    def run_pending(self, timeout=5.0):
+        deadline = time.time() + timeout
+        while self.callbacks and time.time() < deadline:
+            self.callbacks.pop(0)()
+            time.sleep(0.01)
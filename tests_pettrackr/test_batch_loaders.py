@@ -0,0 +1,38 @@
+# tests_pettrackr/test_batch_loaders.py
+import os
+
+from backend.controllers.grooming_controller import GroomingLogsController
+from backend.database_handlers.vaccinations_db_handler import VaccinationDB
+from backend.database_handlers.vet_visits_db_handler import VetVisitDB
+from backend.database_handlers.feeding_logs_db_handler import FeedingLogDB
+from backend.models.vaccination import Vaccination
+from backend.models.vet_visit import VetVisit
+from backend.models.feeding_log import FeedingLog
+
+
+def test_get_by_pet_ids_matches_per_pet_queries(data_dir):
+    vax_db = VaccinationDB(os.path.join(data_dir, "vaccinations.db"))
+    visit_db = VetVisitDB(os.path.join(data_dir, "vet_visits.db"))
+    feeding_db = FeedingLogDB(os.path.join(data_dir, "feeding_logs.db"))
+    grooming = GroomingLogsController(os.path.join(data_dir, "grooming_logs.db"))
+
+    for pet_id in (1, 2):
+        vax_db.insert(Vaccination(pet_id, "Rabies", "2024-01-01"))
+        vax_db.insert(Vaccination(pet_id, "Parvo", "2024-05-01"))
+        visit_db.insert(VetVisit(pet_id, "2024-02-01", "Checkup", cost=500))
+        feeding_db.insert(FeedingLog(pet_id, "2024-03-01", 2, feed_once=True))
+        grooming.add_grooming_log(pet_id, "basic", "Ava")
+
+    pet_ids = [1, 2, 3]
+    loaders = [
+        (vax_db.get_by_pet_ids, vax_db.get_by_pet_id),
+        (visit_db.get_by_pet_ids, visit_db.get_by_pet_id),
+        (feeding_db.get_by_pet_ids, feeding_db.get_by_pet_id),
+        (grooming.get_by_pet_ids, grooming.get_grooming_logs_for_pet),
+    ]
+    for batch, single in loaders:
+        grouped = batch(pet_ids)
+        assert set(grouped) == set(pet_ids)
+        for pet_id in pet_ids:
+            assert [r.to_dict() for r in grouped[pet_id]] == [r.to_dict() for r in single(pet_id)]
+    assert grouped[3] == []
@@ -0,0 +1,65 @@
+# tests_pettrackr/test_bulk_save.py
+import os
+import sqlite3
+import pytest
+
+from backend.controllers.pet_controller import PetController
+from backend.models.pet import Pet, Owner
+from backend.models.vaccination import Vaccination
+from backend.models.vet_visit import VetVisit
+from backend.models.feeding_log import FeedingLog
+from backend.models.grooming_log import GroomingLog
+
+
+def _count(data_dir, filename, table):
+    with sqlite3.connect(os.path.join(data_dir, filename)) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def _records(num_days=2):
+    return dict(
+        vet_visits=[VetVisit(0, "2024-02-01", "Checkup", cost=500) for _ in range(3)],
+        vaccinations=[Vaccination(0, "Rabies", "2024-01-01"), Vaccination(0, "Parvo", "2024-01-01")],
+        feeding_logs=[FeedingLog(0, "2024-03-01", num_days, feed_twice=True)],
+        grooming_logs=[GroomingLog(0, 0, "", "premium", 0, "Ava")],
+    )
+
+
+@pytest.mark.parametrize("atomic", [True, False])
+def test_add_pet_with_records_writes_every_table(data_dir, atomic):
+    controller = PetController(db_path=os.path.join(data_dir, "pets.db"))
+    pet_id = controller.add_pet_with_records(
+        Pet(0, "Brownie", "Aspin", "2020-01-01"), Owner(0, "Ana", "09171234567"),
+        atomic=atomic, **_records()
+    )
+
+    assert _count(data_dir, "vet_visits.db", "vet_visits") == 3
+    assert _count(data_dir, "vaccinations.db", "vaccinations") == 2
+    assert _count(data_dir, "feeding_logs.db", "daycare_enrollments") == 1
+    with sqlite3.connect(os.path.join(data_dir, "grooming_logs.db")) as conn:
+        assert conn.execute("SELECT pet_id, price FROM grooming_logs").fetchall() == [(pet_id, 1200.0)]
+
+
+def test_atomic_save_rolls_back_all_databases(data_dir):
+    controller = PetController(db_path=os.path.join(data_dir, "pets.db"))
+    with pytest.raises(RuntimeError):
+        # num_days is NOT NULL, so the feeding insert fails after the others ran
+        controller.add_pet_with_records(
+            Pet(0, "Brownie", "Aspin", "2020-01-01"), Owner(0, "Ana", "09171234567"),
+            **_records(num_days=None)
+        )
+
+    assert _count(data_dir, "pets.db", "pets") == 0
+    assert _count(data_dir, "vet_visits.db", "vet_visits") == 0
+    assert _count(data_dir, "vaccinations.db", "vaccinations") == 0
+
+
+def test_unreadable_photo_fails_with_runtime_error(data_dir, tmp_path):
+    controller = PetController(db_path=os.path.join(data_dir, "pets.db"))
+    not_a_photo = tmp_path / "notes.jpg"
+    not_a_photo.write_text("not an image")
+
+    with pytest.raises(RuntimeError, match="Failed to add pet"):
+        controller.add_pet_with_owner(Pet(0, "Brownie", "Aspin", "2020-01-01"),
+                                      Owner(0, "Ana", "09171234567"), str(not_a_photo))
+    assert _count(data_dir, "pets.db", "pets") == 0
@@ -0,0 +1,64 @@
+# tests_pettrackr/test_connection_pool.py
+import sqlite3
+import threading
+
+import pytest
+
+from backend.services.connection_pool import ConnectionPool
+
+
+def test_reuses_one_connection_per_file(tmp_path):
+    pool = ConnectionPool()
+    db_path = str(tmp_path / "pool.db")
+
+    first = pool.get(db_path)
+    second = pool.get(db_path)
+
+    assert first is second
+    assert pool.stats()["opened"] == 1
+    assert pool.stats()["reused"] == 1
+    pool.close_all()
+
+
+def test_foreign_keys_pragma_applied_once_on_open(tmp_path):
+    pool = ConnectionPool()
+    db_path = str(tmp_path / "pool.db")
+
+    plain = pool.get(db_path)
+    enforced = pool.get(db_path, foreign_keys=True)
+
+    assert plain is not enforced
+    assert plain.execute("PRAGMA foreign_keys").fetchone()[0] == 0
+    assert enforced.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    pool.close_all()
+
+
+def test_connections_are_thread_local(tmp_path):
+    pool = ConnectionPool()
+    db_path = str(tmp_path / "pool.db")
+    main_conn = pool.get(db_path)
+    seen = []
+
+    worker = threading.Thread(target=lambda: seen.append(pool.get(db_path)))
+    worker.start()
+    worker.join()
+
+    assert seen[0] is not main_conn
+    assert pool.stats()["opened"] == 2
+    # The worker has exited, so its connection is closed and no longer counted
+    assert pool.stats()["open_now"] == 1
+    with pytest.raises(sqlite3.ProgrammingError):
+        seen[0].execute("SELECT 1")
+    pool.close_all()
+    assert pool.stats()["open_now"] == 0
+
+
+def test_storage_profile_applied_to_main_and_attached(tmp_path):
+    pool = ConnectionPool()
+    conn = pool.get(str(tmp_path / "pets.db"), attach={"vaccinations": str(tmp_path / "vaccinations.db")})
+
+    assert conn.execute("PRAGMA main.journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA vaccinations.journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    assert conn.execute("PRAGMA main.synchronous").fetchone()[0] == 1  # NORMAL
+    pool.close_all()
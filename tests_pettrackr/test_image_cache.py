@@ -0,0 +1,28 @@
+# tests_pettrackr/test_image_cache.py
+import os
+
+from frontend.services.image_cache import ImageCache
+
+
+def test_lru_eviction_respects_the_byte_budget():
+    cache = ImageCache(max_bytes=250)
+    cache.put("a", "A", 100)
+    cache.put("b", "B", 100)
+    assert cache.get("a") == "A"
+    cache.put("c", "C", 100)  # over budget: evicts "b", the least recently used
+
+    assert cache.get("b") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 1, "entries": 2, "resident_bytes": 200}
+
+
+def test_key_changes_when_the_file_changes(tmp_path):
+    path = str(tmp_path / "brownie_1_card.jpg")
+    assert ImageCache.key(path, (140, 140)) is None
+
+    with open(path, "wb") as f:
+        f.write(b"v1")
+    first = ImageCache.key(path, (140, 140))
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+
+    assert ImageCache.key(path, (140, 140)) != first
+    assert ImageCache.key(path, (300, 300)) != first
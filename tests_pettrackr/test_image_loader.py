@@ -0,0 +1,23 @@
+# tests_pettrackr/test_image_loader.py
+from PIL import Image
+
+from frontend.services.image_loader import ImageLoader
+from conftest import FakeWidget
+
+
+def test_images_are_delivered_on_the_pump_and_skipped_for_dead_widgets(tmp_path):
+    path = str(tmp_path / "photo.jpg")
+    Image.new("RGB", (400, 300), "saddlebrown").save(path)
+    loader = ImageLoader(max_workers=2)
+    root, gone = FakeWidget(), FakeWidget()
+    gone.exists = False
+    delivered = []
+
+    loader.load(path, (140, 140), lambda image: delivered.append(("card", image.size)), widget=root)
+    loader.load(lambda: path, (140, 140), lambda image: delivered.append(("gone", image.size)), widget=gone)
+    loader.load(str(tmp_path / "missing.jpg"), (140, 140), lambda image: delivered.append(("missing", None)), widget=root)
+    root.run_pending()
+    loader.shutdown()
+
+    assert delivered == [("card", (140, 140))]
+    assert root.callbacks == []
@@ -0,0 +1,137 @@
+# tests_pettrackr/test_image_reprocess.py
+import os
+import sqlite3
+
+from PIL import Image
+
+from backend.services.image_reprocess import (
+    CHECKPOINT_FILE, WORKERS, _rethumbnail_one, _run_signature, _save_checkpoint,
+    reencode_images, reprocess_images
+)
+from backend.services.image_service import IMAGE_POLICY, THUMBNAIL_SIZES
+from backend.services.image_store import ImageStore
+
+WEBP_POLICY = {"max_dimension": 400, "format": "WEBP", "quality": 80}
+
+
+def test_reencode_images_rewrites_rows_and_removes_old_blobs(data_dir):
+    store = ImageStore(data_dir)
+    src = os.path.join(data_dir, "upload.jpg")
+    Image.new("RGB", (1000, 800), "saddlebrown").save(src)
+    old_blob = store.put(src)
+    with sqlite3.connect(os.path.join(data_dir, "pets.db")) as conn:
+        conn.execute("INSERT INTO owner (id, name, contact_number) VALUES (1, 'Ana', '09171234567')")
+        conn.executemany(
+            "INSERT INTO pets (id, name, breed, birthdate, image_path, owner_id) VALUES (?, ?, 'Aspin', '2020-01-01', ?, 1)",
+            [(1, "Brownie", old_blob), (2, "Rocco", old_blob), (3, "Dalmi", None)]
+        )
+
+    assert reencode_images(data_dir, policy=WEBP_POLICY, max_workers=2) == 1
+    assert reencode_images(data_dir, policy=WEBP_POLICY, max_workers=2) == 0  # already compliant
+
+    with sqlite3.connect(os.path.join(data_dir, "pets.db")) as conn:
+        rows = conn.execute("SELECT image_path, thumb_card_path FROM pets WHERE id IN (1, 2)").fetchall()
+    (new_blob, thumb), second = rows
+    assert second == (new_blob, thumb) and new_blob.endswith(".webp")
+    assert os.path.exists(os.path.join(data_dir, thumb))
+    with Image.open(os.path.join(data_dir, new_blob)) as stored:
+        assert stored.size == (400, 320)
+    assert not os.path.exists(os.path.join(data_dir, old_blob))
+
+
+def _three_pets(data_dir):
+    store = ImageStore(data_dir)
+    with sqlite3.connect(os.path.join(data_dir, "pets.db")) as conn:
+        conn.execute("INSERT INTO owner (id, name, contact_number) VALUES (1, 'Ana', '09171234567')")
+        for pet_id, color in enumerate(("saddlebrown", "white", "black"), start=1):
+            src = os.path.join(data_dir, f"upload_{pet_id}.jpg")
+            Image.new("RGB", (500, 500), color).save(src)
+            conn.execute(
+                "INSERT INTO pets (id, name, breed, birthdate, image_path, owner_id) VALUES (?, 'Pet', 'Aspin', '2020-01-01', ?, 1)",
+                (pet_id, store.put(src))
+            )
+        return [row[0] for row in conn.execute("SELECT image_path FROM pets ORDER BY id")]
+
+
+def test_reprocess_thumbnails_resumes_from_checkpoint(data_dir):
+    first = _three_pets(data_dir)[0]
+
+    # An interrupted run that committed the first image
+    checkpoint = os.path.join(data_dir, CHECKPOINT_FILE)
+    _save_checkpoint(checkpoint, _run_signature("thumbnails", IMAGE_POLICY), {first}, set())
+
+    reports = []
+    stats = reprocess_images(data_dir, mode="thumbnails", max_workers=2, batch_size=1,
+                             progress=lambda *report: reports.append(report))
+
+    assert stats["processed"] == 2 and stats["skipped"] == 1 and stats["failed"] == 0
+    assert [report[:3] for report in reports] == [(1, 2, 0), (2, 2, 0)]
+    assert not os.path.exists(checkpoint)
+    with sqlite3.connect(os.path.join(data_dir, "pets.db")) as conn:
+        thumbs = conn.execute("SELECT thumb_card_path FROM pets WHERE id > 1").fetchall()
+    assert all(os.path.exists(os.path.join(data_dir, thumb)) for (thumb,) in thumbs)
+
+
+def test_checkpoint_of_a_run_with_other_settings_is_ignored(data_dir, monkeypatch):
+    first = _three_pets(data_dir)[0]
+    checkpoint = os.path.join(data_dir, CHECKPOINT_FILE)
+    _save_checkpoint(checkpoint, _run_signature("thumbnails", IMAGE_POLICY), {first}, set())
+
+    # Thumbnail sizes changed since the checkpoint was written
+    monkeypatch.setitem(THUMBNAIL_SIZES, "card", 160)
+    stats = reprocess_images(data_dir, mode="thumbnails", max_workers=2, progress=None)
+
+    assert stats["processed"] == 3 and stats["skipped"] == 0
+    assert not os.path.exists(checkpoint)
+
+
+def test_failed_images_do_not_keep_the_checkpoint(data_dir):
+    broken = _three_pets(data_dir)[1]
+    with open(os.path.join(data_dir, broken), "wb") as f:
+        f.write(b"not an image")
+
+    stats = reprocess_images(data_dir, mode="thumbnails", max_workers=2, batch_size=1, progress=None)
+    assert stats["processed"] == 2 and stats["failed_images"] == [broken]
+    assert not os.path.exists(os.path.join(data_dir, CHECKPOINT_FILE))
+
+    # The next run tries the failed image again instead of skipping everything
+    retry = reprocess_images(data_dir, mode="thumbnails", max_workers=2, progress=None)
+    assert retry["processed"] + retry["failed"] == 3
+    assert not os.path.exists(os.path.join(data_dir, CHECKPOINT_FILE))
+
+
+def test_run_with_nothing_pending_removes_a_finished_checkpoint(data_dir):
+    checkpoint = os.path.join(data_dir, CHECKPOINT_FILE)
+    _save_checkpoint(checkpoint, _run_signature("reencode", IMAGE_POLICY), {"images/blobs/gone.jpg"}, set())
+
+    assert reprocess_images(data_dir, progress=None)["processed"] == 0
+    assert not os.path.exists(checkpoint)
+
+
+def test_unreadable_original_is_reported_without_stopping_the_run(data_dir):
+    broken = _three_pets(data_dir)[0]
+    with open(os.path.join(data_dir, broken), "wb") as f:
+        f.write(b"not an image")
+
+    stats = reprocess_images(data_dir, mode="reencode", max_workers=2, progress=None)
+
+    # The other two already match the policy and are skipped
+    assert stats["failed_images"] == [broken] and stats["failed"] == 1
+    assert stats["processed"] == 0 and stats["skipped"] == 2
+
+
+def _fail_on_white(data_dir, image_path, policy):
+    with Image.open(os.path.join(data_dir, image_path)) as image:
+        if image.getpixel((0, 0)) == (255, 255, 255):
+            raise ValueError("unsupported image")
+    return _rethumbnail_one(data_dir, image_path, policy)
+
+
+def test_worker_errors_other_than_oserror_only_fail_their_image(data_dir, monkeypatch):
+    white = _three_pets(data_dir)[1]
+    monkeypatch.setitem(WORKERS, "thumbnails", _fail_on_white)
+
+    stats = reprocess_images(data_dir, mode="thumbnails", max_workers=2, progress=None)
+
+    assert stats["processed"] == 2 and stats["failed_images"] == [white]
+    assert not os.path.exists(os.path.join(data_dir, CHECKPOINT_FILE))
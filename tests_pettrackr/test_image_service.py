@@ -0,0 +1,63 @@
+# tests_pettrackr/test_image_service.py
+import os
+
+from PIL import Image
+
+from backend.models.pet import Pet
+from backend.services.image_service import THUMBNAIL_SIZES, encode_for_storage, generate_thumbnails, thumbnail_for
+
+
+def _store_image(data_dir, name="images/brownie_1.jpg"):
+    os.makedirs(os.path.join(data_dir, "images"), exist_ok=True)
+    Image.new("RGB", (1200, 900), "saddlebrown").save(os.path.join(data_dir, name))
+    return name
+
+
+def test_generate_thumbnails_writes_every_size_next_to_original(tmp_path):
+    image_path = _store_image(str(tmp_path))
+
+    thumbnails = generate_thumbnails(image_path, str(tmp_path))
+
+    assert thumbnails == {"card": "images/brownie_1_card.jpg", "profile": "images/brownie_1_profile.jpg"}
+    for size_name, relpath in thumbnails.items():
+        with Image.open(os.path.join(str(tmp_path), relpath)) as thumb:
+            edge = THUMBNAIL_SIZES[size_name]
+            assert thumb.size == (edge, edge)
+
+
+def test_thumbnail_for_regenerates_missing_files(tmp_path):
+    image_path = _store_image(str(tmp_path))
+    pet = Pet(1, "Brownie", "Aspin", "2020-01-01", image_path, 1)
+
+    path = thumbnail_for(pet, "card", str(tmp_path))
+    assert path and os.path.exists(path)
+
+    os.remove(path)
+    assert thumbnail_for(pet, "card", str(tmp_path)) == path
+    assert os.path.exists(path)
+
+    assert thumbnail_for(Pet(2, "Rocco", "Aspin", "2020-01-01"), "card", str(tmp_path)) is None
+
+
+def test_thumbnail_for_prefers_the_stored_thumbnail_column(tmp_path):
+    image_path = _store_image(str(tmp_path))
+    _store_image(str(tmp_path), "images/custom_card.jpg")
+    pet = Pet(1, "Brownie", "Aspin", "2020-01-01", image_path, 1, thumb_card_path="images/custom_card.jpg")
+
+    assert thumbnail_for(pet, "card", str(tmp_path)) == os.path.join(str(tmp_path), "images/custom_card.jpg")
+    assert thumbnail_for(pet, "profile", str(tmp_path)).endswith("brownie_1_profile.jpg")
+
+
+def test_encode_for_storage_applies_policy(tmp_path):
+    src = str(tmp_path / "big.jpg")
+    exif = Image.Exif()
+    exif[0x0112] = 6  # orientation: rotate 90° clockwise when displayed
+    Image.new("RGB", (3000, 2000), "saddlebrown").save(src, exif=exif)
+
+    dest = str(tmp_path / "stored.webp")
+    encode_for_storage(src, dest, {"max_dimension": 600, "format": "WEBP", "quality": 80})
+
+    with Image.open(dest) as stored:
+        assert stored.format == "WEBP"
+        assert stored.size == (400, 600)  # orientation baked in, longest edge capped
+        assert not stored.getexif()
@@ -0,0 +1,80 @@
+# tests_pettrackr/test_image_store.py
+import os
+import sqlite3
+
+from PIL import Image
+
+from backend.services.image_store import ImageStore
+
+
+def _photo(path, color="saddlebrown"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    Image.new("RGB", (320, 240), color).save(path)
+    return path
+
+
+def test_identical_photos_share_one_blob(data_dir, tmp_path):
+    store = ImageStore(data_dir)
+    first = store.put(_photo(str(tmp_path / "upload" / "a.JPG")))
+    second = store.put(_photo(str(tmp_path / "upload" / "b.jpg")))
+    other = store.put(_photo(str(tmp_path / "upload" / "c.jpg"), "white"))
+
+    assert first == second != other
+    assert first.startswith("images/blobs/") and first.endswith(".jpg")
+    blobs = [name for _, _, files in os.walk(os.path.join(data_dir, "images", "blobs")) for name in files]
+    assert len(blobs) == 2
+
+
+def test_legacy_images_are_migrated_and_released(data_dir):
+    _photo(os.path.join(data_dir, "images", "brownie_1.jpg"))
+    _photo(os.path.join(data_dir, "images", "rocco_2.jpg"))  # same pixels, same bytes
+    with sqlite3.connect(os.path.join(data_dir, "pets.db")) as conn:
+        conn.execute("INSERT INTO owner (id, name, contact_number) VALUES (1, 'Ana', '09171234567')")
+        conn.executemany(
+            "INSERT INTO pets (id, name, breed, birthdate, image_path, owner_id) VALUES (?, ?, 'Aspin', '2020-01-01', ?, 1)",
+            [(1, "Brownie", "images/brownie_1.jpg"), (2, "Rocco", "images/rocco_2.jpg"), (3, "Dalmi", "images/gone_3.jpg")]
+        )
+    store = ImageStore(data_dir)
+
+    assert store.migrate_legacy_images(batch_size=1) == 2
+    assert store.migrate_legacy_images() == 0
+
+    with sqlite3.connect(os.path.join(data_dir, "pets.db")) as conn:
+        rows = conn.execute("SELECT image_path, thumb_card_path FROM pets ORDER BY id").fetchall()
+        (blob, thumb), second, missing = rows
+        assert second == (blob, thumb) and store.is_blob(blob)
+        assert missing == ("images/gone_3.jpg", None)
+        assert not os.path.exists(os.path.join(data_dir, "images", "brownie_1.jpg"))
+        assert os.path.exists(os.path.join(data_dir, thumb))
+
+        assert store.release(blob) is False  # still referenced by two pets
+        conn.execute("UPDATE pets SET image_path = NULL")
+    assert store.release(blob) is True
+    assert not os.path.exists(os.path.join(data_dir, blob))
+
+
+def test_staged_upload_is_moved_not_copied(data_dir, tmp_path):
+    store = ImageStore(data_dir)
+    original = _photo(str(tmp_path / "upload" / "a.jpg"))
+    kept = store.put(original)
+    assert os.path.exists(original)  # unstaged sources are encoded into staging, never moved
+
+    staged = store.stage(original)
+    relpath = store.plan(staged)
+    assert store.put(staged, relpath) == relpath == kept
+    assert not os.path.exists(staged)  # duplicate of an existing blob: dropped
+
+    staged = store.stage(_photo(str(tmp_path / "upload" / "b.jpg"), "white"))
+    relpath = store.put(staged)
+    assert not os.path.exists(staged) and os.path.exists(os.path.join(data_dir, relpath))
+    assert os.listdir(store.staging_dir) == []
+
+
+def test_cleanup_staging_removes_only_stale_files(data_dir):
+    store = ImageStore(data_dir)
+    stale = _photo(store.new_staging_path())
+    fresh = _photo(store.new_staging_path())
+    os.utime(stale, (0, 0))
+
+    assert store.cleanup_staging(max_age_seconds=3600) == 1
+    assert not os.path.exists(stale) and os.path.exists(fresh)
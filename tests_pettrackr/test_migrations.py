@@ -0,0 +1,34 @@
+# tests_pettrackr/test_migrations.py
+import os
+import sqlite3
+
+from backend.data.migrations import MigrationRunner
+from backend.data.vaccinations_db import VaccinationsDatabaseInitializer
+
+
+def test_initializer_applies_index_migration_once(data_dir):
+    db_path = os.path.join(data_dir, "vaccinations.db")
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 1
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM vaccinations WHERE pet_id = ? ORDER BY date_administered DESC", (1,)
+        ).fetchall()
+    assert "idx_vaccinations_pet_administered" in " ".join(str(step) for step in plan)
+
+    runner = MigrationRunner(db_path, VaccinationsDatabaseInitializer.MIGRATIONS)
+    assert runner.apply() == 0
+
+
+def test_failed_migration_keeps_previous_version(tmp_path):
+    db_path = str(tmp_path / "broken.db")
+    runner = MigrationRunner(db_path, [
+        (1, ["CREATE TABLE t (id INTEGER PRIMARY KEY)"]),
+        (2, ["CREATE INDEX idx_t_missing ON t(missing_column)"]),
+    ])
+    try:
+        runner.apply()
+    except sqlite3.Error:
+        pass
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 1
@@ -0,0 +1,84 @@
+# tests_pettrackr/test_model_cache.py
+import os
+
+from backend.controllers.pet_controller import PetController
+from backend.database_handlers.vaccinations_db_handler import VaccinationDB
+from backend.models.pet import Pet, Owner
+from backend.models.vaccination import Vaccination
+from backend.services.model_cache import ModelCache, model_cache
+
+
+def test_lru_eviction_and_tag_invalidation():
+    cache = ModelCache(max_entries=2)
+    cache.put("a", 1, tags=["x"])
+    cache.put("b", 2, tags=["y"])
+    assert cache.get_or_load("a", lambda: None) == 1
+    cache.put("c", 3)  # evicts "b", the least recently used
+
+    assert cache.get_or_load("b", lambda: 20, tags=["y"]) == 20  # evicts "a"
+    assert cache.invalidate("x") == 0
+    assert cache.invalidate("y") == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["evictions"] == 2
+
+
+def test_pet_controller_reads_hit_cache_until_a_write(data_dir):
+    controller = PetController(db_path=os.path.join(data_dir, "pets.db"))
+    pet_id = controller.add_pet_with_owner(
+        Pet(0, "Brownie", "Aspin", "2020-01-01"),
+        Owner(0, "Ana", "09171234567", "Cebu")
+    )
+    model_cache.reset_stats()
+
+    pet, owner = controller.get_pet_by_id(pet_id)
+    pet.name, owner.address = "Edited", "Elsewhere"  # callers get copies, the cache is unaffected
+    cached_pet, cached_owner = controller.get_pet_by_id(pet_id)
+    assert (cached_pet.name, cached_owner.address) == ("Brownie", "Cebu")
+    controller.get_pets_with_owners()[0][0].name = "Edited"
+    assert [p.name for p in controller.get_pets_with_owners()[0]] == ["Brownie"]
+    assert model_cache.stats()["hits"] == 2
+
+    # Re-adding the owner with a new address refreshes the cached pet/owner pair
+    controller.add_pet_with_owner(
+        Pet(0, "Rocco", "Aspin", "2021-01-01"),
+        Owner(0, "Ana", "09171234567", "Manila")
+    )
+    assert controller.get_pet_by_id(pet_id)[1].address == "Manila"
+    assert len(controller.get_pets_with_owners()[0]) == 2
+
+    # Record writes invalidate the filtered lists built on that table
+    assert controller.get_pets_with_vacc_or_vet_records() == ([], [])
+    VaccinationDB(os.path.join(data_dir, "vaccinations.db")).insert(
+        Vaccination(pet_id, "Rabies", "2024-01-01")
+    )
+    assert [p.id for p in controller.get_pets_with_vacc_or_vet_records()[0]] == [pet_id]
+
+
+def test_load_overlapping_an_invalidation_is_not_cached():
+    cache = ModelCache()
+
+    def stale_loader():
+        # A writer commits and invalidates while this read is in progress
+        cache.invalidate("pets")
+        return ["old rows"]
+
+    assert cache.get_or_load("pets", stale_loader, tags=["pets"]) == ["old rows"]
+    assert cache.get_or_load("pets", lambda: ["new rows"], tags=["pets"]) == ["new rows"]
+    assert cache.get_or_load("pets", lambda: ["unused"], tags=["pets"]) == ["new rows"]
+
+
+def test_deferred_invalidation_runs_after_the_block():
+    cache = ModelCache()
+    seen = []
+    cache.add_listener(seen.append)
+    cache.put("pets", ["old rows"], tags=["pets"])
+
+    with cache.deferred_invalidation():
+        with cache.deferred_invalidation():
+            assert cache.invalidate("pets") == 0
+        assert cache.get_or_load("pets", lambda: None) == ["old rows"]
+        assert seen == []
+
+    assert seen == [("pets",)]
+    assert cache.get_or_load("pets", lambda: ["new rows"]) == ["new rows"]
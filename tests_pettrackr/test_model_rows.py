@@ -0,0 +1,39 @@
+# tests_pettrackr/test_model_rows.py
+import pytest
+
+from backend.models.pet import Pet, Owner
+from backend.models.vaccination import Vaccination
+from backend.models.vet_visit import VetVisit
+from backend.models.feeding_log import FeedingLog
+from backend.models.grooming_log import GroomingLog
+
+
+@pytest.mark.parametrize("model, row", [
+    (Pet, (1, "Brownie", "Aspin", "2020-01-01", "images/brownie_1.png", 2, "images/brownie_1_card.png", None)),
+    (Owner, (2, "Ana", "09171234567", "Cebu")),
+    (Vaccination, (1, "Rabies", "2024-01-01", "2024-06-01", 999, "")),
+    (VetVisit, (1, "2024-02-01", "Checkup", "", 500.0)),
+    (FeedingLog, (1, "2024-03-01", 2, 1, 0, 0, "")),
+    (GroomingLog, (3, 1, "2024-06-01", "full", 800.0, "Ava", "")),
+])
+def test_from_row_keeps_stored_values_and_uses_slots(model, row):
+    instance = model.from_row(*row)
+
+    assert tuple(getattr(instance, name) for name in model.__slots__) == row
+    assert not hasattr(instance, "__dict__")
+
+
+def test_from_row_skips_recomputing_vaccination_defaults():
+    stored = Vaccination.from_row(1, "Rabies", "2024-01-01", "2024-06-01", 999, "")
+    fresh = Vaccination(1, "Rabies", "2024-01-01")
+
+    assert (stored.next_due, stored.price) == ("2024-06-01", 999)
+    assert (fresh.next_due, fresh.price) == ("2024-12-31", 400)
+
+
+def test_from_row_fills_null_vaccination_columns_like_init():
+    stored = Vaccination.from_row(1, "Rabies", "2024-01-01", None, None, "")
+
+    assert (stored.next_due, stored.price) == ("2024-12-31", 400)
+    assert stored.to_dict()["is_due"] is True
+    assert "Rabies" in str(stored)
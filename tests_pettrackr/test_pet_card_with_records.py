@@ -10,11 +10,10 @@ def main():
     # Fetch a pet and owner for demo
     pet_ctrl = PetController()
     pets, owners = pet_ctrl.get_pets_with_vacc_or_vet_records()
-    image_store = []
 
     # Show the first pet with records
     if pets:
-        card = PetCardWithRecords(root, pets[0], image_store, owner=owners[0])
+        card = PetCardWithRecords(root, pets[0], owner=owners[0])
         card.pack(padx=20, pady=20)
     else:
         ctk.CTkLabel(root, text="No pets with records found.").pack(padx=20, pady=20)
@@ -0,0 +1,39 @@
+# tests_pettrackr/test_pet_page_source.py
+import os
+import sqlite3
+
+from backend.controllers.pet_controller import PetController
+from frontend.services.pet_page_source import PetPageSource
+
+
+class CountingController(PetController):
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        self.page_reads = 0
+
+    def get_pets_page(self, *args, **kwargs):
+        self.page_reads += 1
+        return super().get_pets_page(*args, **kwargs)
+
+
+def test_source_reads_pages_on_demand(data_dir):
+    with sqlite3.connect(os.path.join(data_dir, "pets.db")) as conn:
+        conn.execute("INSERT INTO owner (id, name, contact_number) VALUES (1, 'Ana', '09171234567')")
+        conn.executemany(
+            "INSERT INTO pets (id, name, breed, birthdate, owner_id) VALUES (?, ?, 'Aspin', '2020-01-01', 1)",
+            [(pet_id, f"Pet {pet_id}") for pet_id in range(1, 11)]
+        )
+    controller = CountingController(os.path.join(data_dir, "pets.db"))
+    source = PetPageSource(controller, page_size=3, max_pages=2)
+
+    assert len(source) == controller.count_pets() == 10
+    assert controller.page_reads == 0
+
+    pet, owner = source.get(7)  # walks pages 0-2 to reach the cursor of page 2
+    assert pet.id == 8 and owner.name == "Ana"
+    assert controller.page_reads == 3
+
+    assert source.get(8)[0].id == 9  # same page, no read
+    assert source.get(9)[0].id == 10 and source.get(10) is None
+    assert source.get(0)[0].id == 1  # evicted, re-read straight from its cursor
+    assert controller.page_reads == 5
@@ -0,0 +1,44 @@
+# tests_pettrackr/test_pet_pagination.py
+import os
+import sqlite3
+
+import pytest
+
+from backend.controllers.pet_controller import PetController
+
+
+def _seed(data_dir, names):
+    with sqlite3.connect(os.path.join(data_dir, "pets.db")) as conn:
+        conn.execute("INSERT INTO owner (id, name, contact_number) VALUES (1, 'Ana', '09171234567')")
+        conn.executemany(
+            "INSERT INTO pets (name, breed, birthdate, owner_id) VALUES (?, 'Aspin', '2020-01-01', 1)",
+            [(name,) for name in names]
+        )
+
+
+@pytest.mark.parametrize("order_by", ["id", "name"])
+def test_pages_cover_every_pet_once(data_dir, order_by):
+    names = ["Rocco", "Brownie", "Dalmi", "Brownie", "Azul", "Choco", "Mochi"]
+    _seed(data_dir, names)
+    controller = PetController(db_path=os.path.join(data_dir, "pets.db"))
+
+    pages = list(controller.iter_pet_pages(page_size=3, order_by=order_by))
+    pets = [pet for page, _ in pages for pet in page]
+
+    assert [len(page) for page, _ in pages] == [3, 3, 1]
+    assert len({pet.id for pet in pets}) == len(names)
+    key = (lambda pet: pet.id) if order_by == "id" else (lambda pet: (pet.name, pet.id))
+    assert pets == sorted(pets, key=key)
+    assert all(owner.name == "Ana" for _, owners in pages for owner in owners)
+
+
+def test_last_full_page_and_bad_sort_key(data_dir):
+    _seed(data_dir, ["Rocco", "Brownie"])
+    controller = PetController(db_path=os.path.join(data_dir, "pets.db"))
+
+    pets, _, cursor = controller.get_pets_page(page_size=2)
+    assert len(pets) == 2
+    assert controller.get_pets_page(page_size=2, after=cursor) == ([], [], None)
+
+    with pytest.raises(ValueError):
+        controller.get_pets_page(order_by="breed")
@@ -0,0 +1,36 @@
+# tests_pettrackr/test_pet_query_service.py
+import os
+import sqlite3
+
+from backend.services.pet_query_service import PetQueryService
+
+
+def _seed(data_dir):
+    with sqlite3.connect(os.path.join(data_dir, "pets.db")) as conn:
+        conn.execute("INSERT INTO owner (id, name, contact_number) VALUES (1, 'Ana', '09171234567')")
+        conn.executemany(
+            "INSERT INTO pets (id, name, breed, birthdate, owner_id) VALUES (?, ?, 'Aspin', '2020-01-01', 1)",
+            [(1, "Brownie"), (2, "Rocco"), (3, "Dalmi")]
+        )
+    with sqlite3.connect(os.path.join(data_dir, "vaccinations.db")) as conn:
+        conn.execute("INSERT INTO vaccinations (pet_id, vaccine_name, date_administered) VALUES (1, 'Rabies', '2024-01-01')")
+    with sqlite3.connect(os.path.join(data_dir, "vet_visits.db")) as conn:
+        conn.execute("INSERT INTO vet_visits (pet_id, visit_date, reason, cost) VALUES (1, '2024-02-01', 'Checkup', 500)")
+        conn.execute("INSERT INTO vet_visits (pet_id, visit_date, reason, cost) VALUES (2, '2024-02-01', 'Checkup', 500)")
+    with sqlite3.connect(os.path.join(data_dir, "feeding_logs.db")) as conn:
+        conn.execute("INSERT INTO daycare_enrollments (pet_id, start_date, num_days) VALUES (3, '2024-03-01', 2)")
+    with sqlite3.connect(os.path.join(data_dir, "grooming_logs.db")) as conn:
+        conn.execute("INSERT INTO grooming_logs (pet_id, groom_type, price, groomer_name) VALUES (2, 'basic', 500, 'Ava')")
+
+
+def test_record_filters_run_across_attached_databases(data_dir):
+    _seed(data_dir)
+    service = PetQueryService(data_dir=data_dir)
+
+    pets, owners = service.get_pets_with_vacc_or_vet_records()
+    assert [p.id for p in pets] == [1, 2]
+    assert all(o.name == "Ana" for o in owners)
+
+    assert [p.id for p in service.get_pets_with_vacc_and_vet_records()[0]] == [1]
+    assert [p.id for p in service.get_pets_with_feeding_logs()[0]] == [3]
+    assert [p.id for p in service.get_pets_with_grooming_logs()[0]] == [2]
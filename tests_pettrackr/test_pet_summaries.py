@@ -0,0 +1,53 @@
+# tests_pettrackr/test_pet_summaries.py
+import os
+import sqlite3
+
+from backend.controllers.pet_controller import PetController
+from backend.services.daycare_prices import compute_total_fee
+
+
+def _seed(data_dir):
+    with sqlite3.connect(os.path.join(data_dir, "vaccinations.db")) as conn:
+        conn.executemany(
+            "INSERT INTO vaccinations (pet_id, vaccine_name, date_administered, next_due, price) VALUES (?, ?, ?, ?, ?)",
+            [(1, "Rabies", "2024-01-01", "2025-01-01", 400), (1, "Parvo", "2024-03-01", "2025-03-01", 350)]
+        )
+    with sqlite3.connect(os.path.join(data_dir, "vet_visits.db")) as conn:
+        conn.execute("INSERT INTO vet_visits (pet_id, visit_date, reason, cost) VALUES (2, '2024-02-01', 'Checkup', 500)")
+    with sqlite3.connect(os.path.join(data_dir, "feeding_logs.db")) as conn:
+        conn.executemany(
+            "INSERT INTO daycare_enrollments (pet_id, start_date, num_days, feed_once, feed_twice, feed_thrice) "
+            "VALUES (1, ?, ?, ?, ?, ?)",
+            [("2024-03-01", 2, 1, 0, 0), ("2024-04-01", 3, 0, 0, 1), ("2024-05-01", 1, 0, 0, 0)]
+        )
+    with sqlite3.connect(os.path.join(data_dir, "grooming_logs.db")) as conn:
+        conn.execute("INSERT INTO grooming_logs (pet_id, groom_date, groom_type, price, groomer_name) "
+                     "VALUES (2, '2024-06-01', 'full', 800, 'Ava')")
+
+
+def test_summaries_aggregate_every_record_table(data_dir):
+    _seed(data_dir)
+    controller = PetController(db_path=os.path.join(data_dir, "pets.db"))
+
+    summaries = controller.get_pet_summaries([1, 2, 3])
+    first = summaries[1]
+    assert (first.vaccination_count, first.last_vaccination, first.vaccination_total) == (2, "2024-03-01", 750)
+    assert (first.daycare_count, first.daycare_days, first.last_daycare) == (3, 6, "2024-05-01")
+    assert first.daycare_total == (compute_total_fee(2, feed_once=True)
+                                   + compute_total_fee(3, feed_thrice=True)
+                                   + compute_total_fee(1))
+    assert (summaries[2].vet_visit_count, summaries[2].grooming_total) == (1, 800)
+    assert summaries[3].total_spent == 0
+
+    totals = controller.get_record_totals()
+    assert totals.total_spent == sum(summary.total_spent for summary in summaries.values())
+
+
+def test_summaries_accept_a_one_shot_iterable(data_dir):
+    _seed(data_dir)
+    controller = PetController(db_path=os.path.join(data_dir, "pets.db"))
+
+    summaries = controller.get_pet_summaries(pet_id for pet_id in (1, 2))
+    # Every record table sees the ids, not just the first one
+    assert (summaries[1].vaccination_count, summaries[1].daycare_count) == (2, 3)
+    assert (summaries[2].vet_visit_count, summaries[2].grooming_count) == (1, 1)
@@ -0,0 +1,114 @@
+# tests_pettrackr/test_photo_ingest.py
+import os
+import sqlite3
+
+import pytest
+
+from PIL import Image
+
+from backend.services.photo_ingest import ingest_photos, match_photos
+
+PETS = [(1, "Brownie"), (2, "Rocco"), (3, "Max"), (4, "max")]
+
+
+def _photos(folder, *names):
+    os.makedirs(folder, exist_ok=True)
+    for name in names:
+        Image.new("RGB", (800, 600), "saddlebrown").save(os.path.join(folder, name))
+
+
+def test_match_photos_by_naming_convention(tmp_path):
+    folder = str(tmp_path / "inbox")
+    _photos(folder, "1.jpg", "rocco_2.JPG", "Max.jpg", "pet_9.jpg", "unknown.png")
+    open(os.path.join(folder, "notes.txt"), "w").close()
+
+    matches, unmatched = match_photos(folder, PETS)
+
+    assert {pet_id: os.path.basename(path) for pet_id, path in matches.items()} == {1: "1.jpg", 2: "rocco_2.JPG"}
+    assert unmatched == ["Max.jpg", "pet_9.jpg", "unknown.png"]  # "max" is ambiguous, pet 9 does not exist
+
+
+def test_camera_file_names_are_not_taken_for_pet_ids(tmp_path):
+    folder = str(tmp_path / "inbox")
+    _photos(folder, "DSC-0001.jpg", "IMG_0002.jpg", "rocco_1.jpg", "Brownie-1.jpg")
+
+    matches, unmatched = match_photos(folder, PETS)
+
+    # rocco_1 names pet 2 but carries pet 1's id, so it is left alone too
+    assert {pet_id: os.path.basename(path) for pet_id, path in matches.items()} == {1: "Brownie-1.jpg"}
+    assert unmatched == ["DSC-0001.jpg", "IMG_0002.jpg", "rocco_1.jpg"]
+
+
+def test_match_photos_by_csv_mapping(tmp_path):
+    folder = str(tmp_path / "inbox")
+    _photos(folder, "IMG_0001.jpg", "IMG_0002.jpg")
+    mapping = tmp_path / "mapping.csv"
+    mapping.write_text("filename,pet_id\nIMG_0001.jpg,3\n", encoding="utf-8")
+
+    matches, unmatched = match_photos(folder, PETS, str(mapping))
+
+    assert list(matches) == [3] and unmatched == ["IMG_0002.jpg"]
+
+
+def test_csv_mapping_from_a_spreadsheet_export(tmp_path):
+    folder = str(tmp_path / "inbox")
+    _photos(folder, "IMG_0001.jpg", "IMG_0002.jpg")
+    mapping = tmp_path / "mapping.csv"
+    # Byte order mark, capitalised headers and an incomplete row
+    mapping.write_text("Filename,Pet_ID\nIMG_0001.jpg,3\nIMG_0002.jpg\n", encoding="utf-8-sig")
+
+    matches, unmatched = match_photos(folder, PETS, str(mapping))
+
+    assert list(matches) == [3] and unmatched == ["IMG_0002.jpg"]
+
+
+def test_csv_mapping_without_the_required_columns_is_rejected(tmp_path):
+    folder = str(tmp_path / "inbox")
+    _photos(folder, "IMG_0001.jpg")
+    mapping = tmp_path / "mapping.csv"
+    mapping.write_text("file,pet\nIMG_0001.jpg,3\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="filename and pet_id"):
+        match_photos(folder, PETS, str(mapping))
+
+
+def test_ingest_photos_attaches_square_photos(data_dir, tmp_path):
+    with sqlite3.connect(os.path.join(data_dir, "pets.db")) as conn:
+        conn.execute("INSERT INTO owner (id, name, contact_number) VALUES (1, 'Ana', '09171234567')")
+        conn.executemany(
+            "INSERT INTO pets (id, name, breed, birthdate, owner_id) VALUES (?, ?, 'Aspin', '2020-01-01', 1)",
+            PETS[:2]
+        )
+    folder = str(tmp_path / "inbox")
+    _photos(folder, "brownie.jpg", "rocco_2.jpg")
+
+    result = ingest_photos(folder, db_path=os.path.join(data_dir, "pets.db"), max_workers=2)
+
+    assert result == {"attached": 2, "unmatched": [], "failed": []}
+    with sqlite3.connect(os.path.join(data_dir, "pets.db")) as conn:
+        rows = conn.execute("SELECT image_path, thumb_card_path FROM pets ORDER BY id").fetchall()
+    for image_path, thumb in rows:
+        assert os.path.exists(os.path.join(data_dir, thumb))
+        with Image.open(os.path.join(data_dir, image_path)) as stored:
+            assert stored.size == (600, 600)
+    assert os.listdir(os.path.join(data_dir, "temp")) == []
+
+
+def test_ingest_photos_skips_photos_that_fail_to_decode(data_dir, tmp_path, monkeypatch):
+    with sqlite3.connect(os.path.join(data_dir, "pets.db")) as conn:
+        conn.execute("INSERT INTO owner (id, name, contact_number) VALUES (1, 'Ana', '09171234567')")
+        conn.executemany(
+            "INSERT INTO pets (id, name, breed, birthdate, owner_id) VALUES (?, ?, 'Aspin', '2020-01-01', 1)",
+            PETS[:2]
+        )
+    folder = str(tmp_path / "inbox")
+    _photos(folder, "brownie.jpg")
+    os.makedirs(folder, exist_ok=True)
+    Image.new("RGB", (200, 200), "white").save(os.path.join(folder, "rocco_2.jpg"))
+    # brownie.jpg (800x600) now counts as a decompression bomb: not an OSError
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 100_000)
+
+    result = ingest_photos(folder, db_path=os.path.join(data_dir, "pets.db"), max_workers=2)
+
+    assert result == {"attached": 1, "unmatched": [], "failed": ["brownie.jpg"]}
+    assert os.listdir(os.path.join(data_dir, "temp")) == []
@@ -0,0 +1,99 @@
+# tests_pettrackr/test_profile_prefetch.py
+import threading
+import time
+
+from frontend.services.profile_prefetch import ProfilePrefetcher
+from frontend.services.task_runner import TaskRunner
+from conftest import FakeWidget
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _prefetcher(clock, loads, release=None, started=None, max_workers=2, click_wait=0.2):
+    def loader(pet_id):
+        on_main_thread = threading.current_thread() is threading.main_thread()
+        if started is not None and not on_main_thread:
+            started.set()
+        if release is not None and not on_main_thread:
+            release.wait(5)
+        loads.append((pet_id, on_main_thread))
+        return {"vet_visits": [f"visit of {pet_id}"], "grooming_logs": []}
+    return ProfilePrefetcher(loader, ttl=30, runner=TaskRunner(max_workers=max_workers), clock=clock,
+                             click_wait=click_wait)
+
+
+def test_hover_prefetch_serves_the_click_without_loading_again():
+    clock, loads, root = Clock(), [], FakeWidget()
+    prefetcher = _prefetcher(clock, loads)
+
+    prefetcher.prefetch(7, widget=root)
+    prefetcher.prefetch(7, widget=root)  # already loading
+    root.run_pending()
+
+    assert prefetcher.get(7) == {"vet_visits": ["visit of 7"], "grooming_logs": []}
+    assert loads == [(7, False)]  # loaded once, on a worker
+
+    clock.now = 31  # past the TTL
+    prefetcher.get(7)
+    assert loads == [(7, False), (7, True)]
+
+
+def test_click_during_running_prefetch_waits_for_it_instead_of_querying_twice():
+    clock, loads, root = Clock(), [], FakeWidget()
+    release, started = threading.Event(), threading.Event()
+    prefetcher = _prefetcher(clock, loads, release, started)
+
+    prefetcher.prefetch(3, widget=root)
+    assert started.wait(5)
+    threading.Timer(0.05, release.set).start()
+    assert prefetcher.get(3)["vet_visits"] == ["visit of 3"]
+    root.run_pending()
+    assert loads == [(3, False)]
+
+
+def test_click_never_waits_on_a_queued_or_slow_prefetch():
+    clock, loads, root = Clock(), [], FakeWidget()
+    release, started = threading.Event(), threading.Event()
+    prefetcher = _prefetcher(clock, loads, release, started, max_workers=1, click_wait=0.05)
+
+    prefetcher.prefetch(1, widget=root)  # occupies the only worker
+    assert started.wait(5)
+    prefetcher.prefetch(2, widget=root)  # queued behind it
+
+    began = time.perf_counter()
+    assert prefetcher.get(2)["vet_visits"] == ["visit of 2"]  # queued: cancelled, loaded directly
+    assert prefetcher.get(1)["vet_visits"] == ["visit of 1"]  # still running after click_wait
+    assert time.perf_counter() - began < 1
+
+    release.set()
+    root.run_pending()
+    # The queued prefetch never ran; the slow one finished but was not needed
+    assert sorted(loads) == [(1, False), (1, True), (2, True)]
+
+
+def test_record_changes_drop_cached_and_in_flight_bundles():
+    clock, loads, root = Clock(), [], FakeWidget()
+    release = threading.Event()
+    prefetcher = _prefetcher(clock, loads, release)
+    release.set()
+    prefetcher.get(1)
+
+    prefetcher.on_model_invalidated((("scope", "owners"),))
+    assert prefetcher.get(1) and len(loads) == 1  # unrelated data: still cached
+
+    release.clear()
+    prefetcher.prefetch(2, widget=root)
+    prefetcher.on_model_invalidated((("scope", "vaccinations"),))
+    release.set()
+    root.run_pending()
+
+    prefetcher.get(1)
+    prefetcher.get(2)
+    # Both reloaded: 1 was dropped, and 2's prefetch began before the change
+    assert [pet_id for pet_id, _ in loads] == [1, 2, 1, 2]
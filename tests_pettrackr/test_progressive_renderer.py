@@ -0,0 +1,70 @@
+# tests_pettrackr/test_progressive_renderer.py
+import time
+
+from frontend.services.progressive_renderer import ProgressiveRenderer
+from frontend.services.task_runner import TaskRunner
+from conftest import FakeWidget
+
+
+def test_first_batch_is_built_immediately_and_the_rest_on_later_ticks():
+    widget = FakeWidget()
+    built, completed = [], []
+
+    renderer = ProgressiveRenderer(widget, list("abcdefghij"), lambda item, index: built.append((index, item)),
+                                   initial_batch=3, on_complete=lambda: completed.append(True)).start()
+
+    assert built == [(0, "a"), (1, "b"), (2, "c")]
+    assert not renderer.done and len(widget.callbacks) == 1
+
+    widget.run_pending()
+    assert [item for _, item in built] == list("abcdefghij")
+    assert [index for index, _ in built] == list(range(10))
+    assert renderer.done and completed == [True]
+
+
+def test_batch_size_follows_the_time_budget():
+    cheap, slow = FakeWidget(), FakeWidget()
+
+    fast = ProgressiveRenderer(cheap, range(200), lambda item, index: None,
+                               budget_ms=10, initial_batch=2, max_batch=50).start()
+    cheap.run_pending()
+    # Building costs next to nothing, so batches grow to the cap
+    assert fast.batch_sizes[0] == 2 and max(fast.batch_sizes) == 50
+
+    heavy = ProgressiveRenderer(slow, range(6), lambda item, index: time.sleep(0.015),
+                                budget_ms=10, initial_batch=2).start()
+    slow.run_pending()
+    # Each item overruns the budget on its own, so later ticks build one at a time
+    assert heavy.batch_sizes == [2, 1, 1, 1, 1]
+
+
+def test_rendering_stops_when_the_widget_is_destroyed_or_cancelled():
+    widget = FakeWidget()
+    built = []
+    ProgressiveRenderer(widget, range(10), lambda item, index: built.append(item), initial_batch=2).start()
+    widget.exists = False
+    widget.run_pending()
+    assert built == [0, 1]
+
+    other = FakeWidget()
+    renderer = ProgressiveRenderer(other, range(10), lambda item, index: built.append(item), initial_batch=2).start()
+    renderer.cancel()
+    other.run_pending()
+    assert built == [0, 1, 0, 1]
+
+
+def test_leaving_the_view_cancels_its_renderer_through_the_task_group():
+    runner, view = TaskRunner(max_workers=1), FakeWidget()
+    built = []
+
+    ProgressiveRenderer(view, range(10), lambda item, index: built.append(item),
+                        initial_batch=2, group=view, runner=runner).start()
+    assert runner.cancel_group(view) == 1  # what show_frame does when navigating away
+    view.run_pending()
+    assert built == [0, 1]
+
+    finished = ProgressiveRenderer(view, range(3), lambda item, index: None,
+                                   initial_batch=2, group=view, runner=runner).start()
+    view.run_pending()
+    assert finished.done and runner.cancel_group(view) == 0  # a finished render leaves nothing to cancel
+    runner.shutdown()
@@ -0,0 +1,59 @@
+# tests_pettrackr/test_task_runner.py
+import threading
+
+from frontend.services.task_runner import TaskRunner
+from conftest import FakeWidget
+
+
+def test_results_are_delivered_on_the_pump_thread():
+    runner = TaskRunner(max_workers=2)
+    root = FakeWidget()
+    delivered = []
+
+    runner.submit(lambda: threading.current_thread().name, lambda name: delivered.append(
+        (name, threading.current_thread() is threading.main_thread())), widget=root)
+    root.run_pending()
+    runner.shutdown()
+
+    assert len(delivered) == 1
+    worker_name, on_main_thread = delivered[0]
+    assert worker_name.startswith("task-runner")
+    assert on_main_thread
+
+
+def test_cancel_group_drops_results_of_a_view_left_while_loading():
+    runner = TaskRunner(max_workers=1)
+    root, view = FakeWidget(), FakeWidget()
+    release = threading.Event()
+    delivered, ran = [], []
+
+    runner.submit(lambda: release.wait(5), lambda _: delivered.append("slow"), widget=root, group=view)
+    runner.submit(lambda: ran.append("queued"), lambda _: delivered.append("queued"), widget=root, group=view)
+    runner.submit(lambda: "other", delivered.append, widget=root, group="other view")
+
+    assert runner.cancel_group(view) == 2
+    release.set()
+    root.run_pending()
+    runner.shutdown()
+
+    assert delivered == ["other"]
+    assert ran == []  # cancelled before a worker picked it up
+    assert runner.cancel_group(view) == 0
+
+
+def test_errors_go_to_on_error_and_dead_widgets_are_skipped():
+    runner = TaskRunner(max_workers=2)
+    root, gone = FakeWidget(), FakeWidget()
+    gone.exists = False
+    errors, delivered = [], []
+
+    def fail():
+        raise ValueError("database is locked")
+
+    runner.submit(fail, delivered.append, widget=root, on_error=errors.append)
+    runner.submit(lambda: "late", delivered.append, widget=gone)
+    root.run_pending()
+    runner.shutdown()
+
+    assert [str(e) for e in errors] == ["database is locked"]
+    assert delivered == []
@@ -0,0 +1,63 @@
+# tests_pettrackr/test_view_cache.py
+from backend.services.model_cache import ModelCache
+from frontend.services.view_cache import ViewCache
+
+
+class FakeFrame:
+    def __init__(self, children=0):
+        self.children = [FakeFrame() for _ in range(children)]
+        self.packed = False
+        self.destroyed = False
+
+    def winfo_children(self):
+        return self.children
+
+    def pack(self, **kwargs):
+        self.packed = True
+
+    def pack_forget(self):
+        self.packed = False
+
+    def destroy(self):
+        self.destroyed = True
+
+
+def _builder(builds, children=0):
+    def build():
+        frame = FakeFrame(children)
+        builds.append(frame)
+        return frame
+    return build
+
+
+def test_views_are_reused_until_their_data_changes():
+    cache, builds = ViewCache(), []
+    models = ModelCache()
+    models.add_listener(cache.on_model_invalidated)
+
+    pets = cache.show("view_pets", _builder(builds), ("pets",))
+    feeding = cache.show("view_feeding_logs", _builder(builds), ("feeding_logs",))
+    assert not pets.packed and feeding.packed and not pets.destroyed
+
+    assert cache.show("view_pets", _builder(builds), ("pets",)) is pets
+    assert len(builds) == 2
+
+    models.invalidate(("scope", "feeding_logs"))
+    assert cache.show("view_feeding_logs", _builder(builds), ("feeding_logs",)) is not feeding
+    assert feeding.destroyed and len(builds) == 3
+
+
+def test_uncached_views_are_destroyed_and_lru_views_evicted():
+    cache, builds = ViewCache(max_views=2, max_widgets=100), []
+
+    form = cache.show(None, _builder(builds))
+    first = cache.show("a", _builder(builds))
+    assert form.destroyed
+
+    cache.show("b", _builder(builds))
+    cache.show("a", _builder(builds))
+    cache.show("c", _builder(builds))  # over max_views: "b" is least recently shown
+    assert "b" not in cache and "a" in cache and not first.destroyed
+
+    cache.show("big", _builder(builds, children=99))  # widget budget evicts everything else
+    assert "a" not in cache and "c" not in cache and "big" in cache